@@ -0,0 +1,63 @@
+from time import perf_counter
+
+import numpy as np
+
+from src.core.benchmark.base_benchmark import BaseBenchmark, fitness_value
+from src.domain.array_cargo_space import ArrayCargoSpace
+
+
+class ArrayBenchmarkC(BaseBenchmark):
+    """ Same fitness function as BenchmarkC, evaluated on array backed cargo space.
+    """
+
+    Name: str = 'numpy'
+
+    def _new_cargo_space(self) -> ArrayCargoSpace:
+        return ArrayCargoSpace(width=self._dataset.width, height=self._dataset.height,
+                               station_out=self._index.station_out, weight=self._index.weight,
+                               instrumentation=self._instrumentation)
+
+    def _simulate(self, col_assignment: np.ndarray, cutoff: int = None, cargo_space: ArrayCargoSpace = None,
+                  first_station: int = 1, totals: tuple = (0, 0, 0), states: list = None) -> int:
+        """ Simulates ship route and returns fitness.
+
+        Args:
+            col_assignment: Column index of each package.
+            cutoff: Fitness to beat, simulation stops once it can not be beaten.
+            cargo_space: Cargo space state before first_station, empty cargo space if None.
+            first_station: Station to start simulation at.
+            totals: Package movements, layout and weight deviation summed before first_station.
+            states: If given, cargo space snapshot and totals before each simulated station are appended to it.
+
+        Returns: Fitness or AbortedFitness.
+        """
+
+        total_package_movements, total_lay_ds, total_we_ds = totals
+        cargo_space = self._new_cargo_space() if cargo_space is None else cargo_space
+
+        # Simulate ship route.
+        for station in range(first_station, self._dataset.total_stations + 1, 1):
+            if states is not None:
+                states.append((cargo_space.snapshot(), (total_package_movements, total_lay_ds, total_we_ds)))
+
+            aborted = self._cutoff_bound(station, (total_package_movements, total_lay_ds, total_we_ds), cutoff)
+            if aborted is not None:
+                return aborted
+
+            summary = cargo_space.simulate_stop_at_station(station, self._index.packages_at_station(station),
+                                                           col_assignment)
+            total_package_movements += summary.movements_sum
+
+            # Calculate layout and weight distribution in cargo space.
+            start = perf_counter() if self._instrumentation is not None else 0.0
+            perfect_lay = self._index.perfect_lay[station - 1]
+            perfect_we = self._index.perfect_we[station - 1]
+
+            total_lay_ds += int(np.abs(perfect_lay - summary.lay_dist).sum())
+            total_we_ds += int(np.abs(perfect_we - summary.weight_dist).sum())
+
+            if self._instrumentation is not None:
+                self._instrumentation.add_distribution(perf_counter() - start)
+
+        # Return calculated fitness.
+        return fitness_value(total_package_movements, total_lay_ds, total_we_ds)
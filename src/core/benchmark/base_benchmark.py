@@ -0,0 +1,211 @@
+import math
+from time import perf_counter
+
+from numpy import ndarray
+
+from src.core.benchmark.convergence_recorder import ConvergenceRecorder
+from src.core.benchmark.dataset_index import DatasetIndex
+from src.core.benchmark.fitness_cache import FitnessCache
+from src.core.benchmark.instrumentation import Instrumentation
+from src.model.aborted_fitness import AbortedFitness
+from src.model.cache_stats import CacheStats
+from src.model.convergence_trace import ConvergenceTrace
+from src.model.dataset import Dataset
+from src.model.evaluation_profile import EvaluationProfile
+
+
+class BaseBenchmark(object):
+    """ Shared part of all fitness evaluators: solution bounds, dataset index, solution decoding and fitness cache.
+
+    Evaluators differ only in how they simulate ship route for decoded column assignment, see _simulate.
+
+    Evaluation can be given a cutoff. Evaluators that support it stop simulating once the partial fitness plus lower
+    bound of the remaining route exceeds the cutoff and return AbortedFitness, others return exact fitness.
+    """
+
+    Name: str = ''
+
+    def __init__(self, dataset: Dataset, cache_size: int = 0, canonicalize: bool = False,
+                 early_abort: bool = False):
+        """
+        Args:
+            dataset: Dataset of simulation.
+            cache_size: Maximum number of cached fitness values, 0 disables the cache.
+            canonicalize: Share cache entries between plans that differ only in column labels, applied only when
+                it provably does not change fitness.
+            early_abort: Use best fitness found so far as cutoff of evaluations without explicit cutoff. Only the
+                best fitness stays exact, AbortedFitness of other solutions can be lower than their real fitness.
+        """
+
+        self.Lower:                     int = 0
+        self.Upper:                     int = 1
+        self._dataset:                  Dataset = dataset
+        self._index:                    DatasetIndex = DatasetIndex(dataset, self.Lower, self.Upper)
+        self._cache:                    FitnessCache = None
+        self._early_abort:              bool = early_abort
+        self._best_fitness:             int = None
+        self._aborted:                  int = 0
+        self._instrumentation:          Instrumentation = None
+        self._convergence:              ConvergenceRecorder = ConvergenceRecorder()
+
+        if cache_size > 0:
+            self._cache = FitnessCache(size=cache_size, width=dataset.width,
+                                       canonicalize=canonicalize and self._index.column_symmetric)
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        return None if self._cache is None else self._cache.stats()
+
+    @property
+    def aborted(self) -> int:
+        """ Number of evaluations stopped before the end of route.
+        """
+
+        return self._aborted
+
+    @property
+    def profile(self) -> EvaluationProfile:
+        """ Evaluation counters and stage times, None if instrumentation is not enabled.
+        """
+
+        return None if self._instrumentation is None else self._instrumentation.profile()
+
+    @property
+    def convergence(self) -> ConvergenceTrace:
+        """ Best-so-far fitness against number of evaluations.
+        """
+
+        return self._convergence.trace()
+
+    def enable_instrumentation(self):
+        """ Starts collecting evaluation counters and stage times, see profile.
+        """
+
+        self._instrumentation = Instrumentation()
+
+    def restore(self, evaluations: int, best_fitness: int = None):
+        """ Continues convergence trace and early abort cutoff of a resumed run.
+
+        Args:
+            evaluations: Number of evaluations done before resume.
+            best_fitness: Best fitness found before resume, None if there is none.
+        """
+
+        self._best_fitness = best_fitness
+        self._convergence.restore(evaluations, best_fitness)
+
+    def add_evaluated(self, fitness: int) -> int:
+        """ Records fitness of solution evaluated by another evaluator of the same dataset, e.g. in worker process.
+
+        Args:
+            fitness: Fitness or AbortedFitness.
+
+        Returns: Given fitness.
+        """
+
+        if isinstance(fitness, AbortedFitness):
+            self._aborted += 1
+        elif self._best_fitness is None or fitness < self._best_fitness:
+            self._best_fitness = fitness
+
+        self._convergence.add(fitness)
+        return fitness
+
+    def function(self):
+        def evaluate(d: int, sol: list, cutoff: int = None) -> int:
+            # Define package column positions via given solution, kept per call so evaluations can run concurrently.
+            if self._instrumentation is None:
+                return self._evaluate_decoded(self._index.decode(sol), cutoff)
+
+            start = perf_counter()
+            col_assignment = self._index.decode(sol)
+            decoded = perf_counter()
+            fitness = self._evaluate_decoded(col_assignment, cutoff)
+            self._instrumentation.add_evaluations(1, decoded - start, perf_counter() - start)
+
+            return fitness
+        return evaluate
+
+    def _evaluate_decoded(self, col_assignment: ndarray, cutoff: int, **start) -> int:
+        """ Evaluates decoded solution through fitness cache, early abort and convergence bookkeeping.
+
+        Args:
+            col_assignment: Column index of each package.
+            cutoff: Fitness to beat, None for best fitness so far if early abort is enabled.
+            start: Keyword arguments of _simulate that start simulation from a saved state.
+
+        Returns: Fitness or AbortedFitness.
+        """
+
+        cutoff = self._best_fitness if cutoff is None and self._early_abort else cutoff
+
+        if self._cache is None:
+            fitness = self._evaluate(col_assignment, cutoff, **start)
+        else:
+            key = self._cache.key(col_assignment)
+            fitness = self._cache.get(key)
+
+            if fitness is None:
+                fitness = self._evaluate(col_assignment, cutoff, **start)
+
+                # Aborted value is only a bound, it must not be returned for evaluation without cutoff.
+                if not isinstance(fitness, AbortedFitness):
+                    self._cache.put(key, fitness)
+
+        self._convergence.add(fitness)
+        return fitness
+
+    def _evaluate(self, col_assignment: ndarray, cutoff: int, **start) -> int:
+        fitness = self._simulate(col_assignment, cutoff=cutoff, **start)
+
+        if isinstance(fitness, AbortedFitness):
+            self._aborted += 1
+        elif self._best_fitness is None or fitness < self._best_fitness:
+            self._best_fitness = fitness
+
+        return fitness
+
+    def _cutoff_bound(self, station_index: int, totals: tuple, cutoff: int) -> AbortedFitness:
+        """ Checks if solution can still beat the cutoff.
+
+        Args:
+            station_index: First station not yet simulated.
+            totals: Package movements, layout and weight deviation summed before station_index.
+            cutoff: Fitness to beat, None for no cutoff.
+
+        Returns: Lower bound of fitness if it exceeds cutoff, otherwise None.
+        """
+
+        if cutoff is None:
+            return None
+
+        movements, lay, we = self._index.remaining_bound(station_index)
+        bound = fitness_value(totals[0] + movements, totals[1] + lay, totals[2] + we)
+
+        return AbortedFitness(bound) if bound > cutoff else None
+
+    def _simulate(self, col_assignment: ndarray, cutoff: int = None) -> int:
+        """ Simulates ship route and returns fitness.
+
+        Args:
+            col_assignment: Column index of each package.
+            cutoff: Fitness to beat, evaluators may ignore it.
+
+        Returns: Fitness or AbortedFitness.
+        """
+
+        raise NotImplementedError()
+
+
+def fitness_value(total_package_movements: int, total_lay_ds: int, total_we_ds: int) -> int:
+    """ Combines summed route measures into fitness.
+
+    Args:
+        total_package_movements: Package movements.
+        total_lay_ds: Layout deviation.
+        total_we_ds: Weight deviation.
+
+    Returns: Fitness.
+    """
+
+    return int((total_package_movements * 5) + (total_lay_ds * 3) + (math.sqrt(total_we_ds)*3))
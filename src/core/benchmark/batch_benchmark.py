@@ -0,0 +1,62 @@
+from time import perf_counter
+
+import numpy as np
+
+from src.core.benchmark.base_benchmark import BaseBenchmark
+from src.domain.batch_cargo_space import BatchCargoSpace
+
+
+class BatchBenchmarkC(BaseBenchmark):
+    """ Same fitness function as BenchmarkC, evaluated for a whole population of solutions in one call.
+    """
+
+    Name: str = 'batch'
+
+    def population_function(self):
+        def evaluate_population(d: int, population: np.ndarray) -> np.ndarray:
+            # Define package column positions via given solutions.
+            if self._instrumentation is None:
+                fitness = self._simulate_population(self._index.decode(np.atleast_2d(population)))
+            else:
+                start = perf_counter()
+                col_assignment = self._index.decode(np.atleast_2d(population))
+                decoded = perf_counter()
+                fitness = self._simulate_population(col_assignment)
+                self._instrumentation.add_evaluations(len(col_assignment), decoded - start, perf_counter() - start)
+
+            self._convergence.add_many(fitness)
+            return fitness
+        return evaluate_population
+
+    def _simulate(self, col_assignment: np.ndarray, cutoff: int = None) -> int:
+        # Single solution interface used by NiaPy tasks, whole route is always simulated so cutoff is not used.
+        return int(self._simulate_population(col_assignment[None, :])[0])
+
+    def _simulate_population(self, col_assignment: np.ndarray) -> np.ndarray:
+        population, width = len(col_assignment), self._dataset.width
+        total_package_movements = np.zeros(population, dtype=np.int64)
+        total_lay_ds = np.zeros(population, dtype=np.int64)
+        total_we_ds = np.zeros(population, dtype=np.int64)
+        cargo_space = BatchCargoSpace(population=population, width=width, height=self._dataset.height,
+                                      station_out=self._index.station_out, weight=self._index.weight,
+                                      instrumentation=self._instrumentation)
+
+        # Simulate ship route.
+        for station in range(1, self._dataset.total_stations + 1, 1):
+            movements, lay_dist, weight_dist = cargo_space.simulate_stop_at_station(
+                station, self._index.packages_at_station(station), col_assignment)
+            total_package_movements += movements
+
+            # Calculate layout and weight distribution in cargo space.
+            start = perf_counter() if self._instrumentation is not None else 0.0
+            perfect_lay = self._index.perfect_lay[station - 1]
+            perfect_we = self._index.perfect_we[station - 1]
+
+            total_lay_ds += np.abs(perfect_lay - lay_dist).sum(axis=1)
+            total_we_ds += np.abs(perfect_we - weight_dist).sum(axis=1)
+
+            if self._instrumentation is not None:
+                self._instrumentation.add_distribution(perf_counter() - start)
+
+        # Return calculated fitness per solution.
+        return ((total_package_movements * 5) + (total_lay_ds * 3) + (np.sqrt(total_we_ds)*3)).astype(np.int64)
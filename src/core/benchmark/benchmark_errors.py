@@ -0,0 +1,10 @@
+class InvalidEvaluatorName(Exception):
+    """Thrown if fitness evaluator with given name is not registered.
+    """
+    pass
+
+
+class InvalidEvaluatorOptions(Exception):
+    """Thrown if evaluator options contain arguments that the chosen fitness evaluator does not accept.
+    """
+    pass
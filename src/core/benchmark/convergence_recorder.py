@@ -0,0 +1,88 @@
+import numpy as np
+
+from src.model.convergence_trace import ConvergenceTrace
+
+
+class ConvergenceRecorder:
+    """ Records best-so-far fitness against evaluation count.
+
+    A point is stored only when best fitness improves, which is rare after the first generations, so an evaluation
+    costs a counter increment and one comparison. Once capacity points are stored every other point is dropped, so
+    memory stays bounded and the kept points stay spread over the whole run.
+    """
+
+    def __init__(self, capacity: int = 256):
+        """
+        Args:
+            capacity: Maximum number of stored points.
+        """
+
+        self._capacity:     int = max(capacity, 2)
+        self._count:        int = 0
+        self._best:         float = None
+        self._evaluations:  list = []
+        self._fitness:      list = []
+
+    def add(self, fitness: float):
+        """ Records one evaluation.
+
+        Args:
+            fitness: Fitness of evaluated solution.
+        """
+
+        self._count += 1
+
+        if self._best is None or fitness < self._best:
+            self._best = fitness
+            self._append(self._count, fitness)
+
+    def add_many(self, fitness: np.ndarray):
+        """ Records evaluations of a population, in order.
+
+        Args:
+            fitness: Fitness of evaluated solutions.
+        """
+
+        if len(fitness) == 0:
+            return
+
+        best = int(np.argmin(fitness))
+
+        if self._best is None or fitness[best] < self._best:
+            self._best = fitness[best]
+            self._append(self._count + best + 1, fitness[best])
+
+        self._count += len(fitness)
+
+    def restore(self, evaluations: int, best_fitness: float = None):
+        """ Continues recording after evaluations of a resumed run, earlier points are not known.
+
+        Args:
+            evaluations: Number of evaluations done before resume.
+            best_fitness: Best fitness found before resume, None if there is none.
+        """
+
+        self._count = evaluations
+
+        if best_fitness is not None:
+            self._best = best_fitness
+            self._evaluations, self._fitness = [evaluations], [best_fitness]
+
+    def trace(self) -> ConvergenceTrace:
+        """ Returns recorded points, with total evaluation count as last point.
+        """
+
+        evaluations, fitness = list(self._evaluations), list(self._fitness)
+
+        if self._best is not None and evaluations[-1] != self._count:
+            evaluations.append(self._count)
+            fitness.append(self._best)
+
+        return ConvergenceTrace(evaluations=evaluations, fitness=[float(value) for value in fitness])
+
+    def _append(self, evaluation: int, fitness: float):
+        if len(self._evaluations) == self._capacity:
+            self._evaluations, self._fitness = self._evaluations[::2], self._fitness[::2]
+
+        self._evaluations.append(evaluation)
+        self._fitness.append(fitness)
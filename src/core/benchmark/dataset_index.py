@@ -0,0 +1,173 @@
+import numpy as np
+from numpy import ndarray
+
+from src.model.dataset import Dataset
+
+
+class DatasetIndex(object):
+    """ Holds dataset data needed for fitness evaluation, computed once per dataset.
+    """
+
+    def __init__(self, dataset: Dataset, lower: float = 0, upper: float = 1):
+        """
+        Args:
+            dataset: Dataset to index.
+            lower: Lower bound of solution values.
+            upper: Upper bound of solution values.
+        """
+
+        self._width:            int = dataset.width
+        self._height:           int = dataset.height
+        self._total_stations:   int = dataset.total_stations
+
+        # Package columns, indexed by package index (position in dataset).
+        self._ids:              ndarray = dataset.ids
+        self._station_in:       ndarray = dataset.station_in
+        self._station_out:      ndarray = dataset.station_out
+        self._weight:           ndarray = dataset.weight
+
+        # Set column boundaries.
+        self._col_sep:          ndarray = np.linspace(lower, upper, self._width + 1)
+        self._col_sep[self._width] += 0.1
+
+        # Package indexes sorted by station of loading (dataset order within station) and station slice offsets.
+        self._order:            ndarray = np.argsort(self._station_in, kind='stable')
+        self._station_offsets:  ndarray = np.searchsorted(self._station_in[self._order],
+                                                          np.arange(1, self._total_stations + 2))
+
+        # Packages and their weight in cargo space after each station do not depend on solution.
+        stations = np.arange(1, self._total_stations + 1)
+        station_in = np.clip(self._station_in, 0, self._total_stations + 1)
+        station_out = np.clip(self._station_out, 0, self._total_stations + 1)
+        in_count = np.bincount(station_in, minlength=self._total_stations + 2)
+        out_count = np.bincount(station_out, minlength=self._total_stations + 2)
+        in_weight = np.bincount(station_in, weights=self._weight, minlength=self._total_stations + 2)
+        out_weight = np.bincount(station_out, weights=self._weight, minlength=self._total_stations + 2)
+        self._load_after:       ndarray = (np.cumsum(in_count) - np.cumsum(out_count))[stations]
+        self._weight_after:     ndarray = (np.cumsum(in_weight) - np.cumsum(out_weight))[stations].astype(np.int64)
+
+        # Perfect layout and weight per column after each station.
+        self._perfect_lay:      list = [round(int(total) / self._width) for total in self._load_after]
+        self._perfect_we:       list = [round(int(total) / self._width) for total in self._weight_after]
+
+        # Lower bounds of movements, layout and weight deviation summed from each station to the end of route.
+        self._remaining_bound:  list = self._make_remaining_bound(in_count, station_in, station_out)
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def total_stations(self) -> int:
+        return self._total_stations
+
+    @property
+    def total_packages(self) -> int:
+        return len(self._ids)
+
+    @property
+    def ids(self) -> ndarray:
+        return self._ids
+
+    @property
+    def station_in(self) -> ndarray:
+        return self._station_in
+
+    @property
+    def station_out(self) -> ndarray:
+        return self._station_out
+
+    @property
+    def weight(self) -> ndarray:
+        return self._weight
+
+    @property
+    def col_sep(self) -> ndarray:
+        return self._col_sep
+
+    @property
+    def order(self) -> ndarray:
+        return self._order
+
+    @property
+    def station_offsets(self) -> ndarray:
+        return self._station_offsets
+
+    @property
+    def load_after(self) -> ndarray:
+        return self._load_after
+
+    @property
+    def perfect_lay(self) -> list:
+        return self._perfect_lay
+
+    @property
+    def perfect_we(self) -> list:
+        return self._perfect_we
+
+    @property
+    def column_symmetric(self) -> bool:
+        """ True when cargo space never holds more packages than one column fits. Then no column can ever be full,
+        packages always go to their given column and fitness does not depend on column labels.
+        """
+
+        return len(self._load_after) == 0 or int(self._load_after.max()) <= self._height
+
+    def remaining_bound(self, station_index: int) -> tuple:
+        """ Returns lower bounds of package movements, layout and weight deviation summed over stations from given
+        station to the end of route, for any solution.
+
+        Args:
+            station_index: First station of the remaining route, total_stations + 1 for empty route.
+
+        Returns: Movements, layout deviation and weight deviation lower bounds.
+        """
+
+        return self._remaining_bound[station_index - 1]
+
+    def packages_at_station(self, station_index: int) -> ndarray:
+        """ Returns indexes of packages loaded at given station, in dataset order.
+
+        Args:
+            station_index: Station index (in).
+
+        Returns: Package indexes.
+        """
+
+        return self._order[self._station_offsets[station_index - 1]:self._station_offsets[station_index]]
+
+    def decode(self, sol: ndarray) -> ndarray:
+        """ Decodes solution (or matrix of solutions) into column index of each package.
+
+        Args:
+            sol: Solution values, one per package in dataset order.
+
+        Returns: Column indexes, same shape as sol.
+        """
+
+        return (np.digitize(sol, self._col_sep) - 1) % self._width
+
+    def _make_remaining_bound(self, in_count: ndarray, station_in: ndarray, station_out: ndarray) -> list:
+        stations = np.arange(1, self._total_stations + 1)
+
+        # Every package is moved at least once when loaded and once when unloaded at a later station of route.
+        valid = (station_in >= 1) & (station_in < station_out) & (station_out <= self._total_stations)
+        out_count = np.bincount(station_out[valid], minlength=self._total_stations + 2)
+        movements = (in_count + out_count)[stations]
+
+        # Column deviations from perfect value sum to at least the deviation of their total. Totals do not depend on
+        # solution only if every package is unloaded after it was loaded.
+        if valid.all():
+            lay = np.abs(self._load_after - np.array(self._perfect_lay, dtype=np.int64) * self._width)
+            we = np.abs(self._weight_after - np.array(self._perfect_we, dtype=np.int64) * self._width)
+        else:
+            lay, we = np.zeros(self._total_stations, dtype=np.int64), np.zeros(self._total_stations, dtype=np.int64)
+
+        # Suffix sums, last entry is empty route.
+        bounds = [np.append(np.cumsum(values[::-1])[::-1], 0).tolist() for values in (movements, lay, we)]
+
+        return list(zip(*bounds))
@@ -0,0 +1,91 @@
+import inspect
+
+from src.core.benchmark.array_benchmark import ArrayBenchmarkC
+from src.core.benchmark.base_benchmark import BaseBenchmark
+from src.core.benchmark.batch_benchmark import BatchBenchmarkC
+from src.core.benchmark.benchmark import BenchmarkC
+from src.core.benchmark.benchmark_errors import InvalidEvaluatorName, InvalidEvaluatorOptions
+from src.core.benchmark.prefix_benchmark import PrefixBenchmarkC
+from src.model.dataset import Dataset
+
+# Fitness evaluators by name, all of them return the same fitness.
+EVALUATORS = {
+    BenchmarkC.Name: BenchmarkC,
+    ArrayBenchmarkC.Name: ArrayBenchmarkC,
+    BatchBenchmarkC.Name: BatchBenchmarkC,
+    PrefixBenchmarkC.Name: PrefixBenchmarkC
+}
+
+# JIT compiled evaluator is available only if numba is installed.
+try:
+    from src.core.benchmark.jit_benchmark import JitBenchmarkC
+    EVALUATORS[JitBenchmarkC.Name] = JitBenchmarkC
+except ImportError:
+    pass
+
+# Constructor arguments shared by all evaluators, set from their own config entries instead of evaluator options.
+BASE_OPTIONS = [key for key in inspect.signature(BaseBenchmark.__init__).parameters if key not in ('self', 'dataset')]
+
+
+def evaluator_names() -> list:
+    """Returns names of all available evaluators.
+    """
+
+    return list(EVALUATORS.keys())
+
+
+def evaluator_type(name: str) -> type:
+    """Returns evaluator class registered under given name. Throws InvalidEvaluatorName if not registered.
+
+    Args:
+        name: Evaluator name.
+
+    Returns: Evaluator class.
+    """
+
+    if name not in EVALUATORS:
+        raise InvalidEvaluatorName('Invalid evaluator name "{0}", available: {1}'.format(name, evaluator_names()))
+
+    return EVALUATORS[name]
+
+
+def check_evaluator_options(name: str, options: dict):
+    """Checks that evaluator registered under given name accepts every given keyword argument.
+    Throws InvalidEvaluatorName if not registered, InvalidEvaluatorOptions if an argument is not accepted or is one of
+    BASE_OPTIONS.
+
+    Args:
+        name: Evaluator name.
+        options: Evaluator specific keyword arguments of evaluator constructor (dataset and BASE_OPTIONS excluded).
+    """
+
+    parameters = inspect.signature(evaluator_type(name).__init__).parameters
+    accepted = [key for key, parameter in parameters.items() if key not in ['self', 'dataset'] + BASE_OPTIONS
+                and parameter.kind in (parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY)]
+    unknown = [key for key in (options or {}) if key not in accepted]
+
+    if len(unknown) > 0:
+        raise InvalidEvaluatorOptions('Evaluator "{0}" does not accept options {1}, accepted: {2}'
+                                      .format(name, unknown, accepted))
+
+
+def create_evaluator(name: str, dataset: Dataset, cache_size: int = 0, canonicalize: bool = False,
+                     early_abort: bool = False, options: dict = None) -> BaseBenchmark:
+    """Creates evaluator registered under given name. Throws InvalidEvaluatorName if not registered,
+    InvalidEvaluatorOptions if options contain an argument the evaluator does not accept.
+
+    Args:
+        name: Evaluator name.
+        dataset: Dataset of simulation.
+        cache_size: Maximum number of cached fitness values, 0 disables the cache.
+        canonicalize: Share cache entries between plans that differ only in column labels.
+        early_abort: Use best fitness found so far as cutoff of evaluations.
+        options: Evaluator specific keyword arguments.
+
+    Returns: Evaluator object.
+    """
+
+    check_evaluator_options(name, options)
+
+    return evaluator_type(name)(dataset=dataset, cache_size=cache_size, canonicalize=canonicalize,
+                                early_abort=early_abort, **(options or {}))
@@ -0,0 +1,88 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from numpy import ndarray
+
+from src.model.cache_stats import CacheStats
+
+
+class FitnessCache(object):
+    """ Bounded LRU cache of fitness values, keyed by decoded column assignment.
+    """
+
+    def __init__(self, size: int, width: int, canonicalize: bool = False):
+        """
+        Args:
+            size: Maximum number of cached entries.
+            width: Cargo space width (number of columns).
+            canonicalize: Relabel columns in order of first use, so plans that differ only in column labels share
+                an entry. Only use it when fitness does not depend on column labels.
+        """
+
+        self._size:         int = size
+        self._width:        int = width
+        self._canonicalize: bool = canonicalize
+        self._entries:      OrderedDict = OrderedDict()
+        self._lock:         threading.Lock = threading.Lock()
+        self._key_type:     type = np.uint16 if width <= np.iinfo(np.uint16).max else np.int64
+        self._hits:         int = 0
+        self._misses:       int = 0
+        self._evictions:    int = 0
+
+    def key(self, col_assignment: ndarray) -> bytes:
+        """ Returns cache key of given column assignment.
+
+        Args:
+            col_assignment: Column index of each package.
+
+        Returns: Cache key.
+        """
+
+        if self._canonicalize:
+            columns, first_use = np.unique(col_assignment, return_index=True)
+            labels = np.empty(self._width, dtype=np.int64)
+            labels[columns[np.argsort(first_use)]] = np.arange(len(columns))
+            col_assignment = labels[col_assignment]
+
+        return col_assignment.astype(self._key_type).tobytes()
+
+    def get(self, key: bytes):
+        """ Returns cached fitness or None, counts hit or miss.
+
+        Args:
+            key: Cache key.
+
+        Returns: Fitness or None.
+        """
+
+        with self._lock:
+            fitness = self._entries.get(key)
+
+            if fitness is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._entries.move_to_end(key)
+
+            return fitness
+
+    def put(self, key: bytes, fitness: int):
+        """ Stores fitness, evicts least recently used entry if cache is full.
+
+        Args:
+            key: Cache key.
+            fitness: Fitness of assignment.
+        """
+
+        with self._lock:
+            self._entries[key] = fitness
+            self._entries.move_to_end(key)
+
+            if len(self._entries) > self._size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> CacheStats:
+        return CacheStats(size=self._size, hits=self._hits, misses=self._misses, evictions=self._evictions,
+                          canonical=self._canonicalize)
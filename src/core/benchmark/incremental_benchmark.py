@@ -0,0 +1,125 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from src.core.benchmark.array_benchmark import ArrayBenchmarkC
+from src.model.dataset import Dataset
+
+
+class IncrementalBenchmarkC(ArrayBenchmarkC):
+    """ ArrayBenchmarkC that re-evaluates changed solutions only from the first station the change can affect.
+
+    Parent solutions are registered once, their cargo space snapshots and partial sums before each station are kept.
+    A package does not affect cargo space before its station of loading, so a child that differs from its parent in
+    a few packages is simulated from the earliest station_in of those packages on.
+
+    Parents and children are evaluations like any other: they go through fitness cache, early abort and convergence
+    trace. Library API only, it needs parent handles so it is not a NiaPy benchmark and not in the evaluator registry.
+    """
+
+    def __init__(self, dataset: Dataset, max_parents: int = 64, cache_size: int = 0, canonicalize: bool = False,
+                 early_abort: bool = False):
+        """
+        Args:
+            dataset: Dataset of simulation.
+            max_parents: Maximum number of registered parents, least recently used ones are released first.
+            cache_size: Maximum number of cached fitness values, 0 disables the cache.
+            canonicalize: Share cache entries between plans that differ only in column labels.
+            early_abort: Use best fitness found so far as cutoff of children evaluated without explicit cutoff.
+        """
+
+        super().__init__(dataset, cache_size=cache_size, canonicalize=canonicalize, early_abort=early_abort)
+        self._max_parents:  int = max_parents
+        self._parents:      OrderedDict = OrderedDict()
+        self._next_handle:  int = 0
+        self._lock:         threading.Lock = threading.Lock()
+
+    def register(self, sol: list) -> int:
+        """ Evaluates parent solution and keeps its per station states.
+        Parent is always simulated to the end, without cutoff, as its states are needed.
+
+        Args:
+            sol: Parent solution.
+
+        Returns: Handle of registered parent.
+        """
+
+        col_assignment, states = self._index.decode(sol), []
+        fitness = self._evaluate(col_assignment, None, states=states)
+
+        if self._cache is not None:
+            self._cache.put(self._cache.key(col_assignment), fitness)
+
+        self._convergence.add(fitness)
+
+        with self._lock:
+            handle = self._next_handle
+            self._next_handle += 1
+            self._parents[handle] = (col_assignment, states, fitness)
+
+            if len(self._parents) > self._max_parents:
+                self._parents.popitem(last=False)
+
+        return handle
+
+    def release(self, parent_handle: int):
+        """ Removes registered parent.
+
+        Args:
+            parent_handle: Handle of registered parent.
+        """
+
+        with self._lock:
+            self._parents.pop(parent_handle, None)
+
+    def fitness(self, parent_handle: int) -> int:
+        """ Returns fitness of registered parent. Throws ValueError if handle is not registered.
+
+        Args:
+            parent_handle: Handle of registered parent.
+
+        Returns: Fitness.
+        """
+
+        return self._parent(parent_handle)[2]
+
+    def evaluate_delta(self, parent_handle: int, changed_indices: list, new_values: list, cutoff: int = None) -> int:
+        """ Evaluates solution that differs from registered parent only at given indexes.
+        Throws ValueError if handle is not registered.
+
+        Args:
+            parent_handle: Handle of registered parent.
+            changed_indices: Indexes of changed solution values (package indexes).
+            new_values: New solution values at changed indexes.
+            cutoff: Fitness to beat, None for best fitness so far if early abort is enabled.
+
+        Returns: Fitness or AbortedFitness of changed solution.
+        """
+
+        parent_assignment, states, fitness = self._parent(parent_handle)
+        changed_indices = np.asarray(changed_indices, dtype=np.int64)
+        col_assignment = parent_assignment.copy()
+        col_assignment[changed_indices] = self._index.decode(np.asarray(new_values, dtype=float))
+
+        # Changed values that decode to the same column do not change anything.
+        moved = changed_indices[col_assignment[changed_indices] != parent_assignment[changed_indices]]
+
+        if len(moved) == 0:
+            return self.add_evaluated(fitness)
+
+        first_station = int(self._index.station_in[moved].min())
+        state, totals = states[first_station - 1]
+        cargo_space = self._new_cargo_space()
+        cargo_space.restore(state)
+
+        return self._evaluate_decoded(col_assignment, cutoff, cargo_space=cargo_space, first_station=first_station,
+                                      totals=totals)
+
+    def _parent(self, parent_handle: int) -> tuple:
+        with self._lock:
+            if parent_handle not in self._parents:
+                raise ValueError('Unknown parent handle {0}'.format(parent_handle))
+
+            self._parents.move_to_end(parent_handle)
+            return self._parents[parent_handle]
@@ -0,0 +1,68 @@
+import threading
+
+from src.domain.station_recorder import StationRecorder
+from src.model.evaluation_profile import EvaluationProfile
+
+
+class Instrumentation(StationRecorder):
+    """ Collects fitness evaluation counters and cumulative stage times.
+
+    Evaluators and cargo spaces hold None instead of instrumentation object unless it is enabled, so disabled
+    instrumentation costs a single None check per stage.
+    """
+
+    Stages: tuple = ('decode', 'unload', 'load', 'distribution')
+
+    def __init__(self):
+        self._lock:             threading.Lock = threading.Lock()
+        self._evaluations:      int = 0
+        self._evaluation_time:  float = 0.0
+        self._stage_times:      dict = dict.fromkeys(self.Stages, 0.0)
+        self._movements:        int = 0
+        self._reloads:          int = 0
+
+    def add_evaluations(self, count: int, decode_time: float, evaluation_time: float):
+        """ Records evaluated solutions.
+
+        Args:
+            count: Number of evaluated solutions.
+            decode_time: Time spent decoding solutions in seconds.
+            evaluation_time: Total evaluation time in seconds, decoding included.
+        """
+
+        with self._lock:
+            self._evaluations += count
+            self._evaluation_time += evaluation_time
+            self._stage_times['decode'] += decode_time
+
+    def add_station(self, unload_time: float, load_time: float, movements: int, reloads: int):
+        """ Records simulated stop at station.
+
+        Args:
+            unload_time: Time spent unloading in seconds.
+            load_time: Time spent loading in seconds.
+            movements: Package movements.
+            reloads: Packages loaded back from waiting que.
+        """
+
+        with self._lock:
+            self._stage_times['unload'] += unload_time
+            self._stage_times['load'] += load_time
+            self._movements += movements
+            self._reloads += reloads
+
+    def add_distribution(self, distribution_time: float):
+        """ Records time spent computing layout and weight deviations.
+
+        Args:
+            distribution_time: Time in seconds.
+        """
+
+        with self._lock:
+            self._stage_times['distribution'] += distribution_time
+
+    def profile(self) -> EvaluationProfile:
+        with self._lock:
+            return EvaluationProfile(evaluations=self._evaluations, evaluation_time=self._evaluation_time,
+                                     stage_times=dict(self._stage_times), movements=self._movements,
+                                     reloads=self._reloads)
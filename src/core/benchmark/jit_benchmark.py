@@ -0,0 +1,106 @@
+import math
+
+import numpy as np
+from numba import njit
+
+from src.core.benchmark.base_benchmark import BaseBenchmark, fitness_value
+from src.model.dataset import Dataset
+
+
+@njit(cache=True)
+def _add_package(package, col_assignment, slots, count, col_weight, weight, height):
+    add_index = col_assignment[package]
+
+    if count[add_index] == height:
+        add_index = np.argmin(count)
+
+    slots[add_index, count[add_index]] = package
+    count[add_index] += 1
+    col_weight[add_index] += weight[package]
+
+
+@njit(cache=True)
+def _simulate_route(col_assignment, station_out, weight, order, station_offsets, width, height, perfect_lay,
+                    perfect_we, remaining_bound, cutoff):
+    slots = np.full((width, height), -1, np.int64)
+    count = np.zeros(width, np.int64)
+    col_weight = np.zeros(width, np.int64)
+    wait_que = np.empty(width * height, np.int64)
+    total_package_movements, total_lay_ds, total_we_ds = 0, 0, 0
+
+    for station in range(1, len(perfect_lay) + 1):
+        que_len = 0
+
+        # Stop once partial sums plus lower bound of remaining route exceed cutoff (negative cutoff for none).
+        if cutoff >= 0:
+            bound = int((total_package_movements + remaining_bound[station - 1, 0]) * 5 +
+                        (total_lay_ds + remaining_bound[station - 1, 1]) * 3 +
+                        math.sqrt(total_we_ds + remaining_bound[station - 1, 2]) * 3)
+            if bound > cutoff:
+                return total_package_movements, total_lay_ds, total_we_ds, station
+
+        # Unload packages for current station, everything above lowest leaving package is moved.
+        for col in range(width):
+            first = 0
+            while first < count[col] and station_out[slots[col, first]] != station:
+                first += 1
+
+            for i in range(first, count[col]):
+                package = slots[col, i]
+                if station_out[package] != station:
+                    wait_que[que_len] = package
+                    que_len += 1
+                col_weight[col] -= weight[package]
+                slots[col, i] = -1
+
+            total_package_movements += count[col] - first
+            count[col] = first
+
+        # Load packages for current station, then packages from waiting que.
+        for i in range(station_offsets[station - 1], station_offsets[station]):
+            _add_package(order[i], col_assignment, slots, count, col_weight, weight, height)
+
+        for i in range(que_len):
+            _add_package(wait_que[i], col_assignment, slots, count, col_weight, weight, height)
+
+        total_package_movements += station_offsets[station] - station_offsets[station - 1] + que_len
+
+        # Calculate layout and weight distribution in cargo space.
+        for col in range(width):
+            total_lay_ds += abs(perfect_lay[station - 1] - count[col])
+            total_we_ds += abs(perfect_we[station - 1] - col_weight[col])
+
+    return total_package_movements, total_lay_ds, total_we_ds, 0
+
+
+class JitBenchmarkC(BaseBenchmark):
+    """ Same fitness function as BenchmarkC, ship route is simulated by numba compiled kernel.
+    """
+
+    Name: str = 'numba'
+
+    def __init__(self, dataset: Dataset, cache_size: int = 0, canonicalize: bool = False,
+                 early_abort: bool = False):
+        super().__init__(dataset, cache_size, canonicalize, early_abort)
+        self._perfect_lay:  np.ndarray = np.array(self._index.perfect_lay, dtype=np.int64)
+        self._perfect_we:   np.ndarray = np.array(self._index.perfect_we, dtype=np.int64)
+        self._offsets:      np.ndarray = self._index.station_offsets.astype(np.int64)
+        self._order:        np.ndarray = self._index.order.astype(np.int64)
+        self._bound:        np.ndarray = np.array([self._index.remaining_bound(station) for station in
+                                                   range(1, dataset.total_stations + 2)], dtype=np.int64)
+
+    def _simulate(self, col_assignment: np.ndarray, cutoff: int = None) -> int:
+        total_package_movements, total_lay_ds, total_we_ds, aborted_at = _simulate_route(
+            col_assignment.astype(np.int64), self._index.station_out, self._index.weight, self._order,
+            self._offsets, self._dataset.width, self._dataset.height, self._perfect_lay, self._perfect_we,
+            self._bound, -1 if cutoff is None else int(cutoff))
+
+        # Stages of compiled kernel can not be timed, only its package movements are recorded.
+        if self._instrumentation is not None:
+            self._instrumentation.add_station(0.0, 0.0, int(total_package_movements), 0)
+
+        if aborted_at > 0:
+            return self._cutoff_bound(aborted_at, (total_package_movements, total_lay_ds, total_we_ds), cutoff)
+
+        # Return calculated fitness.
+        return fitness_value(total_package_movements, total_lay_ds, total_we_ds)
@@ -0,0 +1,57 @@
+import numpy as np
+
+from src.core.benchmark.array_benchmark import ArrayBenchmarkC
+from src.core.benchmark.prefix_cache import PrefixCache
+from src.model.dataset import Dataset
+from src.model.prefix_cache_stats import PrefixCacheStats
+
+
+class PrefixBenchmarkC(ArrayBenchmarkC):
+    """ ArrayBenchmarkC that resumes simulation from cargo space state cached for the longest shared station prefix.
+
+    Solutions that assign packages loaded at the first k stations to the same columns have the same cargo space state
+    after station k, so it is cached once and later solutions simulate only the remaining stations.
+    """
+
+    Name: str = 'prefix'
+
+    def __init__(self, dataset: Dataset, cache_size: int = 0, canonicalize: bool = False,
+                 early_abort: bool = False, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            dataset: Dataset of simulation.
+            cache_size: Maximum number of cached fitness values, 0 disables the cache.
+            canonicalize: Share fitness cache entries between plans that differ only in column labels.
+            early_abort: Use best fitness found so far as cutoff of evaluations without explicit cutoff.
+            max_bytes: Memory budget of cached cargo space states.
+        """
+
+        super().__init__(dataset, cache_size, canonicalize, early_abort)
+        self._prefix_cache:     PrefixCache = PrefixCache(max_bytes)
+        self._key_type:         type = np.uint16 if dataset.width <= np.iinfo(np.uint16).max else np.int64
+        self._key_offsets:      list = (self._index.station_offsets * np.dtype(self._key_type).itemsize).tolist()
+
+    @property
+    def prefix_stats(self) -> PrefixCacheStats:
+        return self._prefix_cache.stats()
+
+    def _simulate(self, col_assignment: np.ndarray, cutoff: int = None) -> int:
+        # Key of each station is column assignment of packages loaded there, state after last station is not needed.
+        assignment = col_assignment[self._index.order].astype(self._key_type).tobytes()
+        keys = [assignment[self._key_offsets[station - 1]:self._key_offsets[station]]
+                for station in range(1, self._dataset.total_stations)]
+
+        depth, state, totals = self._prefix_cache.lookup(keys)
+        cargo_space = self._new_cargo_space()
+        states = []
+
+        if state is not None:
+            cargo_space.restore(state)
+
+        fitness = super()._simulate(col_assignment, cutoff=cutoff, cargo_space=cargo_space, first_station=depth + 1,
+                                    totals=totals, states=states)
+
+        # First state is the one found in cache (or empty cargo space), the rest are states after each next station.
+        self._prefix_cache.insert(keys, depth + 1, states[1:])
+
+        return fitness
@@ -0,0 +1,129 @@
+import threading
+from collections import OrderedDict
+
+from src.model.prefix_cache_stats import PrefixCacheStats
+
+
+class _Node(object):
+    """ Cached cargo space state after the stations on the path from root to this node.
+    """
+
+    __slots__ = ('parent', 'key', 'depth', 'children', 'state', 'totals', 'nbytes')
+
+    def __init__(self, parent, key: bytes, state: tuple, totals: tuple, nbytes: int):
+        self.parent = parent
+        self.key = key
+        self.depth = 0 if parent is None else parent.depth + 1
+        self.children = {}
+        self.state = state
+        self.totals = totals
+        self.nbytes = nbytes
+
+
+class PrefixCache(object):
+    """ Memory bounded trie of cargo space states, keyed by column assignment of packages loaded at each station.
+
+    Node at depth k holds cargo space state and partial sums after station k, shared by every solution that assigns
+    packages of stations 1..k to the same columns. Every lookup touches its path from the deepest node up to the root,
+    so a node is always used more recently than its children and least recently used node is always a leaf.
+    """
+
+    # Estimated memory of node bookkeeping, added to size of its key and state arrays.
+    NodeOverhead: int = 256
+
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes: Memory budget of cached states.
+        """
+
+        self._max_bytes:        int = max_bytes
+        self._root:             _Node = _Node(None, b'', None, (0, 0, 0), 0)
+        self._lru:              OrderedDict = OrderedDict()
+        self._lock:             threading.Lock = threading.Lock()
+        self._used_bytes:       int = 0
+        self._evaluations:      int = 0
+        self._stations_skipped: int = 0
+        self._evictions:        int = 0
+
+    def lookup(self, keys: list) -> tuple:
+        """ Finds the deepest cached state on the path of given keys, counts skipped stations.
+
+        Args:
+            keys: Key of each station, column assignment of packages loaded there.
+
+        Returns: Depth of found state (0 if none), cargo space state or None, partial sums after that depth.
+        """
+
+        with self._lock:
+            node = self._walk(keys)
+            self._touch(node)
+            self._evaluations += 1
+            self._stations_skipped += node.depth
+
+            return node.depth, node.state, node.totals
+
+    def insert(self, keys: list, depth: int, states: list):
+        """ Adds states on the path of given keys, then evicts least recently used states over memory budget.
+
+        Args:
+            keys: Key of each station, column assignment of packages loaded there.
+            depth: Depth of the first given state.
+            states: Cargo space state and partial sums, one per depth from the given one on.
+        """
+
+        with self._lock:
+            node = self._walk(keys[:depth - 1])
+
+            # Path can be shorter than expected if it was evicted meanwhile, then the rest can not be attached.
+            if node.depth != depth - 1:
+                return
+
+            for key, (state, totals) in zip(keys[depth - 1:], states):
+                child = node.children.get(key)
+
+                if child is None:
+                    nbytes = sum(array.nbytes for array in state) + len(key) + self.NodeOverhead
+                    child = _Node(node, key, state, totals, nbytes)
+                    node.children[key] = child
+                    self._used_bytes += nbytes
+
+                node = child
+
+            self._touch(node)
+
+            while self._used_bytes > self._max_bytes and len(self._lru) > 0:
+                self._evict(self._lru.popitem(last=False)[1])
+
+    def stats(self) -> PrefixCacheStats:
+        return PrefixCacheStats(max_bytes=self._max_bytes, used_bytes=self._used_bytes, nodes=len(self._lru),
+                                evaluations=self._evaluations, stations_skipped=self._stations_skipped,
+                                evictions=self._evictions)
+
+    def _walk(self, keys: list) -> _Node:
+        node = self._root
+
+        for key in keys:
+            child = node.children.get(key)
+            if child is None:
+                break
+            node = child
+
+        return node
+
+    def _touch(self, node: _Node):
+        # Leaf first, so parents end up more recently used than their children.
+        while node is not self._root:
+            self._lru[id(node)] = node
+            self._lru.move_to_end(id(node))
+            node = node.parent
+
+    def _evict(self, node: _Node):
+        del node.parent.children[node.key]
+        self._used_bytes -= node.nbytes
+        self._evictions += 1
+
+        # Never happens while parents are touched after children, kept so accounting stays right.
+        for child in list(node.children.values()):
+            self._lru.pop(id(child), None)
+            self._evict(child)
@@ -0,0 +1,237 @@
+import socket
+import threading
+import time
+from collections import deque
+
+from src.core.distributed import protocol
+from src.core.distributed.distributed_errors import ConnectionClosed, InvalidMessage, JobTimeout, NoActiveWorkers
+from src.core.runner.runner import Runner
+from src.logger.logger import Logger
+from src.model.dataset import Dataset
+from src.model.simulation_run_info import SimulationRunInfo
+
+
+class Coordinator:
+    """ Serves optimization runs to workers connected over TCP, see Worker.
+
+    Each job carries its spec and the content hash of the dataset, workers ask for the dataset only if they did not
+    cache it yet. A job goes back to the queue and is retried by the next free worker, up to max_attempts times, if
+    its worker drops the connection, stops sending heartbeats for heartbeat_timeout seconds or does not return the
+    result within job_timeout seconds. Connection of such worker is closed, a late result is never accepted. Run
+    raises NoActiveWorkers once no worker connected or sent a message for idle_timeout seconds.
+    """
+
+    def __init__(self, host: str, port: int, max_attempts: int = 3, job_timeout: float = None,
+                 heartbeat_timeout: float = 30.0, idle_timeout: float = 300.0):
+        """
+        Args:
+            host: Address to listen on.
+            port: Port to listen on, 0 picks a free one, see address.
+            max_attempts: Attempts per job, job that lost its worker this many times gets an error result.
+            job_timeout: Seconds a worker may run one job, None for no limit.
+            heartbeat_timeout: Seconds a worker running a job may stay silent, workers send heartbeats more often. None
+                for no limit.
+            idle_timeout: Seconds run waits while no worker connects or sends a message, None waits forever.
+        """
+
+        self.logger = Logger(self.__class__.__name__)
+
+        self._server:       socket.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind((host, port))
+        self._server.listen()
+        self._server.settimeout(0.2)
+
+        self._max_attempts:         int = max_attempts
+        self._job_timeout:          float = job_timeout
+        self._heartbeat_timeout:    float = heartbeat_timeout
+        self._idle_timeout:         float = idle_timeout
+        self._last_activity:        float = time.monotonic()
+        self._closed:               bool = False
+        self._condition:    threading.Condition = threading.Condition()
+        self._pending:      deque = deque()
+        self._specs:        list = []
+        self._attempts:     list = []
+        self._results:      dict = {}
+        self._dataset:      dict = None
+        self._dataset_hash: str = None
+        self._on_result = None
+
+    @property
+    def address(self) -> tuple:
+        """ Host and port coordinator listens on.
+        """
+
+        return self._server.getsockname()[:2]
+
+    def run(self, specs: list, dataset: Dataset, on_result=None) -> list:
+        """Serves specs to workers until every one of them has a result, then shuts down connected workers.
+
+        Args:
+            specs: Descriptions of optimization runs, handed out in given order.
+            dataset: Dataset of simulation.
+            on_result: Called with every SimulationRunInfo as it arrives.
+
+        Returns: A list of SimulationRunInfo in order results arrived.
+        """
+
+        with self._condition:
+            self._specs = list(specs)
+            self._attempts = [0] * len(self._specs)
+            self._pending = deque(range(len(self._specs)))
+            self._results = {}
+            self._dataset = dataset.to_dict()
+            self._dataset_hash = dataset.content_hash()
+            self._on_result = on_result
+            self._last_activity = time.monotonic()
+            self._closed = False
+
+        self.logger.console_log('serving {0} jobs at {1}:{2}'.format(len(self._specs), *self.address))
+
+        handlers = []
+
+        try:
+            while not self._finished():
+                try:
+                    connection, peer = self._server.accept()
+                except socket.timeout:
+                    if self._idle_timeout is not None and time.monotonic() - self._last_activity > self._idle_timeout:
+                        raise NoActiveWorkers('No worker connected or reported in {0} s'.format(self._idle_timeout))
+                    continue
+
+                self._last_activity = time.monotonic()
+
+                handler = threading.Thread(target=self._serve, args=(connection, peer), daemon=True)
+                handler.start()
+                handlers.append(handler)
+        finally:
+            self._server.close()
+
+            # Workers waiting for a job get shutdown message if run stopped before every result was in.
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+
+        # Idle workers are waiting for a job, they get shutdown message.
+        for handler in handlers:
+            handler.join(timeout=5.0)
+
+        return list(self._results.values())
+
+    def _serve(self, connection: socket.socket, peer: tuple):
+        job_id, deadline = None, None
+        connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        self.logger.console_log('worker {0}:{1} connected'.format(*peer))
+
+        try:
+            with connection:
+                while True:
+                    message = self._recv(connection, deadline)
+                    self._last_activity = time.monotonic()
+
+                    if message['type'] == protocol.Request:
+                        job_id = self._next_job()
+
+                        if job_id is None:
+                            protocol.send_message(connection, protocol.Shutdown)
+                            return
+
+                        deadline = None if self._job_timeout is None else time.monotonic() + self._job_timeout
+                        protocol.send_message(connection, protocol.Job, job_id=job_id,
+                                              spec=self._specs[job_id].to_dict(), dataset_hash=self._dataset_hash)
+
+                    elif message['type'] == protocol.Heartbeat:
+                        if job_id is None or message['job_id'] != job_id:
+                            raise InvalidMessage('Heartbeat of job {0} that was not assigned'.format(message['job_id']))
+
+                    elif message['type'] == protocol.DatasetRequest:
+                        protocol.send_message(connection, protocol.DatasetMessage, hash=self._dataset_hash,
+                                              dataset=self._dataset)
+
+                    elif message['type'] == protocol.Result:
+                        if job_id is None or message['job_id'] != job_id:
+                            raise InvalidMessage('Result of job {0} that was not assigned'.format(message['job_id']))
+
+                        self._add_result(message['job_id'], SimulationRunInfo.from_dict(message['run_info']))
+                        job_id, deadline = None, None
+
+                    else:
+                        raise InvalidMessage('Unexpected message type "{0}"'.format(message['type']))
+
+        except Exception as error:
+            # Any error ends the connection, its job must go back to the queue or run would wait for it forever.
+            if isinstance(error, (OSError, ConnectionClosed, InvalidMessage, JobTimeout, KeyError, TypeError,
+                                  ValueError)):
+                self.logger.console_log('worker {0}:{1} dropped: {2}'.format(peer[0], peer[1], error))
+            else:
+                self.logger.console_log('worker {0}:{1} dropped, unexpected error: {2!r}'.format(peer[0], peer[1],
+                                                                                               error))
+
+            if job_id is not None:
+                self._retry(job_id, error)
+
+    def _recv(self, connection: socket.socket, deadline: float) -> dict:
+        # Worker that runs a job sends heartbeats, silence longer than heartbeat timeout or job deadline ends it.
+        timeout = self._heartbeat_timeout
+
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+
+            if remaining <= 0:
+                raise JobTimeout('Job did not finish in {0} s'.format(self._job_timeout))
+
+            timeout = remaining if timeout is None else min(timeout, remaining)
+
+        connection.settimeout(timeout)
+
+        try:
+            return protocol.recv_message(connection)
+        except socket.timeout:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise JobTimeout('Job did not finish in {0} s'.format(self._job_timeout))
+
+            raise ConnectionClosed('No message from worker in {0} s'.format(self._heartbeat_timeout))
+
+    def _finished(self) -> bool:
+        with self._condition:
+            return len(self._results) == len(self._specs)
+
+    def _next_job(self):
+        with self._condition:
+            # Jobs of running workers may still come back to the queue, so wait until every result is in.
+            while not self._pending and len(self._results) < len(self._specs) and not self._closed:
+                self._condition.wait(timeout=0.5)
+
+            if not self._pending or self._closed:
+                return None
+
+            job_id = self._pending.popleft()
+            self._attempts[job_id] += 1
+
+            return job_id
+
+    def _add_result(self, job_id: int, run_info: SimulationRunInfo):
+        with self._condition:
+            if job_id in self._results:
+                return
+
+            self._results[job_id] = run_info
+            self._condition.notify_all()
+
+        if self._on_result is not None:
+            self._on_result(run_info)
+
+    def _retry(self, job_id: int, error: Exception):
+        with self._condition:
+            if job_id in self._results:
+                return
+
+            if self._attempts[job_id] < self._max_attempts:
+                self._pending.appendleft(job_id)
+                self._condition.notify_all()
+                self.logger.console_log('job {0} requeued'.format(job_id))
+                return
+
+        spec = self._specs[job_id]
+        self._add_result(job_id, Runner.error_info(spec.name, RuntimeError(
+            'worker lost {0} times, last error: {1}'.format(self._attempts[job_id], error)), spec.seed, spec.repeat))
@@ -0,0 +1,14 @@
+class ConnectionClosed(Exception):
+    pass
+
+
+class InvalidMessage(Exception):
+    pass
+
+
+class JobTimeout(Exception):
+    pass
+
+
+class NoActiveWorkers(Exception):
+    pass
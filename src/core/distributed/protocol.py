@@ -0,0 +1,75 @@
+import json
+import socket
+import struct
+
+from src.core.distributed.distributed_errors import ConnectionClosed, InvalidMessage
+
+# Messages are JSON objects prefixed with their length as 4 byte big-endian unsigned int. JSON instead of pickle, so
+# a peer can not make the other side execute code.
+_HEADER = struct.Struct('>I')
+
+# Worker asks for next job.
+Request:            str = 'request'
+# Coordinator hands out job, {"job_id", "spec", "dataset_hash"}.
+Job:                str = 'job'
+# Worker asks for dataset it has not cached yet, {"hash"}.
+DatasetRequest:     str = 'dataset_request'
+# Coordinator sends dataset, {"hash", "dataset"}.
+DatasetMessage:     str = 'dataset'
+# Worker is alive and still running job, sent periodically while job runs, {"job_id"}.
+Heartbeat:          str = 'heartbeat'
+# Worker returns finished job, {"job_id", "run_info"}.
+Result:             str = 'result'
+# Coordinator has no more jobs, worker exits.
+Shutdown:           str = 'shutdown'
+
+
+def send_message(sock: socket.socket, message_type: str, **fields):
+    """Sends one message.
+
+    Args:
+        sock: Connected socket.
+        message_type: Type of message, one of module constants.
+        fields: JSON serializable message fields.
+    """
+
+    payload = json.dumps(dict(fields, type=message_type)).encode('utf-8')
+    sock.sendall(_HEADER.pack(len(payload)) + payload)
+
+
+def recv_message(sock: socket.socket) -> dict:
+    """Receives one message, blocks until it arrives.
+
+    Args:
+        sock: Connected socket.
+
+    Returns: Message fields, message type under "type" key. Throws ConnectionClosed if peer closed the connection
+        and InvalidMessage if message can not be decoded.
+    """
+
+    size, = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+
+    try:
+        message = json.loads(_recv_exact(sock, size).decode('utf-8'))
+    except ValueError as error:
+        raise InvalidMessage('Invalid message: {0}'.format(error))
+
+    if not isinstance(message, dict) or 'type' not in message:
+        raise InvalidMessage('Message without type')
+
+    return message
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+
+    while size > 0:
+        chunk = sock.recv(min(size, 1 << 20))
+
+        if not chunk:
+            raise ConnectionClosed('Connection closed by peer')
+
+        chunks.append(chunk)
+        size -= len(chunk)
+
+    return b''.join(chunks)
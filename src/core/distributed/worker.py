@@ -0,0 +1,125 @@
+import socket
+import threading
+import time
+
+from src.core.distributed import protocol
+from src.core.distributed.distributed_errors import ConnectionClosed, InvalidMessage
+from src.core.runner.runner import Runner
+from src.logger.logger import Logger
+from src.model.algorithm_spec import AlgorithmSpec
+from src.model.dataset import Dataset
+from src.model.simulation_run_info import SimulationRunInfo
+
+
+class Worker:
+    """ Runs optimization runs served by Coordinator over TCP, until coordinator tells it there are no more.
+
+    Datasets are cached by their content hash, so every dataset is transferred to a worker once. While a job runs,
+    worker sends heartbeats so coordinator can tell a long job from a lost worker. Lost connection is retried, job
+    that was running on it is retried by coordinator.
+    """
+
+    def __init__(self, host: str, port: int, connect_timeout: float = 30.0, heartbeat_interval: float = 5.0):
+        """
+        Args:
+            host: Coordinator address.
+            port: Coordinator port.
+            connect_timeout: Seconds to keep trying to connect to coordinator before giving up.
+            heartbeat_interval: Seconds between heartbeats while a job runs, must be shorter than heartbeat timeout
+                of coordinator.
+        """
+
+        self.logger = Logger(self.__class__.__name__)
+
+        self._host:                 str = host
+        self._port:                 int = port
+        self._connect_timeout:      float = connect_timeout
+        self._heartbeat_interval:   float = heartbeat_interval
+        self._datasets:             dict = {}
+        self._send_lock:            threading.Lock = threading.Lock()
+
+    def run(self) -> int:
+        """Connects to coordinator and runs jobs it hands out.
+
+        Returns: Number of jobs finished.
+        """
+
+        finished = 0
+
+        while True:
+            connection = self._connect()
+
+            if connection is None:
+                self.logger.console_log('coordinator {0}:{1} not reachable'.format(self._host, self._port))
+                return finished
+
+            try:
+                with connection:
+                    while True:
+                        protocol.send_message(connection, protocol.Request)
+                        message = protocol.recv_message(connection)
+
+                        if message['type'] == protocol.Shutdown:
+                            return finished
+
+                        if message['type'] != protocol.Job:
+                            raise InvalidMessage('Unexpected message type "{0}"'.format(message['type']))
+
+                        dataset = self._dataset(connection, message['dataset_hash'])
+                        run_info = self._run_job(connection, message['job_id'], message['spec'], dataset)
+
+                        with self._send_lock:
+                            protocol.send_message(connection, protocol.Result, job_id=message['job_id'],
+                                                  run_info=run_info.to_dict())
+                        finished += 1
+
+            except (OSError, ConnectionClosed, InvalidMessage, KeyError, TypeError) as error:
+                self.logger.console_log('connection lost: {0}'.format(error))
+
+    def _run_job(self, connection: socket.socket, job_id: int, spec: dict, dataset: Dataset) -> SimulationRunInfo:
+        stopped = threading.Event()
+        heartbeat = threading.Thread(target=self._send_heartbeats, args=(connection, job_id, stopped), daemon=True)
+        heartbeat.start()
+
+        try:
+            return Runner.run_spec(AlgorithmSpec.from_dict(spec), dataset)
+        finally:
+            stopped.set()
+            heartbeat.join()
+
+    def _send_heartbeats(self, connection: socket.socket, job_id: int, stopped: threading.Event):
+        while not stopped.wait(self._heartbeat_interval):
+            try:
+                with self._send_lock:
+                    protocol.send_message(connection, protocol.Heartbeat, job_id=job_id)
+            except OSError:
+                # Coordinator dropped the connection, result of the job will not be accepted either.
+                return
+
+    def _connect(self) -> socket.socket:
+        deadline = time.monotonic() + self._connect_timeout
+
+        while True:
+            try:
+                return socket.create_connection((self._host, self._port))
+            except OSError:
+                if time.monotonic() >= deadline:
+                    return None
+                time.sleep(0.2)
+
+    def _dataset(self, connection: socket.socket, dataset_hash: str) -> Dataset:
+        if dataset_hash not in self._datasets:
+            protocol.send_message(connection, protocol.DatasetRequest, hash=dataset_hash)
+            message = protocol.recv_message(connection)
+
+            if message['type'] != protocol.DatasetMessage:
+                raise InvalidMessage('Unexpected message type "{0}"'.format(message['type']))
+
+            dataset = Dataset.from_dict(message['dataset'])
+
+            if dataset.content_hash() != dataset_hash:
+                raise InvalidMessage('Dataset does not match its hash')
+
+            self._datasets[dataset_hash] = dataset
+
+        return self._datasets[dataset_hash]
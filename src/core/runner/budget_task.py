@@ -0,0 +1,168 @@
+from time import perf_counter
+
+import numpy as np
+from NiaPy.util import Task, FesException, TimeException
+
+
+class StagnationException(FesException):
+    """ Raised when best fitness stopped improving, handled by Algorithm.run like exhausted evaluations.
+    """
+    pass
+
+
+class BudgetTask(Task):
+    """ NiaPy task that, besides evaluation limit, stops once its wall-clock time budget runs out or once best fitness
+    stagnates.
+
+    Stopping conditions are checked before every evaluation. Algorithm.run handles raised exceptions like exhausted
+    evaluations and returns best solution evaluated so far.
+
+    Populations can be evaluated ahead on a ParallelEvaluator. NiaPy algorithms evaluate a population row by row
+    with eval, starting with its first row, so evaluating the first row of a (NP, D) array evaluates the rows that fit
+    in the evaluation limit in parallel. Each later evaluation uses fitness evaluated ahead only if its solution is
+    unchanged, otherwise solution is evaluated serially, so results are the same as with serial evaluation.
+    """
+
+    StopEvaluations:    str = 'n_fes'
+    StopTimeBudget:     str = 'time_budget'
+    StopStagnation:     str = 'stagnation'
+
+    def __init__(self, time_budget: float = None, stagnation_evals: int = None, stagnation_epsilon: float = 0.0,
+                 population_evaluator=None, **kwargs):
+        """
+        Args:
+            time_budget: Wall-clock budget of run in seconds, None for no budget.
+            stagnation_evals: Stop once best fitness did not improve by more than stagnation_epsilon in this many
+                evaluations, None disables it.
+            stagnation_epsilon: Smallest improvement of best fitness that counts.
+            population_evaluator: ParallelEvaluator of populations, None evaluates them serially.
+            kwargs: NiaPy Task arguments.
+        """
+
+        super().__init__(**kwargs)
+        self._time_budget:          float = time_budget
+        self._start_time:           float = perf_counter()
+        self._stagnation_evals:     int = stagnation_evals
+        self._stagnation_epsilon:   float = stagnation_epsilon
+        self._reference_fitness:    float = None
+        self._improved_at:          int = 0
+        self._stop_reason:          str = None
+        self._population_evaluator = population_evaluator
+        self._evaluated_ahead:      dict = {}
+        self._parallel_evaluations: int = 0
+
+        if population_evaluator is not None:
+            self._function = self.Fun
+            self.Fun = self._evaluated_fitness
+
+    @property
+    def time_budget(self) -> float:
+        return self._time_budget
+
+    @property
+    def population_evaluator(self):
+        return self._population_evaluator
+
+    @property
+    def parallel_evaluations(self) -> int:
+        """ Number of evaluations that used fitness evaluated ahead by population evaluator.
+        """
+
+        return self._parallel_evaluations
+
+    @property
+    def elapsed(self) -> float:
+        """ Seconds since start of run.
+        """
+
+        return perf_counter() - self._start_time
+
+    @property
+    def stop_reason(self) -> str:
+        """ Condition that stopped the run, StopEvaluations if it used all evaluations, otherwise empty string.
+        """
+
+        if self._stop_reason is not None:
+            return self._stop_reason
+
+        return BudgetTask.StopEvaluations if self.Evals >= self.nFES else ''
+
+    def budget_exhausted(self) -> bool:
+        return self._time_budget is not None and self.elapsed >= self._time_budget
+
+    def stagnated(self) -> bool:
+        return self._stagnation_evals is not None and self.Evals - self._improved_at >= self._stagnation_evals
+
+    def start(self):
+        super().start()
+        self._start_time = perf_counter()
+
+    def stopCond(self):
+        return super().stopCond() or self._stopped()
+
+    def stopCondE(self):
+        super().stopCondE()
+
+        if self._stopped():
+            if self._stop_reason == BudgetTask.StopTimeBudget:
+                raise TimeException()
+            raise StagnationException()
+
+    def eval(self, A):
+        if self._population_evaluator is not None and self._is_first_row(A) and not self.stopCond():
+            self._evaluate_ahead(A.base)
+
+        fitness = super().eval(A)
+
+        # NiaPy keeps evaluated array as best solution, algorithms that evaluate rows of their population in place
+        # (e.g. BatAlgorithm, GreyWolfOptimizer) change it later.
+        if self.x is A:
+            self.x = np.copy(A)
+
+        if self._reference_fitness is None or fitness < self._reference_fitness - self._stagnation_epsilon:
+            self._reference_fitness = fitness
+            self._improved_at = self.Evals
+
+        return fitness
+
+    def close(self):
+        """Releases worker processes of population evaluator.
+        """
+
+        if self._population_evaluator is not None:
+            self._population_evaluator.close()
+
+    def _stopped(self) -> bool:
+        if self.budget_exhausted():
+            self._stop_reason = BudgetTask.StopTimeBudget
+        elif self.stagnated():
+            self._stop_reason = BudgetTask.StopStagnation
+
+        return self._stop_reason is not None
+
+    def _is_first_row(self, solution: np.ndarray) -> bool:
+        population = getattr(solution, 'base', None)
+
+        return isinstance(solution, np.ndarray) and isinstance(population, np.ndarray) and population.ndim == 2 \
+            and population.shape[1] == self.D and solution.shape == (self.D,) \
+            and solution.strides == population.strides[1:] \
+            and solution.__array_interface__['data'][0] == population.__array_interface__['data'][0]
+
+    def _evaluate_ahead(self, population: np.ndarray):
+        # Rows past the evaluation limit are never evaluated, eval raises before reaching them.
+        rows = population[:max(self.nFES - self.Evals, 0)]
+
+        if len(rows) < 2:
+            return
+
+        fitness = self._population_evaluator.evaluate(rows)
+        self._evaluated_ahead = {row.tobytes(): value for row, value in zip(rows, fitness)}
+
+    def _evaluated_fitness(self, d: int, solution: np.ndarray) -> float:
+        fitness = self._evaluated_ahead.get(np.asarray(solution).tobytes())
+
+        if fitness is None:
+            return self._function(d, solution)
+
+        self._parallel_evaluations += 1
+        return self.benchmark.add_evaluated(fitness)
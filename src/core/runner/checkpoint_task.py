@@ -0,0 +1,218 @@
+import os
+from time import perf_counter
+
+import numpy as np
+
+from src.core.runner.budget_task import BudgetTask
+from src.model.checkpoint import Checkpoint
+
+
+class CheckpointTask(BudgetTask):
+    """ NiaPy task that periodically writes checkpoint of the run it evaluates.
+
+    NiaPy algorithms keep their population in local variables of runTask, so the task keeps the most recent population
+    size evaluations instead and writes them together with evaluation counter, best solution and state of algorithm
+    random generator, see track_random.
+    """
+
+    def __init__(self, checkpoint_path: str, np_size: int, every_evals: int = 0, every_seconds: float = 0.0,
+                 **kwargs):
+        """
+        Args:
+            checkpoint_path: Path to checkpoint file, replaced atomically by every new checkpoint.
+            np_size: Population size of algorithm.
+            every_evals: Checkpoint after this many evaluations, 0 disables the interval.
+            every_seconds: Checkpoint after this many seconds, 0 disables the interval.
+            kwargs: BudgetTask arguments.
+        """
+
+        super().__init__(**kwargs)
+        self._checkpoint_path:      str = checkpoint_path
+        self._every_evals:          int = every_evals
+        self._every_seconds:        float = every_seconds
+        self._population:           np.ndarray = np.empty((np_size, self.D))
+        self._population_fitness:   np.ndarray = np.empty(np_size)
+        self._filled:               int = 0
+        self._last_evals:           int = 0
+        self._last_time:            float = perf_counter()
+        self._random:               np.random.RandomState = None
+
+    def track_random(self, random_state: np.random.RandomState):
+        """ Sets random generator of algorithm, its state is written with every checkpoint.
+
+        Args:
+            random_state: Random generator of algorithm.
+        """
+
+        self._random = random_state
+
+    def restore(self, checkpoint: Checkpoint):
+        """ Continues evaluation counter, best solution and convergence trace of checkpoint.
+
+        Args:
+            checkpoint: Checkpoint of previous run.
+        """
+
+        self.Evals, self.Iters = checkpoint.evaluations, checkpoint.iterations
+        self._last_evals = checkpoint.evaluations
+        self._improved_at = checkpoint.evaluations
+
+        if checkpoint.best_solution is not None:
+            self.x, self.x_f = checkpoint.best_solution, checkpoint.best_fitness
+
+        self.benchmark.restore(checkpoint.evaluations,
+                               None if checkpoint.best_solution is None else checkpoint.best_fitness)
+
+    def eval(self, A):
+        fitness = super().eval(A)
+
+        # Ring buffer of the most recent population size evaluations.
+        row = (self.Evals - 1) % len(self._population)
+        self._population[row] = A
+        self._population_fitness[row] = fitness
+        self._filled = min(self._filled + 1, len(self._population))
+
+        if (0 < self._every_evals <= self.Evals - self._last_evals) or \
+                (0 < self._every_seconds <= perf_counter() - self._last_time):
+            self.write_checkpoint()
+
+        return fitness
+
+    def write_checkpoint(self):
+        """ Writes current state to checkpoint file.
+        """
+
+        # Reorder ring buffer oldest first.
+        rows = np.arange(self.Evals - self._filled, self.Evals) % len(self._population)
+
+        save_checkpoint(self._checkpoint_path, Checkpoint(
+            evaluations=self.Evals,
+            iterations=self.Iters,
+            best_solution=None if self.x is None else np.asarray(self.x),
+            best_fitness=float(self.x_f),
+            population=self._population[rows],
+            population_fitness=self._population_fitness[rows],
+            random_state=None if self._random is None else self._random.get_state()
+        ))
+
+        self._last_evals = self.Evals
+        self._last_time = perf_counter()
+
+
+class ResumeRandomState(np.random.RandomState):
+    """ Random generator that continues from checkpointed state and hands out checkpointed population as the draws
+    NiaPy algorithms initialize their population with.
+
+    Algorithms draw initial population either at once, as rand or uniform draw of shape (NP, D), or one solution at a
+    time, as a run of rand(D) draws (GA, ABC). Checkpointed solutions replace the rows of the first such draw or the
+    draws of that run. Any other non-empty draw ends the initialization, unused solutions are dropped so they never
+    leak into later draws of the algorithm.
+    """
+
+    def __init__(self, checkpoint: Checkpoint, np_size: int, skip_draws: int = 0):
+        """
+        Args:
+            checkpoint: Checkpoint of previous run.
+            np_size: Population size of algorithm.
+            skip_draws: Single solution draws algorithm makes before its population, they stay random.
+        """
+
+        super().__init__()
+
+        if checkpoint.random_state is not None:
+            self.set_state(checkpoint.random_state)
+
+        # Best solution goes first, so it survives into the new population.
+        population = checkpoint.population[np.argsort(checkpoint.population_fitness, kind='stable')]
+        if checkpoint.best_solution is not None:
+            population = np.vstack([checkpoint.best_solution, population])[:max(len(population), 1)]
+
+        self._np_size:      int = np_size
+        self._dimension:    int = population.shape[1]
+        self._skip_draws:   int = skip_draws
+        self._population:   list = list(population[:np_size])
+
+    def rand(self, *args):
+        return self._resume(super().rand(*args))
+
+    def uniform(self, low=0.0, high=1.0, size=None):
+        return self._resume(super().uniform(low, high, size))
+
+    def _resume(self, draws):
+        shape = np.shape(draws)
+
+        if not self._population or 0 in shape:
+            return draws
+
+        if shape == (self._np_size, self._dimension):
+            rows = min(self._np_size, len(self._population))
+            draws[:rows] = self._population[:rows]
+            self._population = []
+        elif shape == (self._dimension,) and self._skip_draws > 0:
+            self._skip_draws -= 1
+        elif shape == (self._dimension,):
+            draws = self._population.pop(0).copy()
+        else:
+            self._population = []
+
+        return draws
+
+
+def save_checkpoint(path: str, checkpoint: Checkpoint):
+    """ Writes checkpoint to .npz file, readers see either previous or new checkpoint, never a partial one.
+
+    Args:
+        path: Path to checkpoint file.
+        checkpoint: Checkpoint to write.
+    """
+
+    arrays = {
+        'counters': np.array([checkpoint.evaluations, checkpoint.iterations], dtype=np.int64),
+        'best_fitness': np.array(checkpoint.best_fitness, dtype=np.float64),
+        'population': checkpoint.population,
+        'population_fitness': checkpoint.population_fitness
+    }
+
+    if checkpoint.best_solution is not None:
+        arrays['best_solution'] = checkpoint.best_solution
+
+    if checkpoint.random_state is not None:
+        name, keys, pos, has_gauss, cached_gaussian = checkpoint.random_state
+        arrays['random_keys'] = keys
+        arrays['random_scalars'] = np.array([pos, has_gauss, cached_gaussian], dtype=np.float64)
+
+    tmp_path = path + '.tmp'
+
+    with open(tmp_path, 'wb') as file:
+        np.savez(file, **arrays)
+        file.flush()
+        os.fsync(file.fileno())
+
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str) -> Checkpoint:
+    """ Reads checkpoint written by save_checkpoint.
+
+    Args:
+        path: Path to checkpoint file.
+
+    Returns: Checkpoint.
+    """
+
+    with np.load(path) as data:
+        random_state = None
+
+        if 'random_keys' in data:
+            pos, has_gauss, cached_gaussian = data['random_scalars']
+            random_state = ('MT19937', data['random_keys'], int(pos), int(has_gauss), float(cached_gaussian))
+
+        return Checkpoint(
+            evaluations=int(data['counters'][0]),
+            iterations=int(data['counters'][1]),
+            best_solution=data['best_solution'] if 'best_solution' in data else None,
+            best_fitness=float(data['best_fitness']),
+            population=data['population'],
+            population_fitness=data['population_fitness'],
+            random_state=random_state
+        )
@@ -0,0 +1,69 @@
+import multiprocessing
+from multiprocessing.pool import Pool as ProcessPool
+
+import numpy as np
+
+from src.core.benchmark.evaluator_registry import evaluator_type
+from src.model.dataset import Dataset
+
+# Fitness function of pool worker process, set once by _init_worker so only solutions and fitness values are sent.
+_worker_function = None
+
+# Worker processes are started by a fork server (spawned where it is not available), never forked from the thread that
+# creates the pool, so pools can be created from threads of thread executor.
+_context = multiprocessing.get_context('forkserver' if 'forkserver' in multiprocessing.get_all_start_methods()
+                                       else 'spawn')
+
+
+class ParallelEvaluator:
+    """ Evaluates solutions of one algorithm on a pool of worker processes, each with its own evaluator of the dataset.
+
+    Evaluators of workers do not share cache or early abort cutoff with evaluator of the task, so early abort must not
+    be enabled, see build_algorithm.
+    """
+
+    def __init__(self, dataset: Dataset, evaluator: str, evaluator_kwargs: dict, workers: int):
+        """
+        Args:
+            dataset: Dataset of simulation, sent once per worker process (as descriptor if published in shared memory).
+            evaluator: Name of fitness evaluator backend.
+            evaluator_kwargs: Keyword arguments of evaluator constructor (dataset excluded).
+            workers: Number of worker processes.
+        """
+
+        self._workers:  int = workers
+        self._pool:     ProcessPool = _context.Pool(processes=workers, initializer=_init_worker,
+                                                    initargs=(dataset, evaluator, evaluator_kwargs))
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def evaluate(self, solutions: np.ndarray) -> list:
+        """Evaluates solutions in parallel, nothing is recorded by evaluator of the task.
+
+        Args:
+            solutions: Solutions, one per row.
+
+        Returns: Fitness of each solution.
+        """
+
+        chunks = np.array_split(solutions, min(self._workers, len(solutions)))
+
+        return [value for chunk in self._pool.map(_evaluate_rows, chunks) for value in chunk]
+
+    def close(self):
+        """Stops worker processes.
+        """
+
+        self._pool.close()
+        self._pool.join()
+
+
+def _init_worker(dataset: Dataset, evaluator: str, evaluator_kwargs: dict):
+    global _worker_function
+    _worker_function = evaluator_type(evaluator)(dataset=dataset, **evaluator_kwargs).function()
+
+
+def _evaluate_rows(rows: np.ndarray) -> list:
+    return [_worker_function(len(row), row) for row in rows]
@@ -1,17 +1,27 @@
 import timeit
 
+from src.core.runner.budget_task import BudgetTask
+from src.core.runner.checkpoint_task import CheckpointTask
+from src.core.simulation.algorithm_factory import build_algorithm
+from src.model.algorithm_spec import AlgorithmSpec
+from src.model.dataset import Dataset
 from src.model.simulation_result import OptimizationResult
 from src.model.simulation_run_info import SimulationRunInfo
 
+# Dataset of worker process, set once by init_worker so it is not sent with every task.
+_worker_dataset: Dataset = None
+
 
 class Runner:
 
     @staticmethod
-    def run(alg_obj) -> SimulationRunInfo:
+    def run(alg_obj, seed: int = None, repeat: int = 0) -> SimulationRunInfo:
         """Starts optimization with the genetic algorithm.
 
         Args:
             alg_obj: Genetic algorithm object.
+            seed: Random seed alg_obj was created with, recorded in run info.
+            repeat: Index of run among repeated runs of the same algorithm, recorded in run info.
 
         Returns: SimulationRunInfo obj containing info about optimization run.
         """
@@ -21,6 +31,14 @@ class Runner:
             best_solution, best_fitness = alg_obj.run()
             end_t = timeit.default_timer()
 
+            # Algorithm may return a row of its population that changed after it was evaluated, task keeps a copy.
+            if isinstance(alg_obj.task, BudgetTask) and alg_obj.task.x is not None:
+                best_solution, best_fitness = alg_obj.task.x, alg_obj.task.x_f
+
+            # Final checkpoint, resuming a finished run returns its result without further evaluations.
+            if isinstance(alg_obj.task, CheckpointTask):
+                alg_obj.task.write_checkpoint()
+
             return SimulationRunInfo(
                 completed=True,
                 has_error=False,
@@ -32,20 +50,80 @@ class Runner:
                     best_solution=best_solution,
                     np=alg_obj.NP,
                     n_fes=alg_obj.task.nFES
-                )
+                ),
+                cache_stats=getattr(alg_obj.task.benchmark, 'cache_stats', None),
+                evaluator=getattr(alg_obj.task.benchmark, 'Name', ''),
+                prefix_stats=getattr(alg_obj.task.benchmark, 'prefix_stats', None),
+                profile=getattr(alg_obj.task.benchmark, 'profile', None),
+                seed=seed,
+                repeat=repeat,
+                evaluations=alg_obj.task.Evals,
+                convergence=getattr(alg_obj.task.benchmark, 'convergence', None),
+                stop_reason=getattr(alg_obj.task, 'stop_reason', '')
             )
 
         except Exception as e:
-            return SimulationRunInfo(
-                completed=False,
-                has_error=True,
-                error_msg='{0}: {1}'.format(type(alg_obj).__name__, str(e)),
-                execution_time=-1,
-                result=OptimizationResult(
-                    algorithm_title='',
-                    best_fitness=0,
-                    best_solution=[],
-                    np=0,
-                    n_fes=0
-                )
-            )
+            return Runner.error_info(type(alg_obj).__name__, e, seed, repeat)
+
+        finally:
+            if isinstance(alg_obj.task, BudgetTask):
+                alg_obj.task.close()
+
+    @staticmethod
+    def run_spec(spec: AlgorithmSpec, dataset: Dataset) -> SimulationRunInfo:
+        """Builds algorithm described by spec and starts optimization with it.
+
+        Args:
+            spec: Description of optimization run.
+            dataset: Dataset of simulation.
+
+        Returns: SimulationRunInfo obj containing info about optimization run.
+        """
+
+        try:
+            alg_obj = build_algorithm(spec, dataset)
+        except Exception as e:
+            return Runner.error_info(spec.name, e, spec.seed, spec.repeat)
+
+        return Runner.run(alg_obj, spec.seed, spec.repeat)
+
+    @staticmethod
+    def error_info(title: str, error: Exception, seed: int, repeat: int) -> SimulationRunInfo:
+        return SimulationRunInfo(
+            completed=False,
+            has_error=True,
+            error_msg='{0}: {1}'.format(title, str(error)),
+            execution_time=-1,
+            result=OptimizationResult(
+                algorithm_title=title,
+                best_fitness=0,
+                best_solution=[],
+                np=0,
+                n_fes=0
+            ),
+            seed=seed,
+            repeat=repeat
+        )
+
+
+def init_worker(dataset: Dataset):
+    """Initializes worker process of process pool.
+
+    Args:
+        dataset: Dataset of simulation.
+    """
+
+    global _worker_dataset
+    _worker_dataset = dataset
+
+
+def run_in_worker(spec: AlgorithmSpec) -> SimulationRunInfo:
+    """Runs optimization described by spec in worker process, see init_worker.
+
+    Args:
+        spec: Description of optimization run.
+
+    Returns: SimulationRunInfo obj containing info about optimization run.
+    """
+
+    return Runner.run_spec(spec, _worker_dataset)
@@ -0,0 +1,92 @@
+from NiaPy.algorithms.algorithm import Algorithm
+from NiaPy.util import OptimizationType
+
+# NiaPy algorithms
+from NiaPy.algorithms.basic import *
+from NiaPy.algorithms.modified import *
+from NiaPy.algorithms.other import *
+
+import os
+
+from src.core.benchmark.evaluator_registry import evaluator_type
+from src.core.runner.budget_task import BudgetTask
+from src.core.runner.checkpoint_task import CheckpointTask, ResumeRandomState, load_checkpoint
+from src.core.runner.parallel_evaluator import ParallelEvaluator
+from src.core.simulation.simulation_errors import InvalidAlgorithmName
+from src.model.algorithm_spec import AlgorithmSpec
+from src.model.dataset import Dataset
+
+# Single solution draws algorithms make before drawing their population, ABC draws a placeholder of its best solution.
+LEADING_DRAWS = {
+    'ArtificialBeeColonyAlgorithm': 1
+}
+
+# Algorithms that evaluate their whole population unchanged every generation. Others change solutions between
+# evaluating the population and evaluating each solution, or evaluate one solution at a time, so eval workers would
+# only evaluate solutions that are evaluated again.
+POPULATION_ALGORITHMS = (
+    'ParticleSwarmAlgorithm',
+    'GravitationalSearchAlgorithm',
+    'SineCosineAlgorithm'
+)
+
+
+def algorithm_type(name: str) -> type:
+    """Returns NiaPy algorithm class with given name. Throws InvalidAlgorithmName if there is none.
+
+    Args:
+        name: Algorithm class name.
+
+    Returns: Algorithm class.
+    """
+
+    alg_type = globals().get(str(name))
+
+    if not isinstance(alg_type, type) or not issubclass(alg_type, Algorithm):
+        raise InvalidAlgorithmName('Invalid algorithm name "{0}"'.format(name))
+
+    return alg_type
+
+
+def build_algorithm(spec: AlgorithmSpec, dataset: Dataset) -> Algorithm:
+    """Builds algorithm object with its own task and fitness evaluator. If spec has checkpoint options, task writes
+    checkpoints and run continues from resume checkpoint if it exists. With more than one eval worker, task of
+    POPULATION_ALGORITHMS evaluates populations on a process pool, task.close releases it. Workers can not share early
+    abort cutoff of the evaluator, so with early abort enabled populations are evaluated serially.
+
+    Args:
+        spec: Description of optimization run.
+        dataset: Dataset of simulation.
+
+    Returns: Algorithm object, ready to run.
+    """
+
+    benchmark = evaluator_type(spec.evaluator)(dataset=dataset, **spec.evaluator_kwargs)
+
+    if spec.instrumentation:
+        benchmark.enable_instrumentation()
+
+    task_kwargs = dict(D=dataset.total_packages, nFES=spec.n_fes, benchmark=benchmark,
+                       optType=OptimizationType.MINIMIZATION, time_budget=spec.time_budget,
+                       stagnation_evals=spec.stagnation_evals, stagnation_epsilon=spec.stagnation_epsilon)
+
+    if spec.eval_workers > 1 and spec.name in POPULATION_ALGORITHMS and \
+            not spec.evaluator_kwargs.get('early_abort', False):
+        task_kwargs['population_evaluator'] = ParallelEvaluator(dataset, spec.evaluator, spec.evaluator_kwargs,
+                                                                spec.eval_workers)
+
+    if spec.checkpoint is None:
+        return algorithm_type(spec.name)(seed=spec.seed, task=BudgetTask(**task_kwargs), NP=spec.np)
+
+    task = CheckpointTask(checkpoint_path=spec.checkpoint.path, np_size=spec.np,
+                          every_evals=spec.checkpoint.every_evals, every_seconds=spec.checkpoint.every_seconds,
+                          **task_kwargs)
+    alg_obj = algorithm_type(spec.name)(seed=spec.seed, task=task, NP=spec.np)
+
+    if spec.checkpoint.resume_path is not None and os.path.isfile(spec.checkpoint.resume_path):
+        checkpoint = load_checkpoint(spec.checkpoint.resume_path)
+        alg_obj.Rand = ResumeRandomState(checkpoint, spec.np, LEADING_DRAWS.get(spec.name, 0))
+        task.restore(checkpoint)
+
+    task.track_random(alg_obj.Rand)
+    return alg_obj
@@ -0,0 +1,118 @@
+import heapq
+import json
+import os
+
+from src.model.algorithm_spec import AlgorithmSpec
+
+
+class RunHistory:
+    """ Local history of run times per algorithm and dataset size, used to start the longest runs first.
+
+    History is a small JSON file with seconds per evaluation of each algorithm and dataset size (number of packages),
+    updated as exponential moving average after every simulation.
+    """
+
+    # Weight of the newest run in moving average.
+    Smoothing: float = 0.5
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Path to history file, created on first save.
+        """
+
+        self._path:     str = path
+        self._rates:    dict = {}
+
+        if os.path.isfile(path):
+            try:
+                with open(path, 'r') as file:
+                    self._rates = {name: {int(size): float(rate) for size, rate in sizes.items()}
+                                   for name, sizes in json.load(file).items()}
+            except (ValueError, AttributeError, TypeError):
+                self._rates = {}
+
+    def expected_time(self, spec: AlgorithmSpec, packages: int) -> float:
+        """ Estimates run time of spec on dataset with given number of packages.
+
+        Args:
+            spec: Description of optimization run.
+            packages: Number of packages of dataset.
+
+        Returns: Expected seconds, None if algorithm has no history.
+        """
+
+        sizes = self._rates.get(spec.name)
+
+        if not sizes:
+            return None
+
+        # Closest recorded dataset size, time per evaluation grows roughly linearly with number of packages.
+        size = min(sizes, key=lambda recorded: abs(recorded - packages))
+        return sizes[size] * spec.n_fes * packages / size
+
+    def order(self, specs: list, packages: int) -> list:
+        """ Orders specs longest expected run first, algorithms without history are expected to take the average.
+
+        Args:
+            specs: Descriptions of optimization runs.
+            packages: Number of packages of dataset.
+
+        Returns: A list of (spec, expected seconds), longest first, ties keep their order.
+        """
+
+        expected = [self.expected_time(spec, packages) for spec in specs]
+        known = [seconds for seconds in expected if seconds is not None]
+        default = sum(known) / len(known) if known else 0.0
+        expected = [default if seconds is None else seconds for seconds in expected]
+
+        return sorted(zip(specs, expected), key=lambda item: -item[1])
+
+    def update(self, name: str, packages: int, seconds: float, evaluations: int):
+        """ Adds finished run to history.
+
+        Args:
+            name: Algorithm name.
+            packages: Number of packages of dataset.
+            seconds: Run time.
+            evaluations: Number of evaluations run completed.
+        """
+
+        if evaluations < 1 or seconds < 0:
+            return
+
+        rate = seconds / evaluations
+        sizes = self._rates.setdefault(name, {})
+        previous = sizes.get(packages)
+        sizes[packages] = rate if previous is None else \
+            RunHistory.Smoothing * rate + (1 - RunHistory.Smoothing) * previous
+
+    def save(self):
+        """ Writes history file.
+        """
+
+        tmp_path = self._path + '.tmp'
+
+        with open(tmp_path, 'w') as file:
+            json.dump({name: {str(size): rate for size, rate in sizes.items()} for name, sizes in self._rates.items()},
+                      file, indent=2, sort_keys=True)
+
+        os.replace(tmp_path, self._path)
+
+
+def makespan(durations: list, workers: int) -> float:
+    """ Time until all jobs finish when each free worker takes the next job in given order.
+
+    Args:
+        durations: Job durations in order they are handed out.
+        workers: Number of workers.
+
+    Returns: Makespan.
+    """
+
+    finish_times = [0.0] * max(min(workers, len(durations)), 1)
+
+    for duration in durations:
+        heapq.heapreplace(finish_times, finish_times[0] + duration)
+
+    return max(finish_times)
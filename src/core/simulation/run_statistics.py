@@ -0,0 +1,64 @@
+import statistics
+
+from src.model.algorithm_stats import AlgorithmStats
+
+
+def aggregate_results(simulation_results: list) -> list:
+    """Groups run infos by algorithm and computes aggregates of each group.
+
+    Args:
+        simulation_results: A list of simulation run infos.
+
+    Returns: A list of AlgorithmStats, in order of first appearance of algorithm in simulation_results.
+    """
+
+    groups = {}
+
+    for run_result in simulation_results:
+        groups.setdefault(run_result.result.algorithm_title, []).append(run_result)
+
+    return [_algorithm_stats(title, runs) for title, runs in groups.items()]
+
+
+def has_repeats(simulation_results: list) -> bool:
+    """Checks if any algorithm was run more than once.
+
+    Args:
+        simulation_results: A list of simulation run infos.
+
+    Returns: True if some algorithm title occurs more than once.
+    """
+
+    titles = [run_result.result.algorithm_title for run_result in simulation_results]
+    return len(set(titles)) < len(titles)
+
+
+def _algorithm_stats(title: str, runs: list) -> AlgorithmStats:
+    successful = [run_result for run_result in runs if not run_result.has_error]
+    fitness = [run_result.result.best_fitness for run_result in successful]
+    times = [run_result.execution_time for run_result in successful]
+
+    return AlgorithmStats(
+        algorithm_title=title,
+        runs=len(runs),
+        failed=len(runs) - len(successful),
+        fitness_mean=_mean(fitness),
+        fitness_median=_median(fitness),
+        fitness_std=_std(fitness),
+        time_mean=_mean(times),
+        time_median=_median(times),
+        time_std=_std(times),
+        best_run=min(successful, key=lambda run_result: run_result.result.best_fitness) if successful else None
+    )
+
+
+def _mean(values: list) -> float:
+    return float(statistics.mean(values)) if values else 0.0
+
+
+def _median(values: list) -> float:
+    return float(statistics.median(values)) if values else 0.0
+
+
+def _std(values: list) -> float:
+    return float(statistics.stdev(values)) if len(values) > 1 else 0.0
@@ -1,12 +1,7 @@
 import os
-from datetime import datetime
+import threading
 
-from NiaPy.util import Task, OptimizationType
-
-# NiaPy algorithms
-from NiaPy.algorithms.basic import *
-from NiaPy.algorithms.modified import *
-from NiaPy.algorithms.other import *
+from numpy.random import SeedSequence
 
 # Output options
 from src.model.output_opt_config import OutputOptionConfig
@@ -14,18 +9,31 @@ from src.output_option.output_option import OutputOptionInterface
 from src.output_option.console_output import ConsoleOutputOption
 from src.output_option.txt_output import TextOutputOption
 from src.output_option.graph_output import GraphOutputOption
+from src.output_option.convergence_output import ConvergenceOutputOption
 from src.output_option.gif_output import GifOutputOption
 
-from src.core.runner.runner import Runner
+from src.core.distributed.coordinator import Coordinator
+from src.core.runner.runner import Runner, init_worker, run_in_worker
+from src.core.simulation.algorithm_factory import algorithm_type
+from src.core.simulation.run_history import RunHistory, makespan
 from src.core.simulation.simulation_errors import InvalidAlgorithmName, InvalidSaveOptionName, \
     InvalidSimulationInitialState
 from src.logger.logger import Logger
+from src.model.algorithm_spec import AlgorithmSpec
+from src.model.checkpoint_options import CheckpointOptions
 from src.model.dataset import Dataset
+from src.model.simulation_run_info import SimulationRunInfo
 from src.model.sort_attribute import SortAttribute
 from src.core.benchmark.benchmark import BenchmarkC
-from multiprocessing.pool import ThreadPool as Pool
+from src.core.benchmark.evaluator_registry import evaluator_type, check_evaluator_options
+from multiprocessing.pool import ThreadPool
+from multiprocessing import Pool as ProcessPool
 
-import random
+# Shared memory is available on Python 3.8+, datasets are pickled to worker processes otherwise.
+try:
+    from src.dataset.shared.shared_dataset import SharedDataset
+except ImportError:
+    SharedDataset = None
 
 
 class Simulation:
@@ -33,16 +41,63 @@ class Simulation:
     This class is responsible to run genetic algorithms simulation. It's limited to n_fes and np parameters.
     """
 
-    def __init__(self, dataset: Dataset, n_fes: int, np: int, save_to_dir: str):
+    def __init__(self, dataset: Dataset, n_fes: int, np: int, save_to_dir: str, cache_size: int = 0,
+                 cache_canonicalize: bool = False, evaluator: str = BenchmarkC.Name, early_abort: bool = False,
+                 evaluator_options: dict = None, instrumentation: bool = False, executor: str = 'thread',
+                 workers: int = None, repeats: int = 1, seed: int = None, checkpoint_evals: int = 0,
+                 checkpoint_seconds: float = 0.0, resume_dir: str = None, time_budget: float = None,
+                 time_budgets: dict = None, stagnation_evals: int = None, stagnation_epsilon: float = 0.0,
+                 stagnation_per_algorithm: dict = None, history_path: str = None, coordinator_host: str = '127.0.0.1',
+                 coordinator_port: int = 5555, eval_workers: int = 1, job_timeout: float = None,
+                 heartbeat_timeout: float = 30.0, idle_timeout: float = 300.0):
         """
         Args:
             dataset: Dataset of simulation.
             n_fes Total number of evaluations.
             np: Population size.
             save_to_dir: Path to directory where simulation results will be stored.
+            cache_size: Size of fitness cache of each algorithm, 0 disables the cache.
+            cache_canonicalize: Share cache entries between plans that differ only in column labels.
+            evaluator: Name of fitness evaluator backend, throws InvalidEvaluatorName if not available.
+            early_abort: Stop evaluations that can not beat best fitness found so far, such solutions get a lower
+                bound of their fitness instead of the exact value. Reported best fitness stays exact, but algorithms
+                that compare solutions with personal or parent bests may keep a solution for its bound, see README.
+            evaluator_options: Evaluator specific keyword arguments, throws InvalidEvaluatorOptions if evaluator does
+                not accept one of them.
+            instrumentation: Collect evaluation counters and stage times of each algorithm.
+            executor: Runs algorithms in threads ("thread"), in worker processes ("process") or serves them to worker
+                processes connected over TCP ("distributed"), see Worker.
+            workers: Number of threads or worker processes, number of CPUs if None. With "distributed" executor used
+                only to report makespan.
+            repeats: Number of independent runs of each algorithm.
+            seed: Base seed, every run gets its own seed stream spawned from it. Drawn from OS entropy if None, the
+                drawn value is logged so the simulation can be reproduced.
+            checkpoint_evals: Checkpoint each run after this many evaluations, 0 disables the interval.
+            checkpoint_seconds: Checkpoint each run after this many seconds, 0 disables the interval.
+            resume_dir: Checkpoint dir of previous simulation, runs continue from their checkpoints found there.
+            time_budget: Wall-clock budget of each run in seconds, None for no budget. Run stops at n_fes evaluations
+                or when budget runs out, whichever comes first.
+            time_budgets: Budgets of specific algorithms by name, override time_budget.
+            stagnation_evals: Stop run once best fitness did not improve by more than stagnation_epsilon in this many
+                evaluations, None disables it. Freed worker takes the next waiting run.
+            stagnation_epsilon: Smallest improvement of best fitness that counts.
+            stagnation_per_algorithm: Stagnation settings of specific algorithms by name, dicts with "evaluations"
+                and "epsilon" keys, override stagnation_evals and stagnation_epsilon.
+            history_path: Path to file with run times of previous simulations, runs expected to take longest are
+                started first and the file is updated with new run times. None keeps configured order.
+            coordinator_host: Address "distributed" executor listens on.
+            coordinator_port: Port "distributed" executor listens on.
+            eval_workers: Number of worker processes that evaluate populations of each run, 1 evaluates serially.
+                Used by algorithms that evaluate their whole population unchanged every generation (see
+                POPULATION_ALGORITHMS), others evaluate serially. Available with "thread" and "distributed"
+                executors, not with "process" executor or early abort.
+            job_timeout: Seconds a "distributed" worker may run one job before it is retried, None for no limit.
+            heartbeat_timeout: Seconds a "distributed" worker running a job may stay silent before it is retried, None
+                for no limit.
+            idle_timeout: Seconds "distributed" executor waits while no worker connects or reports before simulation
+                fails with NoActiveWorkers, None waits forever.
         """
 
-        random.seed(n_fes + np + datetime.now().second)
         self.logger = Logger(self.__class__.__name__)
 
         self.n_fes = n_fes
@@ -54,8 +109,68 @@ class Simulation:
         self._dataset: Dataset = dataset
         self.logger.console_log('dataset {0}'.format(dataset.title))
 
+        self.cache_size = cache_size
+        self.cache_canonicalize = cache_canonicalize
+        self.logger.console_log('fitness cache size set to {0}'.format(cache_size))
+
+        self._evaluator_type = evaluator_type(evaluator)
+        check_evaluator_options(evaluator, evaluator_options)
+        self._evaluator_options: dict = evaluator_options or {}
+        self.evaluator = evaluator
+        self.logger.console_log('evaluator set to {0}'.format(evaluator))
+
+        self.early_abort = early_abort
+        self.logger.console_log('early abort set to {0}'.format(early_abort))
+
+        self.instrumentation = instrumentation
+        self.logger.console_log('instrumentation set to {0}'.format(instrumentation))
+
+        self.executor = executor
+        self.workers = workers
+        self.logger.console_log('executor set to {0}, workers {1}'.format(executor, workers))
+
+        self._coordinator_address: tuple = (coordinator_host, coordinator_port)
+        self._job_timeout: float = job_timeout
+        self._heartbeat_timeout: float = heartbeat_timeout
+        self._idle_timeout: float = idle_timeout
+
+        self._eval_workers: int = eval_workers
+        self.logger.console_log('eval workers per run set to {0}'.format(eval_workers))
+
+        self.repeats = repeats
+        self._seed_sequence: SeedSequence = SeedSequence(seed)
+        self.logger.console_log('repeats set to {0}, base seed {1}'.format(repeats, self._seed_sequence.entropy))
+
+        self._checkpoint_evals: int = checkpoint_evals
+        self._checkpoint_seconds: float = checkpoint_seconds
+        self._resume_dir: str = resume_dir
+        self._checkpoint_dir: str = None
+
+        if checkpoint_evals > 0 or checkpoint_seconds > 0 or resume_dir is not None:
+            self._checkpoint_dir = os.path.join(save_to_dir, 'checkpoints')
+            self.logger.console_log('checkpoints every {0} evaluations, {1} seconds, resume from {2}'.format(
+                checkpoint_evals, checkpoint_seconds, resume_dir))
+
+        self._time_budget: float = time_budget
+        self._time_budgets: dict = time_budgets or {}
+
+        if time_budget is not None or self._time_budgets:
+            self.logger.console_log('time budget set to {0} s, per algorithm {1}'.format(time_budget,
+                                                                                         self._time_budgets))
+
+        self._stagnation: dict = {'evaluations': stagnation_evals, 'epsilon': stagnation_epsilon}
+        self._stagnation_per_algorithm: dict = stagnation_per_algorithm or {}
+
+        if stagnation_evals is not None or self._stagnation_per_algorithm:
+            self.logger.console_log('stagnation stop set to {0}, per algorithm {1}'.format(
+                self._stagnation, self._stagnation_per_algorithm))
+
+        self._history: RunHistory = None if history_path is None else RunHistory(history_path)
+        self.logger.console_log('run history {0}'.format(history_path))
+
         self._algorithms: list = []
         self._save_options: list = []
+        self._result_lock: threading.Lock = threading.Lock()
 
         self._save_option_kwargs = {
             'dir_path': save_to_dir,
@@ -63,7 +178,7 @@ class Simulation:
         }
 
     def add_algorithm(self, name: str) -> None:
-        """Adds new genetic algorithm to simulation.
+        """Adds new genetic algorithm to simulation, once per repeat.
 
         Args:
             name: A string representing algorithm name.
@@ -72,23 +187,31 @@ class Simulation:
         if name is None or len(name) < 1:
             raise InvalidAlgorithmName('Invalid algorithm name "{0}"'.format(name))
 
-        try:
-            alg_type = globals()[str(name)]
-            alg_obj = alg_type(seed=random.randint(1, 9999), task=Task(D=self._dataset.total_packages,
-                                                                       nFES=self.n_fes,
-                                                                       benchmark=BenchmarkC(dataset=self._dataset),
-                                                                       optType=OptimizationType.MINIMIZATION), NP=self.np)
-            self._algorithms.append(alg_obj)
-            self.logger.console_log('added algorithm {0}'.format(name))
-
-        except Exception:
-            raise InvalidAlgorithmName('Invalid algorithm name "{0}"'.format(name))
+        # Algorithm objects are built where they run, from picklable spec.
+        algorithm_type(name)
+        evaluator_kwargs = dict(cache_size=self.cache_size, canonicalize=self.cache_canonicalize,
+                                early_abort=self.early_abort, **self._evaluator_options)
+
+        stagnation = dict(self._stagnation, **self._stagnation_per_algorithm.get(name, {}))
+
+        # Spawned seed streams depend only on base seed and order of spawning, so runs are reproducible.
+        for repeat, seed_sequence in enumerate(self._seed_sequence.spawn(max(self.repeats, 1))):
+            self._algorithms.append(AlgorithmSpec(name=name, seed=int(seed_sequence.generate_state(1)[0]), np=self.np,
+                                                  n_fes=self.n_fes, evaluator=self.evaluator,
+                                                  evaluator_kwargs=evaluator_kwargs,
+                                                  instrumentation=self.instrumentation, repeat=repeat,
+                                                  checkpoint=self._checkpoint_options(name, repeat),
+                                                  time_budget=self._time_budgets.get(name, self._time_budget),
+                                                  stagnation_evals=stagnation['evaluations'],
+                                                  stagnation_epsilon=stagnation['epsilon'],
+                                                  eval_workers=self._eval_workers))
+        self.logger.console_log('added algorithm {0}'.format(name))
 
     def algorithms(self) -> list:
         """Returns all algorithm names in simulation.
         """
 
-        return [type(i).__name__ for i in self._algorithms]
+        return list(dict.fromkeys(spec.name for spec in self._algorithms))
 
     def add_save_option(self, config: OutputOptionConfig):
         """ Adds new simulation result save option.
@@ -121,7 +244,8 @@ class Simulation:
                                                                                               config.included_kwargs))
 
     def run(self, sort_by_best: SortAttribute) -> None:
-        """Starts simulation.
+        """Starts simulation. Output options get result of each run as soon as it finishes (on_result) and all results
+        sorted once every run finished (save).
 
         Args:
             sort_by_best: Results are ordered by this attribute, from best to worst.
@@ -132,13 +256,24 @@ class Simulation:
         self.logger.console_log('Validating state')
         self._validate_initial_state()
 
+        if self._checkpoint_dir is not None:
+            os.makedirs(self._checkpoint_dir, exist_ok=True)
+
+        specs = self._algorithms
+
+        if self._history is not None:
+            specs = [spec for spec, _ in self._history.order(specs, self._dataset.total_packages)]
+
         self.logger.console_log("Starting optimization tasks")
         self.logger.console_log("Waiting tasks")
 
-        pool = Pool()
-        opt_res = pool.map(Runner.run, self._algorithms)
-        pool.close()
-        pool.join()
+        if self.executor == 'distributed':
+            # Workers on other machines ask for the dataset once, each job carries only its spec and dataset hash.
+            coordinator = Coordinator(*self._coordinator_address, job_timeout=self._job_timeout,
+                                      heartbeat_timeout=self._heartbeat_timeout, idle_timeout=self._idle_timeout)
+            opt_res = coordinator.run(specs, self._dataset, on_result=self._on_result)
+        else:
+            opt_res = self._run_pool(specs)
 
         self.logger.console_log("Tasks finished")
 
@@ -155,8 +290,90 @@ class Simulation:
         for option in self._save_options:
             option.save(sorted_res)
 
+        # History only orders later simulations, results are saved first so they survive a failed history write.
+        if self._history is not None:
+            self._update_history(specs, opt_res)
+
         self.logger.console_log("Done, stopping execution")
 
+    def _run_pool(self, specs: list) -> list:
+        shared = None
+
+        # Worker processes attach to dataset published in shared memory instead of unpickling their own copy.
+        if SharedDataset is not None and (self.executor == 'process' or self._eval_workers > 1):
+            shared = SharedDataset(self._dataset)
+            self.logger.console_log('dataset published in shared memory {0}'.format(shared.descriptor.name))
+
+        dataset = self._dataset if shared is None else shared.dataset
+
+        try:
+            if self.executor == 'process':
+                # Dataset is sent once per worker process, each task carries only its spec. Runs are handed out one at
+                # a time, worker of a run that stopped early takes the next one.
+                pool = ProcessPool(processes=self.workers, initializer=init_worker, initargs=(dataset,))
+                results = pool.imap_unordered(run_in_worker, specs, chunksize=1)
+            else:
+                pool = ThreadPool(processes=self.workers)
+                results = pool.imap_unordered(lambda spec: Runner.run_spec(spec, dataset), specs, chunksize=1)
+
+            opt_res = []
+
+            # Results are streamed to output options in order runs finish.
+            for res_info in results:
+                opt_res.append(res_info)
+                self._on_result(res_info)
+
+            pool.close()
+            pool.join()
+
+        finally:
+            if shared is not None:
+                shared.close()
+
+        return opt_res
+
+    def _on_result(self, res_info: SimulationRunInfo):
+        # Coordinator reports results from its connection threads.
+        with self._result_lock:
+            for option in self._save_options:
+                try:
+                    option.on_result(res_info)
+                except Exception as error:
+                    # Streamed output is best effort, final save still gets every result.
+                    self.logger.console_log('{0} failed to output result: {1}'.format(type(option).__name__,
+                                                                                      error))
+
+    def _update_history(self, specs: list, opt_res: list):
+        durations = {(res_info.result.algorithm_title, res_info.repeat): max(res_info.execution_time, 0.0)
+                     for res_info in opt_res}
+        workers = self.workers or os.cpu_count() or 1
+
+        # Both orders are replayed with actual run times, so the difference is what ordering alone saved.
+        fifo = makespan([durations.get((spec.name, spec.repeat), 0.0) for spec in self._algorithms], workers)
+        ordered = makespan([durations.get((spec.name, spec.repeat), 0.0) for spec in specs], workers)
+        self.logger.console_log('longest-first makespan {0:.2f} s, configured order {1:.2f} s, saved {2:.2f} s'.format(
+            ordered, fifo, fifo - ordered))
+
+        for res_info in opt_res:
+            if not res_info.has_error:
+                self._history.update(res_info.result.algorithm_title, self._dataset.total_packages,
+                                     res_info.execution_time, res_info.evaluations)
+
+        try:
+            self._history.save()
+        except OSError as error:
+            self.logger.console_log('warning, run history not saved: {0}'.format(error))
+
+    def _checkpoint_options(self, name: str, repeat: int) -> CheckpointOptions:
+        if self._checkpoint_dir is None:
+            return None
+
+        file_name = '{0}_{1}.npz'.format(name, repeat)
+        return CheckpointOptions(path=os.path.join(self._checkpoint_dir, file_name),
+                                 every_evals=self._checkpoint_evals, every_seconds=self._checkpoint_seconds,
+                                 resume_path=None if self._resume_dir is None else
+                                 os.path.join(self._resume_dir, file_name))
+
     def _validate_initial_state(self):
         if len(self._algorithms) < 1:
             raise InvalidSimulationInitialState('Cannot start simulation with empty list of algorithms')
@@ -164,6 +381,45 @@ class Simulation:
         if len(self._save_options) < 1:
             raise InvalidSimulationInitialState('Cannot start simulation with empty list of save options')
 
+        if self.executor not in ('thread', 'process', 'distributed'):
+            raise InvalidSimulationInitialState('Cannot start simulation with executor "{0}"'.format(self.executor))
+
+        # Checkpoint paths are local to this machine.
+        if self.executor == 'distributed' and self._checkpoint_dir is not None:
+            raise InvalidSimulationInitialState('Cannot start distributed simulation with checkpoints')
+
+        if self.workers is not None and self.workers < 1:
+            raise InvalidSimulationInitialState('Cannot start simulation with less than 1 worker')
+
+        if (self._job_timeout is not None and self._job_timeout <= 0) or \
+                (self._heartbeat_timeout is not None and self._heartbeat_timeout <= 0) or \
+                (self._idle_timeout is not None and self._idle_timeout <= 0):
+            raise InvalidSimulationInitialState(
+                'Cannot start simulation with job, heartbeat or idle timeout of 0 or less')
+
+        if self._eval_workers < 1:
+            raise InvalidSimulationInitialState('Cannot start simulation with less than 1 eval worker')
+
+        # Worker processes of process pool are daemonic and can not start pools of their own.
+        if self._eval_workers > 1 and self.executor == 'process':
+            raise InvalidSimulationInitialState('Cannot start simulation with eval workers and "process" executor')
+
+        # Evaluators of eval workers do not share early abort cutoff, results would differ from serial evaluation.
+        if self._eval_workers > 1 and self.early_abort:
+            raise InvalidSimulationInitialState('Cannot start simulation with eval workers and early abort')
+
+        if self.repeats < 1:
+            raise InvalidSimulationInitialState('Cannot start simulation with repeats prop value less than 1')
+
+        if any(spec.time_budget is not None and spec.time_budget <= 0 for spec in self._algorithms):
+            raise InvalidSimulationInitialState('Cannot start simulation with time budget less or equal to 0')
+
+        if any(spec.stagnation_evals is not None and spec.stagnation_evals < 1 for spec in self._algorithms):
+            raise InvalidSimulationInitialState('Cannot start simulation with stagnation evaluations less than 1')
+
+        if self._resume_dir is not None and not os.path.isdir(self._resume_dir):
+            raise InvalidSimulationInitialState('Cannot start simulation with invalid resume dir path')
+
         if self.n_fes < 1:
             raise InvalidSimulationInitialState('Cannot start simulation with n_fes prop value less than 1')
 
@@ -176,10 +432,9 @@ class Simulation:
 
         stat_count = self._dataset.total_stations
 
-        for package in self._dataset.packages:
-            if package.station_in < 1 or package.station_out > stat_count \
-                    or not package.station_in < package.station_out:
-                raise InvalidSimulationInitialState('Cannot start simulation with invalid dataset')
+        if (self._dataset.station_in < 1).any() or (self._dataset.station_out > stat_count).any() \
+                or not (self._dataset.station_in < self._dataset.station_out).all():
+            raise InvalidSimulationInitialState('Cannot start simulation with invalid dataset')
 
         dir_path = self._save_option_kwargs['dir_path']
 
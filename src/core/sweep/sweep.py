@@ -0,0 +1,202 @@
+import csv
+import itertools
+import os
+import zlib
+from multiprocessing import Pool
+
+from numpy.random import SeedSequence
+
+from src.core.benchmark.evaluator_registry import BASE_OPTIONS, check_evaluator_options
+from src.core.runner.runner import Runner
+from src.core.simulation.algorithm_factory import algorithm_type
+from src.core.simulation.run_statistics import aggregate_results
+from src.core.sweep.sweep_errors import InvalidSweepConfig
+from src.core.sweep.sweep_journal import SweepJournal
+from src.dataset.reader.csv_reader import CSVDatasetReader
+from src.logger.logger import Logger
+from src.model.algorithm_spec import AlgorithmSpec
+from src.model.simulation_run_info import SimulationRunInfo
+from src.model.sweep_job import SweepJob, job_key
+
+# Datasets and evaluator settings of worker process, set once by _init_worker.
+_worker_datasets: dict = None
+_worker_settings: dict = None
+
+
+class Sweep:
+    """
+    Runs every combination of datasets, algorithms, n_fes and np values on a process pool. Finished jobs are written
+    to a journal, a sweep restarted with the same journal runs only the jobs that did not finish successfully. Journal
+    records base seed, evaluator settings and content hash of each dataset, a restarted sweep refuses the journal if
+    any of them changed, so results of different settings or dataset content are never mixed.
+    """
+
+    def __init__(self, datasets: list, algorithms: list, n_fes_values: list, np_values: list, journal_path: str,
+                 repeats: int = 1, seed: int = None, evaluator: str = 'reference', evaluator_kwargs: dict = None,
+                 instrumentation: bool = False, workers: int = None):
+        """
+        Args:
+            datasets: Paths to dataset .csv files.
+            algorithms: NiaPy algorithm class names.
+            n_fes_values: Total numbers of evaluations.
+            np_values: Population sizes.
+            journal_path: Path to journal file of finished jobs.
+            repeats: Number of independent runs of each combination.
+            seed: Base seed of job seeds. If None, base seed of existing journal is used, otherwise drawn from OS
+                entropy.
+            evaluator: Name of fitness evaluator backend, throws InvalidEvaluatorName if not available.
+            evaluator_kwargs: Keyword arguments of evaluator constructor (dataset excluded), throws
+                InvalidEvaluatorOptions if evaluator does not accept one of them.
+            instrumentation: Collect evaluation counters and stage times of each job.
+            workers: Number of worker processes, number of CPUs if None.
+        """
+
+        self.logger = Logger(self.__class__.__name__)
+
+        for name, values in [('datasets', datasets), ('algorithms', algorithms), ('n_fes', n_fes_values),
+                             ('np', np_values)]:
+            if values is None or len(values) < 1:
+                raise InvalidSweepConfig('Cannot start sweep with empty list of {0}'.format(name))
+
+        if any(value < 1 for value in list(n_fes_values) + list(np_values)) or repeats < 1:
+            raise InvalidSweepConfig('Cannot start sweep with n_fes, np or repeats value less than 1')
+
+        if workers is not None and workers < 1:
+            raise InvalidSweepConfig('Cannot start sweep with less than 1 worker')
+
+        for name in algorithms:
+            algorithm_type(name)
+
+        check_evaluator_options(evaluator, {key: value for key, value in (evaluator_kwargs or {}).items()
+                                            if key not in BASE_OPTIONS})
+
+        journal_dir = os.path.dirname(os.path.abspath(journal_path))
+
+        if not os.path.isdir(journal_dir):
+            raise InvalidSweepConfig('Invalid journal dir path {0}'.format(journal_dir))
+
+        self._datasets:     list = list(datasets)
+        self._algorithms:   list = list(algorithms)
+        self._n_fes_values: list = list(n_fes_values)
+        self._np_values:    list = list(np_values)
+        self._repeats:      int = repeats
+        self._journal:      SweepJournal = SweepJournal(journal_path)
+        self._workers:      int = workers
+        self._settings:     dict = {'evaluator': evaluator, 'evaluator_kwargs': evaluator_kwargs or {},
+                                    'instrumentation': instrumentation}
+
+        journal_seed = self._journal.base_seed()
+        self._base_seed: int = seed if seed is not None else journal_seed
+        self._base_seed = SeedSequence(self._base_seed).entropy
+
+        if journal_seed is not None and journal_seed != self._base_seed:
+            raise InvalidSweepConfig('Journal {0} was written with base seed {1}'.format(journal_path, journal_seed))
+
+        journal_settings = self._journal.settings()
+
+        if journal_seed is not None and journal_settings != self._journal_settings():
+            raise InvalidSweepConfig('Journal {0} was written with evaluator settings {1}'.format(journal_path,
+                                                                                                journal_settings))
+
+        self.logger.console_log('sweep of {0} jobs, base seed {1}'.format(len(self.jobs()), self._base_seed))
+
+    @property
+    def base_seed(self) -> int:
+        return self._base_seed
+
+    def jobs(self) -> list:
+        """Expands sweep grid into jobs.
+
+        Returns: A list of SweepJob, seed of each job depends only on base seed and job parameters.
+        """
+
+        return [SweepJob(dataset_path=dataset_path, algorithm=algorithm, n_fes=n_fes, np=np, repeat=repeat,
+                         seed=self._job_seed(job_key(dataset_path, algorithm, n_fes, np, repeat)))
+                for dataset_path, algorithm, n_fes, np, repeat in itertools.product(
+                    self._datasets, self._algorithms, self._n_fes_values, self._np_values, range(self._repeats))]
+
+    def run(self) -> list:
+        """Runs jobs that are not in the journal yet.
+
+        Returns: A list of (SweepJob, SimulationRunInfo) of every job in the sweep, in grid order.
+        """
+
+        jobs = self.jobs()
+        reader = CSVDatasetReader()
+        datasets = {path: reader.read(path) for path in self._datasets}
+        hashes = {path: dataset.content_hash() for path, dataset in datasets.items()}
+
+        for path, journal_hashes in self._journal.dataset_hashes().items():
+            if path in hashes and journal_hashes != {hashes[path]}:
+                raise InvalidSweepConfig('Dataset {0} changed since journal {1} was written'.format(
+                    path, self._journal.path))
+
+        results = self._journal.completed()
+        pending = [job for job in jobs if job.key not in results]
+
+        self.logger.console_log('{0} jobs already in journal, {1} to run'.format(len(jobs) - len(pending),
+                                                                                 len(pending)))
+
+        if len(pending) > 0:
+            with Pool(processes=self._workers, initializer=_init_worker,
+                      initargs=(datasets, self._settings)) as pool:
+                for job, run_info in pool.imap_unordered(_run_job, pending, chunksize=1):
+                    self._journal.append(self._base_seed, job, run_info, settings=self._journal_settings(),
+                                         dataset_hash=hashes[job.dataset_path])
+                    results[job.key] = (job, run_info)
+                    self.logger.console_log('finished {0} ({1}/{2})'.format(
+                        job.key, len(results), len(jobs)))
+
+        return [results[job.key] for job in jobs]
+
+    @staticmethod
+    def write_summary(file_path: str, results: list):
+        """Writes aggregates of repeated runs per dataset, n_fes, np and algorithm as .csv file.
+
+        Args:
+            file_path: Path to summary file.
+            results: A list of (SweepJob, SimulationRunInfo), see run.
+        """
+
+        groups = {}
+
+        for job, run_info in results:
+            groups.setdefault((job.dataset_path, job.n_fes, job.np), []).append(run_info)
+
+        with open(file_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['dataset', 'n_fes', 'np', 'algorithm', 'runs', 'failed', 'fitness_mean',
+                             'fitness_median', 'fitness_std', 'best_fitness', 'best_seed', 'time_mean',
+                             'time_median', 'time_std'])
+
+            for (dataset_path, n_fes, np), run_infos in groups.items():
+                for stats in aggregate_results(run_infos):
+                    best = stats.best_run
+                    writer.writerow([dataset_path, n_fes, np, stats.algorithm_title, stats.runs, stats.failed,
+                                     stats.fitness_mean, stats.fitness_median, stats.fitness_std,
+                                     '' if best is None else best.result.best_fitness,
+                                     '' if best is None else best.seed,
+                                     stats.time_mean, stats.time_median, stats.time_std])
+
+    def _journal_settings(self) -> dict:
+        # Settings that change results of jobs, instrumentation does not.
+        return {'evaluator': self._settings['evaluator'], 'evaluator_kwargs': self._settings['evaluator_kwargs']}
+
+    def _job_seed(self, key: str) -> int:
+        return int(SeedSequence(self._base_seed, spawn_key=(zlib.crc32(key.encode()),)).generate_state(1)[0])
+
+
+def _init_worker(datasets: dict, settings: dict):
+    global _worker_datasets, _worker_settings
+    _worker_datasets = datasets
+    _worker_settings = settings
+
+
+def _run_job(job: SweepJob) -> tuple:
+    spec = AlgorithmSpec(name=job.algorithm, seed=job.seed, np=job.np, n_fes=job.n_fes,
+                         evaluator=_worker_settings['evaluator'],
+                         evaluator_kwargs=_worker_settings['evaluator_kwargs'],
+                         instrumentation=_worker_settings['instrumentation'], repeat=job.repeat)
+
+    run_info: SimulationRunInfo = Runner.run_spec(spec, _worker_datasets[job.dataset_path])
+    return job, run_info
@@ -0,0 +1,2 @@
+class InvalidSweepConfig(Exception):
+    pass
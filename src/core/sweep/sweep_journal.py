@@ -0,0 +1,110 @@
+import json
+import os
+
+from src.model.simulation_run_info import SimulationRunInfo
+from src.model.sweep_job import SweepJob
+
+
+class SweepJournal:
+    """ Append-only JSON lines file with one record per finished sweep job.
+
+    Every record is flushed to disk before the next job result is accepted, so a crash loses at most the jobs that
+    were running. A line cut short by a crash is ignored when the journal is read.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Path to journal file, created on first append.
+        """
+
+        self._path: str = path
+
+        # Terminate line cut short by a crash, so the next record starts on its own line.
+        if os.path.isfile(path) and os.path.getsize(path) > 0:
+            with open(path, 'rb+') as file:
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b'\n':
+                    file.write(b'\n')
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def records(self) -> list:
+        """Reads journal.
+
+        Returns: A list of (base seed, settings, dataset hash, SweepJob, SimulationRunInfo) tuples in order they were
+            appended.
+        """
+
+        if not os.path.isfile(self._path):
+            return []
+
+        records = []
+
+        with open(self._path, 'r') as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                    records.append((record['base_seed'], record.get('settings'), record.get('dataset_hash'),
+                                    SweepJob.from_dict(record['job']), SimulationRunInfo.from_dict(record['run_info'])))
+                except (ValueError, KeyError, TypeError):
+                    continue
+
+        return records
+
+    def completed(self) -> dict:
+        """Returns successfully finished jobs.
+
+        Returns: Dict of job key to (SweepJob, SimulationRunInfo), failed jobs are left out so they run again.
+        """
+
+        return {job.key: (job, run_info) for _, _, _, job, run_info in self.records() if not run_info.has_error}
+
+    def base_seed(self) -> int:
+        """Returns base seed of the sweep that wrote the journal, None if journal is empty.
+        """
+
+        records = self.records()
+        return records[0][0] if records else None
+
+    def settings(self) -> dict:
+        """Returns evaluator settings of the sweep that wrote the journal, None if journal is empty.
+        """
+
+        records = self.records()
+        return records[0][1] if records else None
+
+    def dataset_hashes(self) -> dict:
+        """Returns content hash of every dataset jobs in the journal ran on.
+
+        Returns: Dict of dataset path to set of content hashes, None stands for records without hash.
+        """
+
+        hashes = {}
+
+        for _, _, dataset_hash, job, _ in self.records():
+            hashes.setdefault(job.dataset_path, set()).add(dataset_hash)
+
+        return hashes
+
+    def append(self, base_seed: int, job: SweepJob, run_info: SimulationRunInfo, settings: dict = None,
+               dataset_hash: str = None):
+        """Appends job result and waits until it is on disk.
+
+        Args:
+            base_seed: Base seed of sweep.
+            job: Finished job.
+            run_info: Result of job.
+            settings: Evaluator settings of sweep, see Sweep.
+            dataset_hash: Content hash of dataset job ran on.
+        """
+
+        line = json.dumps({'base_seed': base_seed, 'settings': settings, 'dataset_hash': dataset_hash,
+                           'job': job.to_dict(), 'run_info': run_info.to_dict()})
+
+        with open(self._path, 'a') as file:
+            file.write(line + '\n')
+            file.flush()
+            os.fsync(file.fileno())
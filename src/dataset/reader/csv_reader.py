@@ -1,10 +1,11 @@
 import csv
 import os
 
+import numpy as np
+
 from src.dataset.reader.dataset_reader_errors import InvalidFileContentError
 from src.dataset.reader.ds_reader import DatasetReaderInterface
 from src.model.dataset import Dataset
-from src.domain.package import Package
 
 
 class CSVDatasetReader(DatasetReaderInterface):
@@ -35,14 +36,19 @@ class CSVDatasetReader(DatasetReaderInterface):
                 title = next(reader)
                 header = next(reader)
 
-                return Dataset(
+                columns = np.array([[int(row[0]), int(row[1]), int(row[2]), int(row[3])] for row in reader],
+                                   dtype=np.int64).reshape(-1, 4)
+
+                return Dataset.from_columns(
                     title=title[0],
                     total_packages=int(header[0]),
                     total_stations=int(header[1]),
                     width=int(header[2]),
                     height=int(header[3]),
-                    packages=[Package(int(row[0]), int(row[1]), int(row[2]), int(row[3]))
-                              for row in reader]
+                    ids=columns[:, 0],
+                    station_in=columns[:, 1],
+                    station_out=columns[:, 2],
+                    weight=columns[:, 3]
                 )
 
         except Exception:
@@ -0,0 +1,103 @@
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from src.model.dataset import Dataset
+from src.model.shared_dataset_descriptor import SharedDatasetDescriptor
+
+# Shared memory blocks attached by this process by name. Columns of attached datasets are views of these blocks, so
+# blocks stay mapped until the process exits.
+_attached: dict = {}
+
+
+class SharedDataset:
+    """ Dataset columns published once in a shared memory block as one (4, packages) int64 array.
+
+    Worker processes attach to the block instead of receiving a copy of the dataset, see attach. dataset is a copy of
+    the published dataset that is pickled as descriptor of the block, so it can be given to process pools unchanged.
+    Owner must call close (or use it as context manager) to remove the block.
+    """
+
+    def __init__(self, dataset: Dataset):
+        """Publishes dataset.
+
+        Args:
+            dataset: Dataset to publish.
+        """
+
+        size = len(dataset.ids)
+
+        self._memory:       SharedMemory = SharedMemory(create=True, size=max(4 * size, 1) * 8)
+        self._descriptor:   SharedDatasetDescriptor = SharedDatasetDescriptor(
+            name=self._memory.name,
+            title=dataset.title,
+            total_packages=dataset.total_packages,
+            total_stations=dataset.total_stations,
+            width=dataset.width,
+            height=dataset.height,
+            size=size
+        )
+
+        columns = np.ndarray((4, size), dtype=np.int64, buffer=self._memory.buf)
+        columns[:] = [dataset.ids, dataset.station_in, dataset.station_out, dataset.weight]
+        del columns
+
+        self._dataset:      Dataset = PublishedDataset.from_columns(
+            dataset.title, dataset.total_packages, dataset.total_stations, dataset.width, dataset.height,
+            ids=dataset.ids, station_in=dataset.station_in, station_out=dataset.station_out, weight=dataset.weight,
+            copy=False)
+        self._dataset._descriptor = self._descriptor
+
+    @property
+    def descriptor(self) -> SharedDatasetDescriptor:
+        return self._descriptor
+
+    @property
+    def dataset(self) -> Dataset:
+        return self._dataset
+
+    def close(self):
+        """Removes shared memory block, processes that attached to it keep their mapping until they exit.
+        """
+
+        if self._memory is None:
+            return
+
+        self._memory.close()
+        self._memory.unlink()
+        self._memory = None
+
+    def __enter__(self) -> 'SharedDataset':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class PublishedDataset(Dataset):
+    """ Dataset that is pickled as descriptor of its shared memory block, unpickled as dataset attached to the block.
+    """
+
+    _descriptor: SharedDatasetDescriptor = None
+
+    def __reduce__(self):
+        return attach, (self._descriptor,)
+
+
+def attach(descriptor: SharedDatasetDescriptor) -> Dataset:
+    """Creates dataset whose columns are read-only views of published shared memory block, nothing is copied.
+
+    Args:
+        descriptor: Descriptor of published dataset.
+
+    Returns: Dataset.
+    """
+
+    if descriptor.name not in _attached:
+        _attached[descriptor.name] = SharedMemory(name=descriptor.name)
+
+    columns = np.ndarray((4, descriptor.size), dtype=np.int64, buffer=_attached[descriptor.name].buf)
+
+    return Dataset.from_columns(descriptor.title, descriptor.total_packages, descriptor.total_stations,
+                                descriptor.width, descriptor.height, ids=columns[0], station_in=columns[1],
+                                station_out=columns[2], weight=columns[3], copy=False)
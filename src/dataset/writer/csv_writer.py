@@ -41,5 +41,5 @@ class CSVDatasetWriter(DatasetWriterInterface):
                              dataset.width,
                              dataset.height])
 
-            for package in dataset.packages:
-                writer.writerow([package.id, package.station_in, package.station_out, package.weight])
+            writer.writerows(zip(dataset.ids.tolist(), dataset.station_in.tolist(), dataset.station_out.tolist(),
+                                 dataset.weight.tolist()))
@@ -0,0 +1,145 @@
+from time import perf_counter
+
+import numpy as np
+from numpy import ndarray
+
+from src.domain.station_recorder import StationRecorder
+from src.model.stop_at_station_summary import StopAtStationSummary
+
+
+class ArrayCargoSpace(object):
+    """ Represents cargo space as fixed size integer arrays.
+
+    Behaves exactly like CargoSpace, but instead of Column and Package objects it keeps package index per slot and
+    a fill counter per column. Packages are referenced by their index in the dataset, empty slots hold -1.
+    """
+
+    def __init__(self, width: int, height: int, station_out: ndarray, weight: ndarray,
+                 instrumentation: StationRecorder = None):
+        """
+        Args:
+            width: Cargo space width (number of columns).
+            height: Cargo space height (column size).
+            station_out: Unloading station of each package, indexed by package index.
+            weight: Weight of each package, indexed by package index.
+            instrumentation: Records stage times and movements of each stop if given.
+        """
+
+        self._width:            int = width
+        self._height:           int = height
+        self._slot_range:       ndarray = np.arange(height)
+        self._col_range:        ndarray = np.arange(width)
+
+        # Extra trailing entry makes empty slots (-1) read as station 0 and weight 0.
+        self._station_out:      ndarray = np.append(station_out, 0)
+        self._weight:           ndarray = np.append(weight, 0)
+
+        self._slot_package:     ndarray = np.full((width, height), -1, dtype=np.int64)
+        self._count:            ndarray = np.zeros(width, dtype=np.int64)
+        self._instrumentation:  StationRecorder = instrumentation
+
+    @property
+    def count(self) -> ndarray:
+        return self._count
+
+    @property
+    def slot_package(self) -> ndarray:
+        return self._slot_package
+
+    def snapshot(self) -> tuple:
+        """ Returns copy of current cargo space state.
+
+        Returns: Package index per slot and packages per column.
+        """
+
+        return self._slot_package.copy(), self._count.copy()
+
+    def restore(self, state: tuple):
+        """ Sets cargo space to state made by snapshot.
+
+        Args:
+            state: Package index per slot and packages per column.
+        """
+
+        self._slot_package = state[0].copy()
+        self._count = state[1].copy()
+
+    def simulate_stop_at_station(self, station_index: int, packages_to_load: ndarray,
+                                 col_assignment: ndarray) -> StopAtStationSummary:
+        """ Simulates stop at station, unloads, loads packages and monitors activities.
+
+        Args:
+            station_index: Current station index.
+            packages_to_load: Indexes of packages to load at this station, in loading order.
+            col_assignment: Column index of each package, indexed by package index.
+
+        Returns: Summary of process and current state of cargo space, distributions are numpy arrays.
+        """
+
+        start = perf_counter() if self._instrumentation is not None else 0.0
+        movements_sum, wait_que = self._unload_packages(station_index)
+        unloaded = perf_counter() if self._instrumentation is not None else 0.0
+
+        # Packages from waiting que are loaded right after new ones, so both can be loaded in one pass.
+        if len(wait_que) > 0:
+            packages_to_load = np.concatenate((packages_to_load, wait_que))
+
+        movements_sum += self._load_packages(packages_to_load, col_assignment[packages_to_load])
+
+        if self._instrumentation is not None:
+            self._instrumentation.add_station(unloaded - start, perf_counter() - unloaded, movements_sum,
+                                              len(wait_que))
+
+        return StopAtStationSummary(
+            movements_sum=movements_sum,
+            layout_dist=self._count.copy(),
+            weight_dist=self._weight[self._slot_package].sum(axis=1)
+        )
+
+    def _unload_packages(self, station_index: int) -> tuple:
+        leaving = self._station_out[self._slot_package] == station_index
+        has_leaving = leaving.any(axis=1)
+
+        if not has_leaving.any():
+            return 0, ()
+
+        # Everything above the lowest leaving package has to be moved, the rest goes to waiting que.
+        first = np.where(has_leaving, leaving.argmax(axis=1), self._count)
+        removed = (self._slot_range >= first[:, None]) & (self._slot_range < self._count[:, None])
+        wait_que = self._slot_package[removed & ~leaving]
+        movements = int((self._count - first).sum())
+
+        self._slot_package[removed] = -1
+        self._count = first
+
+        return movements, wait_que
+
+    def _load_packages(self, packages: ndarray, cols: ndarray) -> int:
+        total = len(packages)
+
+        # Position of each package in its column if every package before it was added to its given column.
+        rank = np.cumsum(cols[:, None] == self._col_range, axis=0)[np.arange(total), cols] - 1
+        positions = self._count[cols] + rank
+        overflow = np.flatnonzero(positions >= self._height)
+        stop = overflow[0] if len(overflow) > 0 else total
+
+        self._slot_package[cols[:stop], positions[:stop]] = packages[:stop]
+        self._count += np.bincount(cols[:stop], minlength=self._width)
+
+        # From the first full column on, placement depends on every previous choice.
+        if stop < total:
+            self._load_sequential(packages[stop:].tolist(), cols[stop:].tolist())
+
+        return total
+
+    def _load_sequential(self, packages: list, cols: list):
+        count = self._count.tolist()
+
+        for package, add_index in zip(packages, cols):
+            if count[add_index] == self._height:
+                add_index = count.index(min(count))
+
+            self._slot_package[add_index, count[add_index]] = package
+            count[add_index] += 1
+
+        self._count = np.array(count, dtype=np.int64)
@@ -0,0 +1,143 @@
+from time import perf_counter
+
+import numpy as np
+from numpy import ndarray
+
+from src.domain.station_recorder import StationRecorder
+
+
+class BatchCargoSpace(object):
+    """ Represents cargo spaces of a whole population of solutions as integer arrays with leading population axis.
+
+    Every solution is simulated exactly like in ArrayCargoSpace, all solutions move from station to station together.
+    """
+
+    def __init__(self, population: int, width: int, height: int, station_out: ndarray, weight: ndarray,
+                 instrumentation: StationRecorder = None):
+        """
+        Args:
+            population: Number of simulated solutions.
+            width: Cargo space width (number of columns).
+            height: Cargo space height (column size).
+            station_out: Unloading station of each package, indexed by package index.
+            weight: Weight of each package, indexed by package index.
+            instrumentation: Records stage times and movements of each stop if given.
+        """
+
+        self._population:       int = population
+        self._width:            int = width
+        self._height:           int = height
+        self._slot_range:       ndarray = np.arange(height)
+        self._col_range:        ndarray = np.arange(width)
+        self._pop_range:        ndarray = np.arange(population)
+
+        # Extra trailing entry makes empty slots (-1) read as station 0 and weight 0.
+        self._station_out:      ndarray = np.append(station_out, 0)
+        self._weight:           ndarray = np.append(weight, 0)
+
+        self._slot_package:     ndarray = np.full((population, width, height), -1, dtype=np.int64)
+        self._count:            ndarray = np.zeros((population, width), dtype=np.int64)
+        self._instrumentation:  StationRecorder = instrumentation
+
+    @property
+    def count(self) -> ndarray:
+        return self._count
+
+    @property
+    def slot_package(self) -> ndarray:
+        return self._slot_package
+
+    def simulate_stop_at_station(self, station_index: int, packages_to_load: ndarray,
+                                 col_assignment: ndarray) -> tuple:
+        """ Simulates stop at station for every solution, unloads, loads packages and monitors activities.
+
+        Args:
+            station_index: Current station index.
+            packages_to_load: Indexes of packages to load at this station, in loading order.
+            col_assignment: Column index of each package per solution, shape (population, packages).
+
+        Returns: Package movements, packages per column and weight per column, each with leading population axis.
+        """
+
+        start = perf_counter() if self._instrumentation is not None else 0.0
+        movements, wait_que_pop, wait_que = self._unload_packages(station_index)
+        unloaded = perf_counter() if self._instrumentation is not None else 0.0
+
+        # Loading sequence per solution, new packages first, then its own waiting que, padded with -1.
+        sequence = np.broadcast_to(packages_to_load, (self._population, len(packages_to_load)))
+
+        if len(wait_que) > 0:
+            que_len = np.bincount(wait_que_pop, minlength=self._population)
+            que_pos = np.arange(len(wait_que)) - (np.cumsum(que_len) - que_len)[wait_que_pop]
+            padded = np.full((self._population, que_len.max()), -1, dtype=np.int64)
+            padded[wait_que_pop, que_pos] = wait_que
+            sequence = np.concatenate((sequence, padded), axis=1)
+
+        movements += self._load_packages(sequence, col_assignment)
+
+        if self._instrumentation is not None:
+            self._instrumentation.add_station(unloaded - start, perf_counter() - unloaded, int(movements.sum()),
+                                              len(wait_que))
+
+        return movements, self._count.copy(), self._weight[self._slot_package].sum(axis=2)
+
+    def _unload_packages(self, station_index: int) -> tuple:
+        leaving = self._station_out[self._slot_package] == station_index
+        has_leaving = leaving.any(axis=2)
+
+        if not has_leaving.any():
+            return np.zeros(self._population, dtype=np.int64), (), ()
+
+        # Everything above the lowest leaving package has to be moved, the rest goes to waiting que.
+        first = np.where(has_leaving, leaving.argmax(axis=2), self._count)
+        removed = (self._slot_range >= first[..., None]) & (self._slot_range < self._count[..., None])
+        wait_que_pop = np.nonzero(removed & ~leaving)[0]
+        wait_que = self._slot_package[removed & ~leaving]
+        movements = (self._count - first).sum(axis=1)
+
+        self._slot_package[removed] = -1
+        self._count = first
+
+        return movements, wait_que_pop, wait_que
+
+    def _load_packages(self, sequence: ndarray, col_assignment: ndarray) -> ndarray:
+        steps = sequence.shape[1]
+
+        if steps == 0:
+            return np.zeros(self._population, dtype=np.int64)
+
+        valid = sequence >= 0
+        cols = np.where(valid, np.take_along_axis(col_assignment, np.where(valid, sequence, 0), axis=1), 0)
+
+        # Position of each package in its column if every package before it was added to its given column.
+        one_hot = (cols[..., None] == self._col_range) & valid[..., None]
+        rank = np.take_along_axis(np.cumsum(one_hot, axis=1), cols[..., None], axis=2)[..., 0] - 1
+        positions = np.take_along_axis(self._count, cols, axis=1) + rank
+        overflow = (positions >= self._height) & valid
+        stop = np.where(overflow.any(axis=1), overflow.argmax(axis=1), steps)
+
+        bulk = valid & (np.arange(steps) < stop[:, None])
+        pop_index = np.broadcast_to(self._pop_range[:, None], sequence.shape)[bulk]
+        self._slot_package[pop_index, cols[bulk], positions[bulk]] = sequence[bulk]
+        self._count += np.bincount(pop_index * self._width + cols[bulk],
+                                   minlength=self._population * self._width).reshape(self._population, self._width)
+
+        # From the first full column on, placement depends on every previous choice.
+        for pop in np.flatnonzero(stop < steps):
+            tail = valid[pop, stop[pop]:]
+            self._load_sequential(pop, sequence[pop, stop[pop]:][tail].tolist(), cols[pop, stop[pop]:][tail].tolist())
+
+        return valid.sum(axis=1)
+
+    def _load_sequential(self, pop: int, packages: list, cols: list):
+        count = self._count[pop].tolist()
+        slots = self._slot_package[pop]
+
+        for package, add_index in zip(packages, cols):
+            if count[add_index] == self._height:
+                add_index = count.index(min(count))
+
+            slots[add_index, count[add_index]] = package
+            count[add_index] += 1
+
+        self._count[pop] = count
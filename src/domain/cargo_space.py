@@ -1,6 +1,10 @@
+from collections import defaultdict
+from time import perf_counter
+
 from numpy import ndarray
 
 from src.domain.cs_column import Column
+from src.domain.station_recorder import StationRecorder
 import numpy as np
 
 from src.model.stop_at_station_summary import StopAtStationSummary
@@ -10,37 +14,57 @@ class CargoSpace(object):
     """ Represents cargo space in transport vehicle/ship ect.
     """
 
-    def __init__(self, width: int, height: int):
-        self._width:    int = width
-        self._height:   int = height
-        self._columns:  list = [Column(height) for i in range(width)]
+    def __init__(self, width: int, height: int, instrumentation: StationRecorder = None):
+        """
+        Args:
+            width: Cargo space width (number of columns).
+            height: Cargo space height (column size).
+            instrumentation: Records stage times and movements of each stop if given.
+        """
+
+        self._width:            int = width
+        self._height:           int = height
+        self._instrumentation:  StationRecorder = instrumentation
+
+        # Indexes of columns with packages per unloading station, filled by Column.add, and package count of columns.
+        self._departures:       defaultdict = defaultdict(set)
+        self._columns:          list = [Column(height, self._departures, i) for i in range(width)]
+        self._packages_per_col: ndarray = np.zeros(width, dtype=int)
 
     @property
     def columns(self) -> list:
         return self._columns
 
-    def simulate_stop_at_station(self, station_index: int, packages_to_load: list) -> StopAtStationSummary:
+    def simulate_stop_at_station(self, station_index: int, packages_to_load: list,
+                                 col_assignment: ndarray) -> StopAtStationSummary:
         """ Simulates stop at station, unloads, loads packages and monitors activities.
 
         Args:
             station_index: Current station index.
             packages_to_load: List of packages to load at this station.
+            col_assignment: Column index of each package, indexed by position of package in dataset (Package.index).
 
         Returns: Summary of process and current state of cargo space.
         """
 
         movements_sum = 0
         wait_que = []
-        packages_per_col = np.zeros(len(self._columns), dtype=int)
+        packages_per_col = self._packages_per_col
+        start = perf_counter() if self._instrumentation is not None else 0.0
 
         # Unload packages for current station.
         movements_sum += self._unload_packages(packages_per_col, wait_que, station_index)
+        unloaded = perf_counter() if self._instrumentation is not None else 0.0
 
         # Load packages for current station.
-        movements_sum += self._load_packages(packages_to_load, packages_per_col)
+        movements_sum += self._load_packages(packages_to_load, packages_per_col, col_assignment)
 
         # Load packages from waiting que.
-        movements_sum += self._load_packages(wait_que, packages_per_col)
+        movements_sum += self._load_packages(wait_que, packages_per_col, col_assignment)
+
+        if self._instrumentation is not None:
+            self._instrumentation.add_station(unloaded - start, perf_counter() - unloaded, movements_sum,
+                                              len(wait_que))
 
         return StopAtStationSummary(
             movements_sum=movements_sum,
@@ -50,7 +74,11 @@ class CargoSpace(object):
 
     def _unload_packages(self, packages_per_col: ndarray, wait_que: list, station_index: int) -> int:
         movement = 0
-        for index, column in enumerate(self._columns):
+
+        # Only columns that received packages for this station have work, visited in column order as wait que order
+        # decides reloading. Columns whose packages for this station were moved away since then unload nothing.
+        for index in sorted(self._departures.pop(station_index, ())):
+            column = self._columns[index]
             ret_que, ret_movements = column.unload_at_station(station_index)
             movement += ret_movements
             wait_que += ret_que
@@ -58,10 +86,10 @@ class CargoSpace(object):
 
         return movement
 
-    def _load_packages(self, packages_to_load: list, packages_per_col: ndarray) -> int:
+    def _load_packages(self, packages_to_load: list, packages_per_col: ndarray, col_assignment: ndarray) -> int:
         movements = 0
         for package in packages_to_load:
-            add_index = package.given_col_index
+            add_index = col_assignment[package.index]
 
             if packages_per_col[add_index] == self._height:
                 add_index = np.argmin(packages_per_col)
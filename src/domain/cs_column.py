@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 from src.domain.package import Package
 
 
@@ -6,20 +8,46 @@ class Column:
     """Represents column in cargo stowage place.
     """
 
-    def __init__(self, height: int):
+    def __init__(self, height: int, departures: defaultdict = None, index: int = None):
         """
         Args:
             height: Column height.
+            departures: Indexes of columns with packages per unloading station, shared by columns of a cargo space.
+                Index of this column is added for every added package, it is not removed when packages leave.
+            index: Index of column in cargo space, required if departures is given.
         """
 
         self._values:           list = [None for _ in range(height)]
         self._package_count:    int = 0
         self._sum_weight:       int = 0
+        self._departures:       defaultdict = departures
+        self._index:            int = index
+
+        # Packages in column per unloading station.
+        self._out_count:        defaultdict = defaultdict(int)
 
     @property
     def sum_weight(self) -> int:
         return self._sum_weight
 
+    @property
+    def earliest_out(self) -> int:
+        """ Earliest unloading station of packages in column, None if column is empty.
+        """
+
+        return min(self._out_count) if self._out_count else None
+
+    def has_departures(self, station_index: int) -> bool:
+        """ Checks if any package in column is unloaded at given station.
+
+        Args:
+            station_index: Station index (out).
+
+        Returns: True if column has package to unload.
+        """
+
+        return station_index in self._out_count
+
     def get_height(self) -> int:
         """Gets column size.
 
@@ -49,6 +77,11 @@ class Column:
         self._package_count += 1
         self._sum_weight += package.weight
 
+        self._out_count[package.station_out] += 1
+
+        if self._departures is not None:
+            self._departures[package.station_out].add(self._index)
+
     def get(self, index: int) -> Package:
         """ Returns value at index.
 
@@ -67,10 +100,15 @@ class Column:
         """
 
         self._package_count -= 1
-        self._sum_weight -= 0 if self._values[self._package_count] is None \
-            else self._values[self._package_count].weight
+        package = self._values[self._package_count]
+        self._sum_weight -= 0 if package is None else package.weight
+
+        if package is not None:
+            self._out_count[package.station_out] -= 1
+            if self._out_count[package.station_out] == 0:
+                del self._out_count[package.station_out]
 
-        return self._values[self._package_count]
+        return package
 
     def unload_at_station(self, station_index: int) -> tuple:
         """ Unloads packages at given station, counts movements, and creates waiting que of packages to be loaded back
@@ -82,22 +120,27 @@ class Column:
         Returns: list of temp queue packets, sum of package movements
         """
 
-        wait_que, mov_sum, wait_que_act = [], 0, False
-
-        # should probably refactor this
-        for i in range(self._package_count):
-            if wait_que_act:
-                self._package_count -= 1
-                self._sum_weight -= 0 if self._values[i] is None else self._values[i].weight
-                if self._values[i].station_out != station_index:
-                    wait_que.append(self._values[i])
-                self._values[i] = None
-                mov_sum += 1
-            elif self._values[i].station_out == station_index:
-                wait_que_act = True
-                self._package_count -= 1
-                self._sum_weight -= 0 if self._values[i] is None else self._values[i].weight
-                self._values[i] = None
-                mov_sum += 1
+        wait_que = []
+
+        if station_index not in self._out_count:
+            return wait_que, 0
+
+        # Everything above the lowest package for this station is moved, the rest goes to waiting que.
+        values, out_count, first = self._values, self._out_count, 0
+        while values[first].station_out != station_index:
+            first += 1
+
+        for package in values[first:self._package_count]:
+            station_out = package.station_out
+            self._sum_weight -= package.weight
+            out_count[station_out] -= 1
+            if out_count[station_out] == 0:
+                del out_count[station_out]
+            if station_out != station_index:
+                wait_que.append(package)
+
+        mov_sum = self._package_count - first
+        values[first:self._package_count] = [None] * mov_sum
+        self._package_count = first
 
         return wait_que, mov_sum
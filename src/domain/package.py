@@ -1,25 +1,32 @@
 class Package:
     """Represents package in cargo stowage and it's properties."""
 
-    def __init__(self, id_num: int, station_in: int, station_out: int, weight: int):
+    __slots__ = ('_id', '_station_out', '_station_in', '_weight', '_index')
+
+    def __init__(self, id_num: int, station_in: int, station_out: int, weight: int, index: int = None):
         """
         Args:
             id_num:         Identification number.
             station_in:     Number of station for loading.
             station_out:    Number of station for unloading.
             weight:         Gross weight.
+            index:          Position of package in dataset, None if package is not part of one.
         """
 
         self._id:               int = id_num
         self._station_out:      int = station_out
         self._station_in:       int = station_in
         self._weight:           int = weight
-        self.given_col_index:   int = 0
+        self._index:            int = index
 
     @property
     def id(self) -> int:
         return self._id
 
+    @property
+    def index(self) -> int:
+        return self._index
+
     @property
     def station_out(self) -> int:
         return self._station_out
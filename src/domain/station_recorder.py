@@ -0,0 +1,15 @@
+class StationRecorder(object):
+    """ Receives stage times and movements of each simulated stop at station from cargo spaces.
+    """
+
+    def add_station(self, unload_time: float, load_time: float, movements: int, reloads: int):
+        """ Records simulated stop at station.
+
+        Args:
+            unload_time: Time spent unloading in seconds.
+            load_time: Time spent loading in seconds.
+            movements: Package movements.
+            reloads: Packages loaded back from waiting que.
+        """
+
+        raise NotImplementedError()
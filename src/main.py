@@ -1,8 +1,12 @@
 import datetime
 import json
 import os
+import sys
 
+from src.core.benchmark.evaluator_registry import check_evaluator_options
+from src.core.distributed.worker import Worker
 from src.core.simulation.simulation import Simulation, SortAttribute
+from src.core.sweep.sweep import Sweep
 from src.dataset.generator.base_generator import BaseDatasetGenerator
 from src.dataset.reader.csv_reader import CSVDatasetReader
 from src.dataset.writer.csv_writer import CSVDatasetWriter
@@ -22,33 +26,108 @@ def generate_data_set():
         print(str(error))
 
 
-if __name__ == '__main__':
-    # generate_data_set()
-    try:
-        config_data = json.load(open(configFile, 'r'))
-        dataset = CSVDatasetReader().read(config_data['dataset'])
+# runs every combination of sweep datasets, algorithms, n_fes and np values, see "sweep" in config
+def run_sweep(config_data: dict):
+    sweep_config = config_data['sweep']
+    cache_config = config_data.get('fitnessCache', {})
+    check_evaluator_options(config_data.get('evaluator', 'reference'), config_data.get('evaluatorOptions', {}))
+
+    sweep = Sweep(
+        datasets=sweep_config.get('datasets', [config_data['dataset']]),
+        algorithms=sweep_config.get('algorithms', config_data['algorithms']),
+        n_fes_values=sweep_config.get('n_fes', [config_data['n_fes']]),
+        np_values=sweep_config.get('np', [config_data['np']]),
+        journal_path=sweep_config['journal'],
+        repeats=config_data.get('repeats', 1),
+        seed=config_data.get('seed'),
+        evaluator=config_data.get('evaluator', 'reference'),
+        evaluator_kwargs=dict(cache_size=cache_config.get('size', 0),
+                              canonicalize=cache_config.get('canonicalize', False),
+                              early_abort=config_data.get('earlyAbort', False),
+                              **config_data.get('evaluatorOptions', {})),
+        instrumentation=config_data.get('instrumentation', False),
+        workers=config_data.get('workers')
+    )
+
+    Sweep.write_summary(os.path.splitext(sweep_config['journal'])[0] + '_summary.csv', sweep.run())
+
+
+# runs jobs served by coordinator, a simulation with "distributed" executor, started with "worker" argument
+def run_worker(config_data: dict):
+    distributed_config = config_data.get('distributed', {})
+    heartbeat_timeout = distributed_config.get('heartbeatTimeout', 30.0)
+
+    # Heartbeats are sent three times per coordinator heartbeat timeout, so a single late one is not fatal. Without
+    # heartbeat timeout they are still sent, they keep idle timeout of coordinator from ending long jobs.
+    worker = Worker(host=distributed_config.get('host', '127.0.0.1'), port=distributed_config.get('port', 5555),
+                    connect_timeout=distributed_config.get('connectTimeout', 30.0),
+                    heartbeat_interval=10.0 if heartbeat_timeout is None else heartbeat_timeout / 3)
+    worker.run()
 
-        result_dir_path = os.path.join(config_data['saveToDir'], datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S'))
-        os.mkdir(path=result_dir_path)
 
-        simulation = Simulation(
-            dataset=dataset,
-            n_fes=config_data['n_fes'],
-            np=config_data['np'],
-            save_to_dir=result_dir_path
-        )
+# runs single simulation described by config
+def run_simulation(config_data: dict):
+    dataset = CSVDatasetReader().read(config_data['dataset'])
 
-        for algorithm in config_data['algorithms']:
-            simulation.add_algorithm(algorithm)
+    result_dir_path = os.path.join(config_data['saveToDir'], datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S'))
+    os.mkdir(path=result_dir_path)
 
-        save_opt_configs = [OutputOptionConfig(class_name=config['class'],
-                                               included_kwargs=config['included_kwargs'])
-                            for config in config_data['outputOptions']]
+    simulation = Simulation(
+        dataset=dataset,
+        n_fes=config_data['n_fes'],
+        np=config_data['np'],
+        save_to_dir=result_dir_path,
+        cache_size=config_data.get('fitnessCache', {}).get('size', 0),
+        cache_canonicalize=config_data.get('fitnessCache', {}).get('canonicalize', False),
+        evaluator=config_data.get('evaluator', 'reference'),
+        early_abort=config_data.get('earlyAbort', False),
+        evaluator_options=config_data.get('evaluatorOptions', {}),
+        instrumentation=config_data.get('instrumentation', False),
+        executor=config_data.get('executor', 'thread'),
+        workers=config_data.get('workers'),
+        repeats=config_data.get('repeats', 1),
+        seed=config_data.get('seed'),
+        checkpoint_evals=config_data.get('checkpoint', {}).get('everyEvals', 0),
+        checkpoint_seconds=config_data.get('checkpoint', {}).get('everySeconds', 0),
+        resume_dir=config_data.get('checkpoint', {}).get('resumeFrom'),
+        time_budget=config_data.get('timeBudget', {}).get('seconds'),
+        time_budgets=config_data.get('timeBudget', {}).get('perAlgorithm'),
+        stagnation_evals=config_data.get('stagnation', {}).get('evaluations'),
+        stagnation_epsilon=config_data.get('stagnation', {}).get('epsilon', 0.0),
+        stagnation_per_algorithm=config_data.get('stagnation', {}).get('perAlgorithm'),
+        history_path=config_data.get('runHistory'),
+        coordinator_host=config_data.get('distributed', {}).get('host', '127.0.0.1'),
+        coordinator_port=config_data.get('distributed', {}).get('port', 5555),
+        eval_workers=config_data.get('evalWorkers', 1),
+        job_timeout=config_data.get('distributed', {}).get('jobTimeout'),
+        heartbeat_timeout=config_data.get('distributed', {}).get('heartbeatTimeout', 30.0),
+        idle_timeout=config_data.get('distributed', {}).get('idleTimeout', 300.0)
+    )
 
-        for output_option in save_opt_configs:
-            simulation.add_save_option(output_option)
+    for algorithm in config_data['algorithms']:
+        simulation.add_algorithm(algorithm)
+
+    save_opt_configs = [OutputOptionConfig(class_name=config['class'],
+                                           included_kwargs=config['included_kwargs'])
+                        for config in config_data['outputOptions']]
+
+    for output_option in save_opt_configs:
+        simulation.add_save_option(output_option)
+
+    simulation.run(sort_by_best=SortAttribute[config_data['sortByBest'].lower()])
+
+
+if __name__ == '__main__':
+    # generate_data_set()
+    try:
+        config_data = json.load(open(configFile, 'r'))
 
-        simulation.run(sort_by_best=SortAttribute[config_data['sortByBest'].lower()])
+        if len(sys.argv) > 1 and sys.argv[1] == 'worker':
+            run_worker(config_data)
+        elif config_data.get('sweep', {}).get('enabled', False):
+            run_sweep(config_data)
+        else:
+            run_simulation(config_data)
 
     except Exception as e:
         print('Execution stopped with error: {0}'.format(str(e)))
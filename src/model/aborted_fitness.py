@@ -0,0 +1,6 @@
+class AbortedFitness(int):
+    """Fitness of solution whose evaluation was stopped because it could not beat the cutoff.
+
+    Value is a lower bound of the real fitness and is greater than the cutoff, so it compares as worse than cutoff.
+    """
+    pass
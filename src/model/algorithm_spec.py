@@ -0,0 +1,109 @@
+from src.model.checkpoint_options import CheckpointOptions
+
+
+class AlgorithmSpec:
+    """Picklable description of one optimization run, algorithm object is built from it where the run executes.
+    """
+
+    def __init__(self, name: str, seed: int, np: int, n_fes: int, evaluator: str, evaluator_kwargs: dict,
+                 instrumentation: bool = False, repeat: int = 0, checkpoint: CheckpointOptions = None,
+                 time_budget: float = None, stagnation_evals: int = None, stagnation_epsilon: float = 0.0,
+                 eval_workers: int = 1):
+        """
+        Args:
+            name:               NiaPy algorithm class name.
+            seed:               Random seed of algorithm.
+            np:                 Population size.
+            n_fes:              Total number of evaluations.
+            evaluator:          Name of fitness evaluator backend.
+            evaluator_kwargs:   Keyword arguments of evaluator constructor (dataset excluded).
+            instrumentation:    Collect evaluation counters and stage times.
+            repeat:             Index of run among repeated runs of the same algorithm.
+            checkpoint:         Checkpointing of run, None disables it.
+            time_budget:        Wall-clock budget of run in seconds, None for no budget.
+            stagnation_evals:   Stop once best fitness did not improve by more than stagnation_epsilon in this many
+                                evaluations, None disables it.
+            stagnation_epsilon: Smallest improvement of best fitness that counts.
+            eval_workers:       Number of worker processes evaluating populations of the run, 1 evaluates serially.
+        """
+
+        self._name:               str = name
+        self._seed:               int = seed
+        self._np:                 int = np
+        self._n_fes:              int = n_fes
+        self._evaluator:          str = evaluator
+        self._evaluator_kwargs:   dict = evaluator_kwargs
+        self._instrumentation:    bool = instrumentation
+        self._repeat:             int = repeat
+        self._checkpoint:         CheckpointOptions = checkpoint
+        self._time_budget:        float = time_budget
+        self._stagnation_evals:   int = stagnation_evals
+        self._stagnation_epsilon: float = stagnation_epsilon
+        self._eval_workers:       int = eval_workers
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    @property
+    def np(self) -> int:
+        return self._np
+
+    @property
+    def n_fes(self) -> int:
+        return self._n_fes
+
+    @property
+    def evaluator(self) -> str:
+        return self._evaluator
+
+    @property
+    def evaluator_kwargs(self) -> dict:
+        return self._evaluator_kwargs
+
+    @property
+    def instrumentation(self) -> bool:
+        return self._instrumentation
+
+    @property
+    def repeat(self) -> int:
+        return self._repeat
+
+    @property
+    def checkpoint(self) -> CheckpointOptions:
+        return self._checkpoint
+
+    @property
+    def time_budget(self) -> float:
+        return self._time_budget
+
+    @property
+    def stagnation_evals(self) -> int:
+        return self._stagnation_evals
+
+    @property
+    def stagnation_epsilon(self) -> float:
+        return self._stagnation_epsilon
+
+    @property
+    def eval_workers(self) -> int:
+        return self._eval_workers
+
+    def to_dict(self) -> dict:
+        """Returns JSON serializable representation of spec, see from_dict. Checkpoint options are left out, their
+        paths are local to the machine the spec was created on.
+        """
+
+        return {'name': self._name, 'seed': self._seed, 'np': self._np, 'n_fes': self._n_fes,
+                'evaluator': self._evaluator, 'evaluator_kwargs': self._evaluator_kwargs,
+                'instrumentation': self._instrumentation, 'repeat': self._repeat, 'time_budget': self._time_budget,
+                'stagnation_evals': self._stagnation_evals, 'stagnation_epsilon': self._stagnation_epsilon,
+                'eval_workers': self._eval_workers}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'AlgorithmSpec':
+        return cls(**data)
@@ -0,0 +1,74 @@
+from src.model.simulation_run_info import SimulationRunInfo
+
+
+class AlgorithmStats:
+    """Holds aggregates of repeated runs of one algorithm.
+    """
+
+    def __init__(self, algorithm_title: str, runs: int, failed: int, fitness_mean: float, fitness_median: float,
+                 fitness_std: float, time_mean: float, time_median: float, time_std: float,
+                 best_run: SimulationRunInfo):
+        """
+        Args:
+            algorithm_title:    Genetic algorithm title.
+            runs:               Number of runs, failed included.
+            failed:             Number of runs that ended with error.
+            fitness_mean:       Mean best fitness of successful runs.
+            fitness_median:     Median best fitness of successful runs.
+            fitness_std:        Sample standard deviation of best fitness of successful runs.
+            time_mean:          Mean execution time of successful runs.
+            time_median:        Median execution time of successful runs.
+            time_std:           Sample standard deviation of execution time of successful runs.
+            best_run:           Successful run with the best fitness, None if every run failed.
+        """
+
+        self._algorithm_title:  str = algorithm_title
+        self._runs:             int = runs
+        self._failed:           int = failed
+        self._fitness_mean:     float = fitness_mean
+        self._fitness_median:   float = fitness_median
+        self._fitness_std:      float = fitness_std
+        self._time_mean:        float = time_mean
+        self._time_median:      float = time_median
+        self._time_std:         float = time_std
+        self._best_run:         SimulationRunInfo = best_run
+
+    @property
+    def algorithm_title(self) -> str:
+        return self._algorithm_title
+
+    @property
+    def runs(self) -> int:
+        return self._runs
+
+    @property
+    def failed(self) -> int:
+        return self._failed
+
+    @property
+    def fitness_mean(self) -> float:
+        return self._fitness_mean
+
+    @property
+    def fitness_median(self) -> float:
+        return self._fitness_median
+
+    @property
+    def fitness_std(self) -> float:
+        return self._fitness_std
+
+    @property
+    def time_mean(self) -> float:
+        return self._time_mean
+
+    @property
+    def time_median(self) -> float:
+        return self._time_median
+
+    @property
+    def time_std(self) -> float:
+        return self._time_std
+
+    @property
+    def best_run(self) -> SimulationRunInfo:
+        return self._best_run
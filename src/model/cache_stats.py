@@ -0,0 +1,52 @@
+class CacheStats:
+    """Holds fitness cache counters of one optimization run.
+    """
+
+    def __init__(self, size: int, hits: int, misses: int, evictions: int, canonical: bool):
+        """
+        Args:
+            size:       Maximum number of cached entries.
+            hits:       Evaluations answered from cache.
+            misses:     Evaluations that had to be simulated.
+            evictions:  Entries removed to make room for new ones.
+            canonical:  Indicates whether assignments were canonicalized under column relabeling.
+        """
+
+        self._size:         int = size
+        self._hits:         int = hits
+        self._misses:       int = misses
+        self._evictions:    int = evictions
+        self._canonical:    bool = canonical
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    @property
+    def canonical(self) -> bool:
+        return self._canonical
+
+    @property
+    def hit_rate(self) -> float:
+        total = self._hits + self._misses
+        return 0.0 if total == 0 else self._hits / total
+
+    def to_dict(self) -> dict:
+        return {'size': self._size, 'hits': self._hits, 'misses': self._misses, 'evictions': self._evictions,
+                'canonical': self._canonical}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'CacheStats':
+        return cls(**data)
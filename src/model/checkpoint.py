@@ -0,0 +1,55 @@
+import numpy as np
+
+
+class Checkpoint:
+    """Holds state of optimization run needed to continue it.
+    """
+
+    def __init__(self, evaluations: int, iterations: int, best_solution: np.ndarray, best_fitness: float,
+                 population: np.ndarray, population_fitness: np.ndarray, random_state: tuple):
+        """
+        Args:
+            evaluations:        Number of evaluations done.
+            iterations:         Number of algorithm iterations done.
+            best_solution:      Best solution found so far, None if nothing was evaluated.
+            best_fitness:       Fitness of best solution.
+            population:         Most recently evaluated solutions, at most population size rows, oldest first.
+            population_fitness: Fitness of population rows.
+            random_state:       State of algorithm random generator, see numpy RandomState.get_state.
+        """
+
+        self._evaluations:          int = evaluations
+        self._iterations:           int = iterations
+        self._best_solution:        np.ndarray = best_solution
+        self._best_fitness:         float = best_fitness
+        self._population:           np.ndarray = population
+        self._population_fitness:   np.ndarray = population_fitness
+        self._random_state:         tuple = random_state
+
+    @property
+    def evaluations(self) -> int:
+        return self._evaluations
+
+    @property
+    def iterations(self) -> int:
+        return self._iterations
+
+    @property
+    def best_solution(self) -> np.ndarray:
+        return self._best_solution
+
+    @property
+    def best_fitness(self) -> float:
+        return self._best_fitness
+
+    @property
+    def population(self) -> np.ndarray:
+        return self._population
+
+    @property
+    def population_fitness(self) -> np.ndarray:
+        return self._population_fitness
+
+    @property
+    def random_state(self) -> tuple:
+        return self._random_state
@@ -0,0 +1,33 @@
+class CheckpointOptions:
+    """Describes where and how often optimization run is checkpointed and which checkpoint it resumes from.
+    """
+
+    def __init__(self, path: str, every_evals: int = 0, every_seconds: float = 0.0, resume_path: str = None):
+        """
+        Args:
+            path:           Path to checkpoint file, it is replaced by every new checkpoint.
+            every_evals:    Checkpoint after this many evaluations, 0 disables the interval.
+            every_seconds:  Checkpoint after this many seconds, 0 disables the interval.
+            resume_path:    Path to checkpoint run continues from, None or missing file starts a new run.
+        """
+
+        self._path:             str = path
+        self._every_evals:      int = every_evals
+        self._every_seconds:    float = every_seconds
+        self._resume_path:      str = resume_path
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def every_evals(self) -> int:
+        return self._every_evals
+
+    @property
+    def every_seconds(self) -> float:
+        return self._every_seconds
+
+    @property
+    def resume_path(self) -> str:
+        return self._resume_path
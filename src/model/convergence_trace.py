@@ -0,0 +1,28 @@
+class ConvergenceTrace:
+    """Holds best-so-far fitness of one optimization run against number of evaluations.
+    """
+
+    def __init__(self, evaluations: list, fitness: list):
+        """
+        Args:
+            evaluations:    Evaluation counts at which best fitness improved, ascending, last one is total count.
+            fitness:        Best fitness after each of those evaluations.
+        """
+
+        self._evaluations:  list = evaluations
+        self._fitness:      list = fitness
+
+    @property
+    def evaluations(self) -> list:
+        return self._evaluations
+
+    @property
+    def fitness(self) -> list:
+        return self._fitness
+
+    def to_dict(self) -> dict:
+        return {'evaluations': list(self._evaluations), 'fitness': list(self._fitness)}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ConvergenceTrace':
+        return cls(**data)
@@ -1,5 +1,16 @@
+import hashlib
+
+import numpy as np
+from numpy import ndarray
+
+from src.model.package_sequence import PackageSequence
+
+
 class Dataset:
     """Holds data for specific dataset and it's readonly.
+
+    Packages are stored as contiguous columns (id, station_in, station_out, weight), Package objects are only created
+    when packages are accessed one by one.
     """
 
     def __init__(self, title: str, total_packages: int, total_stations: int,
@@ -20,7 +31,36 @@ class Dataset:
         self._total_stations:   int = total_stations
         self._width:            int = width
         self._height:           int = height
-        self._packages:         list = packages
+
+        columns = np.array([(package.id, package.station_in, package.station_out, package.weight)
+                            for package in packages], dtype=np.int64).reshape(-1, 4)
+        self._set_columns(columns[:, 0], columns[:, 1], columns[:, 2], columns[:, 3])
+
+    @classmethod
+    def from_columns(cls, title: str, total_packages: int, total_stations: int, width: int, height: int,
+                     ids: ndarray, station_in: ndarray, station_out: ndarray, weight: ndarray, copy: bool = True):
+        """Creates dataset from package columns without creating Package objects.
+
+        Args:
+            title:              Dataset title.
+            total_packages:     Total number of packages.
+            total_stations:     Total number of stations.
+            width:              Width of cargo stowage space.
+            height:             Height of cargo stowage space.
+            ids:                Package identification numbers.
+            station_in:         Station of loading of each package.
+            station_out:        Station of unloading of each package.
+            weight:             Weight of each package.
+            copy:               Copy columns, otherwise int64 columns are used through read-only views, e.g. of
+                                shared memory.
+
+        Returns: Dataset.
+        """
+
+        dataset = cls(title, total_packages, total_stations, width, height, [])
+        dataset._set_columns(ids, station_in, station_out, weight, copy)
+
+        return dataset
 
     @property
     def title(self) -> str:
@@ -43,5 +83,74 @@ class Dataset:
         return self._height
 
     @property
-    def packages(self) -> list:
+    def packages(self) -> PackageSequence:
         return self._packages
+
+    @property
+    def ids(self) -> ndarray:
+        return self._ids
+
+    @property
+    def station_in(self) -> ndarray:
+        return self._station_in
+
+    @property
+    def station_out(self) -> ndarray:
+        return self._station_out
+
+    @property
+    def weight(self) -> ndarray:
+        return self._weight
+
+    def content_hash(self) -> str:
+        """Hash of dataset content, equal datasets have equal hashes regardless of where they were read from.
+
+        Returns: Hex digest.
+        """
+
+        digest = hashlib.sha256('{0}|{1}|{2}|{3}|{4}'.format(self._title, self._total_packages, self._total_stations,
+                                                             self._width, self._height).encode('utf-8'))
+
+        for column in (self._ids, self._station_in, self._station_out, self._weight):
+            digest.update(column.astype('<i8').tobytes())
+
+        return digest.hexdigest()
+
+    def to_dict(self) -> dict:
+        """Returns JSON serializable representation of dataset, see from_dict.
+        """
+
+        return {'title': self._title, 'total_packages': int(self._total_packages),
+                'total_stations': int(self._total_stations), 'width': int(self._width), 'height': int(self._height),
+                'ids': self._ids.tolist(),
+                'station_in': self._station_in.tolist(), 'station_out': self._station_out.tolist(),
+                'weight': self._weight.tolist()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Dataset':
+        """Creates dataset from representation returned by to_dict.
+
+        Args:
+            data: Dataset as dict.
+
+        Returns: Dataset.
+        """
+
+        return cls.from_columns(**data)
+
+    def _set_columns(self, ids: ndarray, station_in: ndarray, station_out: ndarray, weight: ndarray,
+                     copy: bool = True):
+        self._ids:              ndarray = _read_only(ids, copy)
+        self._station_in:       ndarray = _read_only(station_in, copy)
+        self._station_out:      ndarray = _read_only(station_out, copy)
+        self._weight:           ndarray = _read_only(weight, copy)
+        self._packages:         PackageSequence = PackageSequence(self._ids, self._station_in, self._station_out,
+                                                                  self._weight)
+
+
+def _read_only(column: ndarray, copy: bool) -> ndarray:
+    # View keeps flags of given array untouched.
+    column = np.array(column, dtype=np.int64) if copy else np.asarray(column, dtype=np.int64).view()
+    column.flags.writeable = False
+
+    return column
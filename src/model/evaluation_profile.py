@@ -0,0 +1,51 @@
+class EvaluationProfile:
+    """Holds fitness evaluation counters and cumulative stage times of one optimization run.
+    """
+
+    def __init__(self, evaluations: int, evaluation_time: float, stage_times: dict, movements: int, reloads: int):
+        """
+        Args:
+            evaluations:        Number of evaluated solutions.
+            evaluation_time:    Total time spent in fitness evaluation in seconds.
+            stage_times:        Cumulative time in seconds per evaluation stage (decode, unload, load, distribution).
+            movements:          Total package movements of evaluated solutions.
+            reloads:            Total packages loaded back from waiting que.
+        """
+
+        self._evaluations:      int = evaluations
+        self._evaluation_time:  float = evaluation_time
+        self._stage_times:      dict = stage_times
+        self._movements:        int = movements
+        self._reloads:          int = reloads
+
+    @property
+    def evaluations(self) -> int:
+        return self._evaluations
+
+    @property
+    def evaluation_time(self) -> float:
+        return self._evaluation_time
+
+    @property
+    def stage_times(self) -> dict:
+        return self._stage_times
+
+    @property
+    def movements(self) -> int:
+        return self._movements
+
+    @property
+    def reloads(self) -> int:
+        return self._reloads
+
+    @property
+    def evaluations_per_second(self) -> float:
+        return 0.0 if self._evaluation_time == 0 else self._evaluations / self._evaluation_time
+
+    def to_dict(self) -> dict:
+        return {'evaluations': self._evaluations, 'evaluation_time': self._evaluation_time,
+                'stage_times': dict(self._stage_times), 'movements': self._movements, 'reloads': self._reloads}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'EvaluationProfile':
+        return cls(**data)
@@ -0,0 +1,40 @@
+from numpy import ndarray
+
+from src.domain.package import Package
+
+
+class PackageSequence(object):
+    """ Read-only sequence of packages backed by dataset columns, Package objects are created on access and know
+    their position in the sequence (Package.index).
+    """
+
+    def __init__(self, ids: ndarray, station_in: ndarray, station_out: ndarray, weight: ndarray):
+        """
+        Args:
+            ids: Package identification numbers.
+            station_in: Station of loading of each package.
+            station_out: Station of unloading of each package.
+            weight: Weight of each package.
+        """
+
+        self._ids:          ndarray = ids
+        self._station_in:   ndarray = station_in
+        self._station_out:  ndarray = station_out
+        self._weight:       ndarray = weight
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        index = range(len(self))[index]
+
+        return Package(int(self._ids[index]), int(self._station_in[index]), int(self._station_out[index]),
+                       int(self._weight[index]), index)
+
+    def __iter__(self):
+        for index, row in enumerate(zip(self._ids.tolist(), self._station_in.tolist(), self._station_out.tolist(),
+                                        self._weight.tolist())):
+            yield Package(*row, index)
@@ -0,0 +1,59 @@
+class PrefixCacheStats:
+    """Holds station-prefix snapshot cache counters of one optimization run.
+    """
+
+    def __init__(self, max_bytes: int, used_bytes: int, nodes: int, evaluations: int, stations_skipped: int,
+                 evictions: int):
+        """
+        Args:
+            max_bytes:          Memory budget of cached snapshots.
+            used_bytes:         Memory used by cached snapshots.
+            nodes:              Number of cached snapshots.
+            evaluations:        Evaluations that looked up cache.
+            stations_skipped:   Stations not simulated thanks to cache, summed over evaluations.
+            evictions:          Snapshots removed to stay within memory budget.
+        """
+
+        self._max_bytes:        int = max_bytes
+        self._used_bytes:       int = used_bytes
+        self._nodes:            int = nodes
+        self._evaluations:      int = evaluations
+        self._stations_skipped: int = stations_skipped
+        self._evictions:        int = evictions
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def used_bytes(self) -> int:
+        return self._used_bytes
+
+    @property
+    def nodes(self) -> int:
+        return self._nodes
+
+    @property
+    def evaluations(self) -> int:
+        return self._evaluations
+
+    @property
+    def stations_skipped(self) -> int:
+        return self._stations_skipped
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    @property
+    def avg_stations_skipped(self) -> float:
+        return 0.0 if self._evaluations == 0 else self._stations_skipped / self._evaluations
+
+    def to_dict(self) -> dict:
+        return {'max_bytes': self._max_bytes, 'used_bytes': self._used_bytes, 'nodes': self._nodes,
+                'evaluations': self._evaluations, 'stations_skipped': self._stations_skipped,
+                'evictions': self._evictions}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PrefixCacheStats':
+        return cls(**data)
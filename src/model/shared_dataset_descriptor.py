@@ -0,0 +1,52 @@
+class SharedDatasetDescriptor:
+    """Picklable description of dataset published in shared memory, see SharedDataset.
+    """
+
+    def __init__(self, name: str, title: str, total_packages: int, total_stations: int, width: int, height: int,
+                 size: int):
+        """
+        Args:
+            name:           Name of shared memory block.
+            title:          Dataset title.
+            total_packages: Total number of packages.
+            total_stations: Total number of stations.
+            width:          Width of cargo stowage space.
+            height:         Height of cargo stowage space.
+            size:           Number of packages in shared memory block.
+        """
+
+        self._name:             str = name
+        self._title:            str = title
+        self._total_packages:   int = total_packages
+        self._total_stations:   int = total_stations
+        self._width:            int = width
+        self._height:           int = height
+        self._size:             int = size
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def title(self) -> str:
+        return self._title
+
+    @property
+    def total_packages(self) -> int:
+        return self._total_packages
+
+    @property
+    def total_stations(self) -> int:
+        return self._total_stations
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def size(self) -> int:
+        return self._size
@@ -7,7 +7,7 @@ class OptimizationResult:
         Args:
             algorithm_title:    Genetic algorithm title.
             best_fitness:       Best calculated fitness.
-            best_solution:      Best solution.
+            best_solution:      Best solution, None if run stopped before its first evaluation finished.
             np:                 Population.
             n_fes:              Number of evaluations.
         """
@@ -37,3 +37,13 @@ class OptimizationResult:
     @property
     def n_fes(self) -> int:
         return self._n_fes
+
+    def to_dict(self) -> dict:
+        best_solution = None if self._best_solution is None else [float(x) for x in self._best_solution]
+
+        return {'algorithm_title': self._algorithm_title, 'best_fitness': float(self._best_fitness),
+                'best_solution': best_solution, 'np': int(self._np), 'n_fes': int(self._n_fes)}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'OptimizationResult':
+        return cls(**data)
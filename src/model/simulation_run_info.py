@@ -1,3 +1,7 @@
+from src.model.cache_stats import CacheStats
+from src.model.convergence_trace import ConvergenceTrace
+from src.model.evaluation_profile import EvaluationProfile
+from src.model.prefix_cache_stats import PrefixCacheStats
 from src.model.simulation_result import OptimizationResult
 
 
@@ -6,7 +10,9 @@ class SimulationRunInfo:
     """
 
     def __init__(self, completed: bool, has_error: bool, error_msg: str, execution_time: float,
-                 result: OptimizationResult):
+                 result: OptimizationResult, cache_stats: CacheStats = None, evaluator: str = '',
+                 prefix_stats: PrefixCacheStats = None, profile: EvaluationProfile = None, seed: int = None,
+                 repeat: int = 0, evaluations: int = 0, convergence: ConvergenceTrace = None, stop_reason: str = ''):
         """
         Args:
             completed: Indicates whether optimization ran to completion without any error.
@@ -14,6 +20,15 @@ class SimulationRunInfo:
             error_msg: Error msg if error occurred.
             execution_time: Total execution time of optimization in ms.
             result: Result of optimization.
+            cache_stats: Fitness cache counters, None if cache was not used.
+            evaluator: Name of fitness evaluator backend.
+            prefix_stats: Station-prefix snapshot cache counters, None if evaluator does not use it.
+            profile: Evaluation counters and stage times, None if instrumentation was not enabled.
+            seed: Random seed of algorithm, None if unknown.
+            repeat: Index of run among repeated runs of the same algorithm.
+            evaluations: Number of fitness evaluations the run completed.
+            convergence: Best-so-far fitness against evaluation count, None if not recorded.
+            stop_reason: Condition that stopped the run (n_fes, time_budget or stagnation), empty if unknown.
         """
 
         self._completed:        bool = completed
@@ -21,6 +36,15 @@ class SimulationRunInfo:
         self._error_msg:        str = error_msg
         self._execution_time:   float = execution_time
         self._result:           OptimizationResult = result
+        self._cache_stats:      CacheStats = cache_stats
+        self._evaluator:        str = evaluator
+        self._prefix_stats:     PrefixCacheStats = prefix_stats
+        self._profile:          EvaluationProfile = profile
+        self._seed:             int = seed
+        self._repeat:           int = repeat
+        self._evaluations:      int = evaluations
+        self._convergence:      ConvergenceTrace = convergence
+        self._stop_reason:      str = stop_reason
 
     @property
     def is_completed(self) -> bool:
@@ -41,3 +65,79 @@ class SimulationRunInfo:
     @property
     def result(self) -> OptimizationResult:
         return self._result
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        return self._cache_stats
+
+    @property
+    def evaluator(self) -> str:
+        return self._evaluator
+
+    @property
+    def prefix_stats(self) -> PrefixCacheStats:
+        return self._prefix_stats
+
+    @property
+    def profile(self) -> EvaluationProfile:
+        return self._profile
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    @property
+    def repeat(self) -> int:
+        return self._repeat
+
+    @property
+    def evaluations(self) -> int:
+        return self._evaluations
+
+    @property
+    def convergence(self) -> ConvergenceTrace:
+        return self._convergence
+
+    @property
+    def stop_reason(self) -> str:
+        return self._stop_reason
+
+    def to_dict(self) -> dict:
+        """Returns JSON serializable representation of run info, see from_dict.
+        """
+
+        return {
+            'completed': self._completed,
+            'has_error': self._has_error,
+            'error_msg': self._error_msg,
+            'execution_time': self._execution_time,
+            'result': self._result.to_dict(),
+            'cache_stats': None if self._cache_stats is None else self._cache_stats.to_dict(),
+            'evaluator': self._evaluator,
+            'prefix_stats': None if self._prefix_stats is None else self._prefix_stats.to_dict(),
+            'profile': None if self._profile is None else self._profile.to_dict(),
+            'seed': self._seed,
+            'repeat': self._repeat,
+            'evaluations': self._evaluations,
+            'convergence': None if self._convergence is None else self._convergence.to_dict(),
+            'stop_reason': self._stop_reason
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'SimulationRunInfo':
+        """Creates run info from representation returned by to_dict.
+
+        Args:
+            data: Run info as dict.
+
+        Returns: SimulationRunInfo obj.
+        """
+
+        kwargs = dict(data)
+        kwargs['result'] = OptimizationResult.from_dict(data['result'])
+
+        for key, model in [('cache_stats', CacheStats), ('prefix_stats', PrefixCacheStats),
+                           ('profile', EvaluationProfile), ('convergence', ConvergenceTrace)]:
+            kwargs[key] = None if data.get(key) is None else model.from_dict(data[key])
+
+        return cls(**kwargs)
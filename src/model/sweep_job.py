@@ -0,0 +1,64 @@
+class SweepJob:
+    """Picklable description of one job of parameter sweep.
+    """
+
+    def __init__(self, dataset_path: str, algorithm: str, n_fes: int, np: int, repeat: int, seed: int):
+        """
+        Args:
+            dataset_path:   Path to dataset .csv file.
+            algorithm:      NiaPy algorithm class name.
+            n_fes:          Total number of evaluations.
+            np:             Population size.
+            repeat:         Index of run among repeated runs with the same parameters.
+            seed:           Random seed of algorithm.
+        """
+
+        self._dataset_path: str = dataset_path
+        self._algorithm:    str = algorithm
+        self._n_fes:        int = n_fes
+        self._np:           int = np
+        self._repeat:       int = repeat
+        self._seed:         int = seed
+
+    @property
+    def dataset_path(self) -> str:
+        return self._dataset_path
+
+    @property
+    def algorithm(self) -> str:
+        return self._algorithm
+
+    @property
+    def n_fes(self) -> int:
+        return self._n_fes
+
+    @property
+    def np(self) -> int:
+        return self._np
+
+    @property
+    def repeat(self) -> int:
+        return self._repeat
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    @property
+    def key(self) -> str:
+        """ Identifies job within sweep, independent of its seed.
+        """
+
+        return job_key(self._dataset_path, self._algorithm, self._n_fes, self._np, self._repeat)
+
+    def to_dict(self) -> dict:
+        return {'dataset_path': self._dataset_path, 'algorithm': self._algorithm, 'n_fes': self._n_fes,
+                'np': self._np, 'repeat': self._repeat, 'seed': self._seed}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'SweepJob':
+        return cls(**data)
+
+
+def job_key(dataset_path: str, algorithm: str, n_fes: int, np: int, repeat: int) -> str:
+    return '{0}|{1}|{2}|{3}|{4}'.format(dataset_path, algorithm, n_fes, np, repeat)
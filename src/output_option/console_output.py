@@ -1,3 +1,5 @@
+from src.core.simulation.run_statistics import aggregate_results, has_repeats
+from src.model.simulation_run_info import SimulationRunInfo
 from src.output_option.output_option import OutputOptionInterface
 
 
@@ -6,6 +8,22 @@ class ConsoleOutputOption(OutputOptionInterface):
     def __init__(self, **kwargs):
         pass
 
+    def on_result(self, run_info: SimulationRunInfo):
+        """Prints one progress line as soon as run finishes, its full result is printed by save.
+
+        Args:
+            run_info: SimulationRunInfo of finished run.
+
+        Returns: void
+        """
+
+        if run_info.has_error:
+            print('finished {0}: {1}'.format(run_info.result.algorithm_title, run_info.error_msg))
+        else:
+            run = '' if run_info.seed is None else ' run {0}'.format(run_info.repeat + 1)
+            print('finished {0}{1}: fitness {2}, {3} ms'.format(run_info.result.algorithm_title, run,
+                                                               run_info.result.best_fitness, run_info.execution_time))
+
     def save(self, simulation_results: list):
         """Prints simulation results to the console.
 
@@ -19,13 +37,56 @@ class ConsoleOutputOption(OutputOptionInterface):
         print('+---------------------------------')
 
         for run_result in simulation_results:
+            self._print_run(run_result)
+
+        if has_repeats(simulation_results):
+            print('Aggregates of repeated runs:')
+
+            for stats in aggregate_results(simulation_results):
+                print('Title:', stats.algorithm_title)
+                print('Runs: {0}, failed {1}'.format(stats.runs, stats.failed))
 
-            print('Title:', run_result.result.algorithm_title, )
+                if stats.best_run is not None:
+                    print('Fitness: mean {0:.2f}, median {1:.2f}, std {2:.2f}, best {3} (run {4})'.format(
+                        stats.fitness_mean, stats.fitness_median, stats.fitness_std,
+                        stats.best_run.result.best_fitness, stats.best_run.repeat + 1))
+                    print('Execution time: mean {0:.3f}, median {1:.3f}, std {2:.3f} ms'.format(
+                        stats.time_mean, stats.time_median, stats.time_std))
 
-            if not run_result.has_error:
-                print('Fitness:', run_result.result.best_fitness)
-                print('Execution time:', run_result.execution_time, 'ms')
-            else:
-                print(run_result.error_msg, '\n')
+                print('+---------------------------------')
 
-            print('+---------------------------------')
+    @staticmethod
+    def _print_run(run_result: SimulationRunInfo):
+        print('Title:', run_result.result.algorithm_title, )
+
+        if not run_result.has_error:
+            print('Fitness:', run_result.result.best_fitness)
+            print('Execution time:', run_result.execution_time, 'ms')
+            print('Evaluations done:', run_result.evaluations)
+
+            if run_result.stop_reason:
+                print('Stopped by:', run_result.stop_reason)
+            print('Evaluator:', run_result.evaluator)
+
+            if run_result.seed is not None:
+                print('Run: {0}, seed {1}'.format(run_result.repeat + 1, run_result.seed))
+
+            if run_result.cache_stats is not None:
+                print('Fitness cache: hits {0}, misses {1}, evictions {2}'.format(
+                    run_result.cache_stats.hits, run_result.cache_stats.misses, run_result.cache_stats.evictions))
+
+            if run_result.profile is not None:
+                print('Evaluations: {0} ({1:.0f}/s), movements {2}, reloads {3}'.format(
+                    run_result.profile.evaluations, run_result.profile.evaluations_per_second,
+                    run_result.profile.movements, run_result.profile.reloads))
+                print('Stage times:', ', '.join('{0} {1:.3f} s'.format(stage, seconds) for stage, seconds
+                                                in run_result.profile.stage_times.items()))
+
+            if run_result.prefix_stats is not None:
+                print('Prefix cache: avg stations skipped {0:.2f}, snapshots {1}, evictions {2}'.format(
+                    run_result.prefix_stats.avg_stations_skipped, run_result.prefix_stats.nodes,
+                    run_result.prefix_stats.evictions))
+        else:
+            print(run_result.error_msg, '\n')
+
+        print('+---------------------------------')
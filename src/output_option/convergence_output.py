@@ -0,0 +1,57 @@
+import os
+from matplotlib.pyplot import figure
+import matplotlib.pyplot as plt
+
+from src.core.simulation.run_statistics import has_repeats
+from src.output_option.output_option import OutputOptionInterface
+
+
+class ConvergenceOutputOption(OutputOptionInterface):
+
+    def __init__(self, **kwargs):
+        """
+        Args:
+            dir_path: Path to dir.
+        """
+
+        self._dir_path:     str = kwargs['dir_path']
+        self._file_name:    str = 'convergence'
+
+    def save(self, simulation_results: list):
+        """ Saves best-so-far fitness against number of evaluations of each run as graph into .png file.
+
+        Throws ValueError if invalid path or file name.
+
+        Args:
+            simulation_results: A list of simulation results.
+
+        Returns: void
+        """
+
+        if self._dir_path is None or len(self._dir_path) < 1 or not os.path.isdir(self._dir_path):
+            raise ValueError('Invalid dir path')
+
+        if self._file_name is None or len(self._file_name) < 1:
+            raise ValueError('Invalid file name')
+
+        repeats = has_repeats(simulation_results)
+
+        figure(num=None, figsize=(11, 7), dpi=80, facecolor='w', edgecolor='k')
+
+        for run_result in simulation_results:
+            if run_result.has_error or run_result.convergence is None or len(run_result.convergence.evaluations) < 1:
+                continue
+
+            label = run_result.result.algorithm_title
+            if repeats:
+                label = '{0} #{1}'.format(label, run_result.repeat + 1)
+
+            plt.step(run_result.convergence.evaluations, run_result.convergence.fitness, where='post', label=label)
+
+        plt.xlabel('Evaluations')
+        plt.ylabel('Best fitness')
+        plt.title('Convergence', fontsize=16)
+        plt.legend()
+
+        plt.savefig(os.path.join(self._dir_path, self._file_name + '.png'))
+        plt.close()
@@ -55,9 +55,7 @@ class GifOutputOption(OutputOptionInterface):
         imageio.mimsave(full_path, img_arr, fps=55, loop=0, duration=4)
 
     def _simulate_route(self, best_run: SimulationRunInfo) -> list:
-        total_p_movements, sol_index, total_lay_ds, total_we_ds = 0, 0, 0, 0
         cargo_space = CargoSpace(width=self._dataset.width, height=self._dataset.height)
-        min_p_we, max_p_we = 101, 0
         img_arr, col_we_sum = [], [0 for x in range(self._dataset.width)]
 
         # Define columns.
@@ -70,17 +68,11 @@ class GifOutputOption(OutputOptionInterface):
         for package in self._dataset.packages:
             packages_by_station[package.station_in - 1].append(package)
 
-        # Define package column positions via given solution. Get min and max weight.
-        for package in self._dataset.packages:
-            if package.weight > max_p_we:
-                max_p_we = package.weight
-            if package.weight < min_p_we:
-                min_p_we = package.weight
-            package.given_col_index = np.digitize(best_run.result.best_solution[sol_index], cargo_sp_col_sep) - 1
-            sol_index += 1
+        # Define package column positions via given solution.
+        col_assignment = np.digitize(best_run.result.best_solution, cargo_sp_col_sep) - 1
 
         # Set weight groups.
-        we_gr = np.linspace(min_p_we, max_p_we, 5)
+        we_gr = np.linspace(self._dataset.weight.min(initial=101), self._dataset.weight.max(initial=0), 5)
 
         big_font = ImageFont.truetype(fm.findfont(fm.FontProperties(family='DejaVu Sans')), 20)
         small_font = ImageFont.truetype(fm.findfont(fm.FontProperties(family='DejaVu Sans')), 8)
@@ -107,7 +99,8 @@ class GifOutputOption(OutputOptionInterface):
 
             draw_obj.text((dr_x, 50), 'After station', fill='black', font=big_font)
 
-            col_we_sum = cargo_space.simulate_stop_at_station(station, packages_by_station[station - 1]).weight_dist
+            col_we_sum = cargo_space.simulate_stop_at_station(station, packages_by_station[station - 1],
+                                                              col_assignment).weight_dist
 
             self._draw_cs(draw_obj, cargo_space, dr_x, dr_y, small_font, col_we_sum, we_gr)
 
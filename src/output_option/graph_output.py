@@ -3,6 +3,7 @@ from matplotlib.pyplot import figure
 import matplotlib.pyplot as plt
 from textwrap import wrap
 
+from src.core.simulation.run_statistics import aggregate_results
 from src.output_option.output_option import OutputOptionInterface
 
 
@@ -18,7 +19,7 @@ class GraphOutputOption(OutputOptionInterface):
         self._file_name:    str = 'results'
 
     def save(self, simulation_results: list):
-        """ Saves simulation results as graph into .png file.
+        """ Saves simulation results as graph into .png file, repeated runs are shown as mean with standard deviation.
 
         Throws ValueError if invalid path or file name.
 
@@ -34,24 +35,24 @@ class GraphOutputOption(OutputOptionInterface):
         if self._file_name is None or len(self._file_name) < 1:
             raise ValueError('Invalid file name')
 
-        names = [x.result.algorithm_title for x in simulation_results]
-        labels = ['\n'.join(wrap(x, 10)) for x in names]
-        fitness_scores = [x.result.best_fitness for x in simulation_results]
-        exe_time = [x.execution_time for x in simulation_results]
+        aggregates = aggregate_results(simulation_results)
+        labels = ['\n'.join(wrap(x.algorithm_title, 10)) for x in aggregates]
+        fitness_scores = [x.fitness_mean for x in aggregates]
+        exe_time = [x.time_mean for x in aggregates]
 
         figure(num=None, figsize=(11, 11), dpi=80, facecolor='w', edgecolor='k')
         plt.subplot(2, 1, 1)
-        bars = plt.bar(labels, fitness_scores, color='lightblue', width=0.3)
+        bars = plt.bar(labels, fitness_scores, yerr=[x.fitness_std for x in aggregates], color='lightblue', width=0.3)
         plt.ylabel('Value')
         plt.title('Fitness score')
         plt.suptitle('Fitness and execution time comparison', fontsize=16)
 
         for bar in bars:
             height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width() / 2.0, height, height, ha='center', va='bottom')
+            plt.text(bar.get_x() + bar.get_width() / 2.0, height, '{0:g}'.format(height), ha='center', va='bottom')
 
         plt.subplot(2, 1, 2)
-        bars = plt.bar(labels, exe_time, color='pink', width=0.3)
+        bars = plt.bar(labels, exe_time, yerr=[x.time_std for x in aggregates], color='pink', width=0.3)
         plt.ylabel('Seconds')
         plt.title('Execution time')
 
@@ -1,5 +1,18 @@
+from src.model.simulation_run_info import SimulationRunInfo
+
+
 class OutputOptionInterface:
 
+    def on_result(self, run_info: SimulationRunInfo):
+        """Called with result of each run as soon as it finishes, before save. Does nothing by default.
+
+        Args:
+            run_info: SimulationRunInfo of finished run.
+
+        Returns: void
+        """
+        pass
+
     def save(self, simulation_results: list):
         """Saves simulation results.
 
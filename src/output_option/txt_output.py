@@ -1,7 +1,9 @@
 import datetime
 import os
 
+from src.core.simulation.run_statistics import aggregate_results, has_repeats
 from src.model.dataset import Dataset
+from src.model.simulation_run_info import SimulationRunInfo
 from src.output_option.output_option import OutputOptionInterface
 
 
@@ -17,6 +19,32 @@ class TextOutputOption(OutputOptionInterface):
         self._dir_path:     str = kwargs['dir_path']
         self._dataset:      Dataset = kwargs['dataset']
         self._file_name:    str = 'results'
+        self._partial_name: str = 'results_partial'
+
+    def on_result(self, run_info: SimulationRunInfo):
+        """Appends result of run to partial results .txt file as soon as it finishes, so results of finished runs are
+        kept if simulation stops. save removes the partial file.
+
+        Throws ValueError if invalid path.
+
+        Args:
+            run_info: SimulationRunInfo of finished run.
+
+        Returns: void
+        """
+
+        if self._dir_path is None or len(self._dir_path) < 1 or not os.path.isdir(self._dir_path):
+            raise ValueError('Invalid dir path')
+
+        partial_path = os.path.join(self._dir_path, self._partial_name + '.txt')
+        is_new = not os.path.isfile(partial_path)
+
+        with open(partial_path, 'a') as wr:
+            if is_new:
+                self._write_header(wr, None)
+                wr.write('----Optimization results (in order runs finished)---- \n')
+
+            self._write_run(wr, run_info)
 
     def save(self, simulation_results: list):
         """Saves simulation results as .txt file.
@@ -41,17 +69,67 @@ class TextOutputOption(OutputOptionInterface):
             raise ValueError('File with that name already exists')
 
         with open(full_path, 'w') as wr:
-            wr.write('----Optimization info---- \n')
-            wr.write('Date: %s \n' % datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S'))
-            wr.write('Algorithms: %s \n \n' % len(simulation_results))
-            wr.write('----Dataset info---- \n')
-            wr.write('Name : %s \n' % self._dataset.title)
-            wr.write('Number of packages : %s \n' % self._dataset.total_packages)
-            wr.write('Number of stations : %s \n' % self._dataset.total_stations)
-            wr.write('Cargo stowage size : %sx%s \n \n' % (self._dataset.width, self._dataset.height))
+            self._write_header(wr, len(simulation_results))
             wr.write('----Optimization results---- \n')
 
             for sim_res in simulation_results:
-                wr.write('%s (np=%s, nFes=%s), Fitness: %s, ExecutionTime : %s sec \n' % (
-                    sim_res.result.algorithm_title, sim_res.result.np, sim_res.result.n_fes,
-                    sim_res.result.best_fitness, sim_res.execution_time))
+                self._write_run(wr, sim_res)
+
+            if has_repeats(simulation_results):
+                wr.write('\n----Aggregates of repeated runs---- \n')
+
+                for stats in aggregate_results(simulation_results):
+                    wr.write('%s (runs=%s, failed=%s) \n' % (stats.algorithm_title, stats.runs, stats.failed))
+
+                    if stats.best_run is not None:
+                        wr.write('    Fitness: mean %.2f, median %.2f, std %.2f, best %s (seed=%s) \n' % (
+                            stats.fitness_mean, stats.fitness_median, stats.fitness_std,
+                            stats.best_run.result.best_fitness, stats.best_run.seed))
+                        wr.write('    ExecutionTime: mean %.3f, median %.3f, std %.3f sec \n' % (
+                            stats.time_mean, stats.time_median, stats.time_std))
+
+        partial_path = os.path.join(self._dir_path, self._partial_name + '.txt')
+
+        if os.path.isfile(partial_path):
+            os.remove(partial_path)
+
+    def _write_header(self, wr, algorithms: int):
+        wr.write('----Optimization info---- \n')
+        wr.write('Date: %s \n' % datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S'))
+
+        if algorithms is not None:
+            wr.write('Algorithms: %s \n' % algorithms)
+
+        wr.write(' \n')
+        wr.write('----Dataset info---- \n')
+        wr.write('Name : %s \n' % self._dataset.title)
+        wr.write('Number of packages : %s \n' % self._dataset.total_packages)
+        wr.write('Number of stations : %s \n' % self._dataset.total_stations)
+        wr.write('Cargo stowage size : %sx%s \n \n' % (self._dataset.width, self._dataset.height))
+
+    @staticmethod
+    def _write_run(wr, sim_res: SimulationRunInfo):
+        wr.write('%s (np=%s, nFes=%s, evaluator=%s, seed=%s), Fitness: %s, ExecutionTime : %s sec, '
+                 'Evaluations : %s, StoppedBy : %s \n' % (
+                     sim_res.result.algorithm_title, sim_res.result.np, sim_res.result.n_fes,
+                     sim_res.evaluator, sim_res.seed, sim_res.result.best_fitness, sim_res.execution_time,
+                     sim_res.evaluations, sim_res.stop_reason or '-'))
+
+        if sim_res.cache_stats is not None:
+            wr.write('    Fitness cache (size=%s, canonical=%s): hits %s, misses %s, evictions %s \n' % (
+                sim_res.cache_stats.size, sim_res.cache_stats.canonical, sim_res.cache_stats.hits,
+                sim_res.cache_stats.misses, sim_res.cache_stats.evictions))
+
+        if sim_res.profile is not None:
+            wr.write('    Evaluations: %s (%.0f/s), movements %s, reloads %s \n' % (
+                sim_res.profile.evaluations, sim_res.profile.evaluations_per_second,
+                sim_res.profile.movements, sim_res.profile.reloads))
+            wr.write('    Stage times: %s \n' % ', '.join('%s %.3f s' % (stage, seconds) for stage, seconds
+                                                       in sim_res.profile.stage_times.items()))
+
+        if sim_res.prefix_stats is not None:
+            wr.write('    Prefix cache (bytes=%s/%s): avg stations skipped %.2f, snapshots %s, '
+                     'evictions %s \n' % (
+                sim_res.prefix_stats.used_bytes, sim_res.prefix_stats.max_bytes,
+                sim_res.prefix_stats.avg_stations_skipped, sim_res.prefix_stats.nodes,
+                sim_res.prefix_stats.evictions))
@@ -0,0 +1,44 @@
+import random
+import unittest
+
+import numpy as np
+
+from src.core.benchmark.array_benchmark import ArrayBenchmarkC
+from src.core.benchmark.benchmark import BenchmarkC
+from src.dataset.generator.base_generator import BaseDatasetGenerator
+from src.dataset.reader.csv_reader import CSVDatasetReader
+
+
+class ArrayBenchmarkTest(unittest.TestCase):
+
+    def test_same_fitness_as_reference_on_file_dataset(self):
+        dataset = CSVDatasetReader().read('../../resource/testSet.csv')
+        assert_same_fitness(self, dataset, seed=1)
+
+    def test_same_fitness_as_reference_on_generated_datasets(self):
+        random.seed(7)
+        generator = BaseDatasetGenerator()
+
+        for pack_c, stat_n, cargo_dim in [(30, 5, 5), (54, 5, 5), (40, 6, 4), (300, 8, 10)]:
+            assert_same_fitness(self, generator.make('test123', pack_c, stat_n, cargo_dim), seed=pack_c)
+
+    def test_same_fitness_as_reference_with_full_columns(self):
+        random.seed(3)
+        dataset = BaseDatasetGenerator().make('test123', 54, 5, 5)
+        reference = BenchmarkC(dataset=dataset).function()
+        evaluate = ArrayBenchmarkC(dataset=dataset).function()
+
+        # Every package in the same column forces loading into the emptiest column.
+        for value in [0.0, 0.5, 1.0]:
+            sol = np.full(dataset.total_packages, value)
+            self.assertEqual(reference(dataset.total_packages, sol), evaluate(dataset.total_packages, sol))
+
+
+def assert_same_fitness(test: unittest.TestCase, dataset, seed: int):
+    reference = BenchmarkC(dataset=dataset).function()
+    evaluate = ArrayBenchmarkC(dataset=dataset).function()
+    rng = np.random.default_rng(seed)
+
+    for _ in range(50):
+        sol = rng.random(dataset.total_packages)
+        test.assertEqual(reference(dataset.total_packages, sol), evaluate(dataset.total_packages, sol))
@@ -0,0 +1,44 @@
+import random
+import unittest
+
+import numpy as np
+
+from src.core.benchmark.batch_benchmark import BatchBenchmarkC
+from src.core.benchmark.benchmark import BenchmarkC
+from src.dataset.generator.base_generator import BaseDatasetGenerator
+from src.dataset.reader.csv_reader import CSVDatasetReader
+
+
+class BatchBenchmarkTest(unittest.TestCase):
+
+    def test_same_fitness_as_reference_on_file_dataset(self):
+        dataset = CSVDatasetReader().read('../../resource/testSet.csv')
+        assert_same_fitness(self, dataset, seed=1)
+
+    def test_same_fitness_as_reference_on_generated_datasets(self):
+        random.seed(7)
+        generator = BaseDatasetGenerator()
+
+        for pack_c, stat_n, cargo_dim in [(30, 5, 5), (54, 5, 5), (40, 6, 4), (300, 8, 10)]:
+            assert_same_fitness(self, generator.make('test123', pack_c, stat_n, cargo_dim), seed=pack_c)
+
+    def test_single_solution_adapter(self):
+        random.seed(3)
+        dataset = BaseDatasetGenerator().make('test123', 54, 5, 5)
+        reference = BenchmarkC(dataset=dataset).function()
+        evaluate = BatchBenchmarkC(dataset=dataset).function()
+        sol = np.random.default_rng(3).random(dataset.total_packages)
+
+        self.assertEqual(reference(dataset.total_packages, sol), evaluate(dataset.total_packages, sol))
+
+
+def assert_same_fitness(test: unittest.TestCase, dataset, seed: int):
+    reference = BenchmarkC(dataset=dataset).function()
+    evaluate_population = BatchBenchmarkC(dataset=dataset).population_function()
+    population = np.random.default_rng(seed).random((40, dataset.total_packages))
+
+    # Same value for the whole solution forces loading into the emptiest column.
+    population[::5] = population[::5, :1]
+
+    expected = [reference(dataset.total_packages, sol) for sol in population]
+    test.assertEqual(expected, evaluate_population(dataset.total_packages, population).tolist())
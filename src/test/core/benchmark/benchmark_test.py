@@ -0,0 +1,52 @@
+import random
+import unittest
+from multiprocessing.pool import ThreadPool as Pool
+
+import numpy as np
+
+from src.core.benchmark.benchmark import BenchmarkC
+from src.dataset.generator.base_generator import BaseDatasetGenerator
+from src.model.dataset import Dataset
+
+
+class BenchmarkTest(unittest.TestCase):
+
+    def test_concurrent_evaluations_match_serial(self):
+        random.seed(5)
+        dataset = BaseDatasetGenerator().make('test123', 54, 5, 5)
+        evaluators = [BenchmarkC(dataset=dataset).function() for _ in range(4)]
+        solutions = np.random.default_rng(5).random((200, dataset.total_packages))
+
+        expected = [evaluators[0](dataset.total_packages, sol) for sol in solutions]
+
+        pool = Pool(4)
+        actual = pool.map(lambda i: evaluators[i % 4](dataset.total_packages, solutions[i]), range(len(solutions)))
+        pool.close()
+        pool.join()
+
+        self.assertEqual(expected, actual)
+
+    def test_evaluation_does_not_modify_packages(self):
+        random.seed(5)
+        dataset = BaseDatasetGenerator().make('test123', 30, 5, 5)
+        before = [(package.id, package.station_in, package.station_out, package.weight)
+                  for package in dataset.packages]
+
+        BenchmarkC(dataset=dataset).function()(dataset.total_packages, np.full(dataset.total_packages, 0.3))
+
+        self.assertEqual(before, [(package.id, package.station_in, package.station_out, package.weight)
+                                  for package in dataset.packages])
+
+    def test_duplicate_package_ids_keep_their_columns(self):
+        random.seed(5)
+        generated = BaseDatasetGenerator().make('test123', 30, 5, 5)
+        dataset = Dataset.from_columns(generated.title, generated.total_packages, generated.total_stations,
+                                       generated.width, generated.height, ids=np.zeros(generated.total_packages),
+                                       station_in=generated.station_in, station_out=generated.station_out,
+                                       weight=generated.weight)
+        solutions = np.random.default_rng(5).random((20, dataset.total_packages))
+
+        expected = [BenchmarkC(dataset=generated).function()(dataset.total_packages, sol) for sol in solutions]
+        actual = [BenchmarkC(dataset=dataset).function()(dataset.total_packages, sol) for sol in solutions]
+
+        self.assertEqual(expected, actual)
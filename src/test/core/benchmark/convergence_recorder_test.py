@@ -0,0 +1,65 @@
+import unittest
+
+import numpy as np
+
+from src.core.benchmark.array_benchmark import ArrayBenchmarkC
+from src.core.benchmark.convergence_recorder import ConvergenceRecorder
+from src.dataset.reader.csv_reader import CSVDatasetReader
+
+
+class ConvergenceRecorderTest(unittest.TestCase):
+
+    def test_records_improvements(self):
+        recorder = ConvergenceRecorder()
+
+        for fitness in [50, 60, 40, 40, 45, 30, 35, 36]:
+            recorder.add(fitness)
+
+        trace = recorder.trace()
+        self.assertEqual([1, 3, 6, 8], trace.evaluations)
+        self.assertEqual([50, 40, 30, 30], trace.fitness)
+
+    def test_add_many(self):
+        recorder = ConvergenceRecorder()
+        recorder.add(50)
+        recorder.add_many(np.array([55, 20, 30]))
+        recorder.add_many(np.array([25, 21]))
+
+        trace = recorder.trace()
+        self.assertEqual([1, 3, 6], trace.evaluations)
+        self.assertEqual([50, 20, 20], trace.fitness)
+
+    def test_capacity_is_bounded(self):
+        recorder = ConvergenceRecorder(capacity=8)
+
+        for fitness in range(1000, 0, -1):
+            recorder.add(fitness)
+
+        trace = recorder.trace()
+        self.assertLessEqual(len(trace.evaluations), 9)
+        self.assertEqual(1, trace.evaluations[0])
+        self.assertEqual((1000, 1), (trace.evaluations[-1], trace.fitness[-1]))
+        self.assertEqual(sorted(trace.evaluations), trace.evaluations)
+
+    def test_benchmark_trace(self):
+        dataset = CSVDatasetReader().read('../../resource/testSet.csv')
+        benchmark = ArrayBenchmarkC(dataset, cache_size=4)
+        evaluate = benchmark.function()
+        solutions = np.random.RandomState(1).rand(20, dataset.total_packages)
+        fitness = [evaluate(dataset.total_packages, solution) for solution in list(solutions) + list(solutions)]
+
+        trace = benchmark.convergence
+        self.assertEqual(40, trace.evaluations[-1])
+        self.assertEqual(min(fitness), trace.fitness[-1])
+        self.assertEqual(np.minimum.accumulate(fitness)[np.array(trace.evaluations) - 1].tolist(), trace.fitness)
+
+    def test_restore_continues_after_resumed_evaluations(self):
+        recorder = ConvergenceRecorder()
+        recorder.restore(600, 40)
+        recorder.add(45)
+        recorder.add(30)
+        recorder.add(35)
+
+        trace = recorder.trace()
+        self.assertEqual([600, 602, 603], trace.evaluations)
+        self.assertEqual([40, 30, 30], trace.fitness)
@@ -0,0 +1,48 @@
+import unittest
+
+import numpy as np
+
+from src.core.benchmark.dataset_index import DatasetIndex
+from src.domain.package import Package
+from src.model.dataset import Dataset
+
+
+class DatasetIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset = Dataset('name', 5, 3, 3, 3,
+                               [Package(id_num=1, station_in=2, station_out=3, weight=10),
+                                Package(id_num=2, station_in=1, station_out=3, weight=20),
+                                Package(id_num=3, station_in=1, station_out=2, weight=30),
+                                Package(id_num=4, station_in=2, station_out=3, weight=40),
+                                Package(id_num=5, station_in=1, station_out=3, weight=50)
+                                ])
+
+    def test_packages_by_station_keep_dataset_order(self):
+        index = DatasetIndex(self.dataset)
+
+        self.assertEqual([1, 2, 4], index.packages_at_station(1).tolist())
+        self.assertEqual([0, 3], index.packages_at_station(2).tolist())
+        self.assertEqual([], index.packages_at_station(3).tolist())
+
+    def test_load_after_station(self):
+        index = DatasetIndex(self.dataset)
+
+        self.assertEqual([3, 4, 0], index.load_after.tolist())
+        self.assertEqual([round(3 / 3), round(4 / 3), 0], index.perfect_lay)
+        self.assertEqual([round(100 / 3), round(120 / 3), 0], index.perfect_we)
+
+    def test_decode_matches_column_boundaries(self):
+        index = DatasetIndex(self.dataset)
+        sol = np.array([0.0, 0.33, 0.34, 0.99, 1.0])
+
+        self.assertEqual([0, 0, 1, 2, 2], index.decode(sol).tolist())
+        self.assertEqual([[0, 0, 1, 2, 2]] * 2, index.decode(np.array([sol, sol])).tolist())
+
+    def test_remaining_bound(self):
+        index = DatasetIndex(self.dataset)
+
+        self.assertEqual((10, 1, 1), index.remaining_bound(1))
+        self.assertEqual((7, 1, 0), index.remaining_bound(2))
+        self.assertEqual((4, 0, 0), index.remaining_bound(3))
+        self.assertEqual((0, 0, 0), index.remaining_bound(4))
@@ -0,0 +1,100 @@
+import random
+import unittest
+
+import numpy as np
+
+from src.core.benchmark.benchmark import BenchmarkC
+from src.core.benchmark.benchmark_errors import InvalidEvaluatorName, InvalidEvaluatorOptions
+from src.core.benchmark.evaluator_registry import evaluator_names, create_evaluator, check_evaluator_options
+from src.core.runner.runner import Runner
+from src.dataset.generator.base_generator import BaseDatasetGenerator
+from src.dataset.reader.csv_reader import CSVDatasetReader
+from src.model.aborted_fitness import AbortedFitness
+from src.model.algorithm_spec import AlgorithmSpec
+
+
+class EvaluatorRegistryTest(unittest.TestCase):
+
+    def test_at_least_three_evaluators(self):
+        self.assertIn(BenchmarkC.Name, evaluator_names())
+        self.assertGreaterEqual(len(evaluator_names()), 3)
+
+    def test_invalid_name(self):
+        dataset = CSVDatasetReader().read('../../resource/testSet.csv')
+        self.assertRaises(InvalidEvaluatorName, lambda: create_evaluator('invalid', dataset))
+
+    def test_options_checked_against_chosen_evaluator(self):
+        check_evaluator_options('prefix', {'max_bytes': 1024})
+
+        for name in evaluator_names():
+            if name != 'prefix':
+                self.assertRaises(InvalidEvaluatorOptions, check_evaluator_options, name, {'max_bytes': 1024})
+
+        dataset = CSVDatasetReader().read('../../resource/testSet.csv')
+        self.assertRaises(InvalidEvaluatorOptions, lambda: create_evaluator('numpy', dataset, options={'max_bytes': 1}))
+
+    def test_base_options_not_accepted_as_evaluator_options(self):
+        dataset = CSVDatasetReader().read('../../resource/testSet.csv')
+
+        for key, value in [('cache_size', 10), ('canonicalize', True), ('early_abort', True)]:
+            self.assertRaises(InvalidEvaluatorOptions, check_evaluator_options, 'prefix', {key: value})
+            self.assertRaises(InvalidEvaluatorOptions, lambda: create_evaluator('numpy', dataset, options={key: value}))
+
+    def test_same_fitness_on_all_evaluators(self):
+        random.seed(5)
+        datasets = [CSVDatasetReader().read('../../resource/testSet.csv'),
+                    BaseDatasetGenerator().make('test123', 54, 5, 5)]
+
+        for dataset in datasets:
+            reference = create_evaluator(BenchmarkC.Name, dataset).function()
+            evaluators = [create_evaluator(name, dataset).function() for name in evaluator_names()]
+            rng = np.random.default_rng(dataset.total_packages)
+
+            for _ in range(20):
+                sol = rng.random(dataset.total_packages)
+                expected = reference(dataset.total_packages, sol)
+
+                for name, evaluate in zip(evaluator_names(), evaluators):
+                    self.assertEqual(expected, evaluate(dataset.total_packages, sol), name)
+
+    def test_cutoff_returns_exact_fitness_or_bound_above_cutoff(self):
+        dataset = CSVDatasetReader().read('../../resource/testSet.csv')
+        rng = np.random.default_rng(3)
+
+        for name in evaluator_names():
+            evaluate = create_evaluator(name, dataset).function()
+
+            for _ in range(20):
+                sol = rng.random(dataset.total_packages)
+                fitness = evaluate(dataset.total_packages, sol)
+
+                # Cutoff far below fitness stops right away, cutoff above it never stops.
+                self.assertEqual(fitness, evaluate(dataset.total_packages, sol, fitness))
+                aborted = evaluate(dataset.total_packages, sol, 0)
+
+                if isinstance(aborted, AbortedFitness):
+                    self.assertTrue(0 < aborted <= fitness, name)
+                else:
+                    self.assertEqual(fitness, aborted, name)
+
+    def test_aborted_fitness_not_cached(self):
+        dataset = CSVDatasetReader().read('../../resource/testSet.csv')
+        evaluate = create_evaluator(BenchmarkC.Name, dataset, cache_size=10).function()
+        sol = np.random.default_rng(4).random(dataset.total_packages)
+
+        self.assertIsInstance(evaluate(dataset.total_packages, sol, 0), AbortedFitness)
+        self.assertNotIsInstance(evaluate(dataset.total_packages, sol), AbortedFitness)
+
+    def test_best_of_early_abort_run_is_exact(self):
+        dataset = CSVDatasetReader().read('../../resource/testSet.csv')
+        evaluate = create_evaluator('numpy', dataset).function()
+
+        for name in ['ParticleSwarmAlgorithm', 'BatAlgorithm', 'GreyWolfOptimizer', 'GeneticAlgorithm']:
+            spec = AlgorithmSpec(name=name, seed=5, np=10, n_fes=300, evaluator='numpy',
+                                 evaluator_kwargs={'early_abort': True})
+            run_info = Runner.run_spec(spec, dataset)
+
+            self.assertFalse(run_info.has_error, run_info.error_msg)
+            self.assertNotIsInstance(run_info.result.best_fitness, AbortedFitness)
+            self.assertEqual(evaluate(dataset.total_packages, np.asarray(run_info.result.best_solution)),
+                             run_info.result.best_fitness, name)
@@ -0,0 +1,65 @@
+import random
+import unittest
+
+import numpy as np
+
+from src.core.benchmark.benchmark import BenchmarkC
+from src.core.benchmark.fitness_cache import FitnessCache
+from src.dataset.generator.base_generator import BaseDatasetGenerator
+from src.domain.package import Package
+from src.model.dataset import Dataset
+
+
+class FitnessCacheTest(unittest.TestCase):
+
+    def test_lru_eviction_and_counters(self):
+        cache = FitnessCache(size=2, width=3)
+        a, b, c = [cache.key(np.array(x)) for x in ([0, 1], [1, 1], [2, 1])]
+
+        cache.put(a, 10)
+        cache.put(b, 20)
+        self.assertEqual(10, cache.get(a))
+        cache.put(c, 30)
+
+        self.assertIsNone(cache.get(b))
+        self.assertEqual(10, cache.get(a))
+        stats = cache.stats()
+        self.assertEqual((2, 1, 1), (stats.hits, stats.misses, stats.evictions))
+
+    def test_canonical_key_ignores_column_labels(self):
+        cache = FitnessCache(size=10, width=3, canonicalize=True)
+
+        self.assertEqual(cache.key(np.array([2, 2, 0, 1])), cache.key(np.array([0, 0, 1, 2])))
+        self.assertNotEqual(cache.key(np.array([2, 2, 0, 1])), cache.key(np.array([0, 1, 1, 2])))
+
+    def test_cached_benchmark_returns_same_fitness(self):
+        random.seed(11)
+        dataset = BaseDatasetGenerator().make('test123', 54, 5, 5)
+        reference = BenchmarkC(dataset=dataset).function()
+        benchmark = BenchmarkC(dataset=dataset, cache_size=50)
+        evaluate = benchmark.function()
+        solutions = np.random.default_rng(11).random((40, dataset.total_packages))
+
+        for sol in np.concatenate((solutions, solutions)):
+            self.assertEqual(reference(dataset.total_packages, sol), evaluate(dataset.total_packages, sol))
+
+        self.assertEqual(40, benchmark.cache_stats.hits)
+        self.assertEqual(40, benchmark.cache_stats.misses)
+
+    def test_canonicalize_only_when_columns_never_fill(self):
+        packages = [Package(id_num=i, station_in=1 + i % 2, station_out=3, weight=10 + i) for i in range(4)]
+
+        roomy = BenchmarkC(dataset=Dataset('name', 4, 3, 3, 4, packages), cache_size=10, canonicalize=True)
+        tight = BenchmarkC(dataset=Dataset('name', 4, 3, 3, 3, packages), cache_size=10, canonicalize=True)
+
+        self.assertTrue(roomy.cache_stats.canonical)
+        self.assertFalse(tight.cache_stats.canonical)
+
+    def test_canonical_cache_returns_same_fitness(self):
+        packages = [Package(id_num=i, station_in=1 + i % 3, station_out=4 + i % 2, weight=10 + i) for i in range(5)]
+        dataset = Dataset('name', 5, 5, 3, 5, packages)
+        reference = BenchmarkC(dataset=dataset).function()
+        evaluate = BenchmarkC(dataset=dataset, cache_size=100, canonicalize=True).function()
+
+        for sol in np.random.default_rng(2).random((100, dataset.total_packages)):
+            self.assertEqual(reference(dataset.total_packages, sol), evaluate(dataset.total_packages, sol))
@@ -0,0 +1,90 @@
+import random
+import unittest
+
+import numpy as np
+
+from src.core.benchmark.benchmark import BenchmarkC
+from src.core.benchmark.incremental_benchmark import IncrementalBenchmarkC
+from src.dataset.generator.base_generator import BaseDatasetGenerator
+from src.model.aborted_fitness import AbortedFitness
+
+
+class IncrementalBenchmarkTest(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(13)
+        self.dataset = BaseDatasetGenerator().make('test123', 100, 8, 6)
+        self.reference = BenchmarkC(dataset=self.dataset).function()
+        self.rng = np.random.default_rng(13)
+
+    def test_delta_matches_full_evaluation(self):
+        benchmark = IncrementalBenchmarkC(dataset=self.dataset)
+        parent = self.rng.random(self.dataset.total_packages)
+        handle = benchmark.register(parent)
+
+        self.assertEqual(self.reference(self.dataset.total_packages, parent), benchmark.fitness(handle))
+
+        for _ in range(100):
+            changed = self.rng.choice(self.dataset.total_packages, size=self.rng.integers(1, 6), replace=False)
+            values = self.rng.random(len(changed))
+            child = parent.copy()
+            child[changed] = values
+
+            self.assertEqual(self.reference(self.dataset.total_packages, child),
+                             benchmark.evaluate_delta(handle, changed, values))
+
+    def test_unchanged_columns_return_parent_fitness(self):
+        benchmark = IncrementalBenchmarkC(dataset=self.dataset)
+        parent = self.rng.random(self.dataset.total_packages)
+        handle = benchmark.register(parent)
+
+        self.assertEqual(benchmark.fitness(handle), benchmark.evaluate_delta(handle, [0], [parent[0]]))
+
+    def test_released_parent_is_unknown(self):
+        benchmark = IncrementalBenchmarkC(dataset=self.dataset, max_parents=1)
+        first = benchmark.register(self.rng.random(self.dataset.total_packages))
+        second = benchmark.register(self.rng.random(self.dataset.total_packages))
+        benchmark.release(second)
+
+        for handle in [first, second]:
+            try:
+                benchmark.evaluate_delta(handle, [0], [0.5])
+                self.fail('Released parent should not be accepted')
+            except ValueError:
+                pass
+
+    def test_evaluations_are_recorded(self):
+        benchmark = IncrementalBenchmarkC(dataset=self.dataset, cache_size=100)
+        parent = self.rng.random(self.dataset.total_packages)
+        handle = benchmark.register(parent)
+        child = parent.copy()
+        child[[3, 7]] = 1 - child[[3, 7]]
+
+        fitness = benchmark.evaluate_delta(handle, [3, 7], child[[3, 7]])
+        cached = benchmark.evaluate_delta(handle, [3, 7], child[[3, 7]])
+
+        self.assertEqual(fitness, cached)
+        self.assertEqual(1, benchmark.cache_stats.hits)
+        self.assertEqual(3, benchmark.convergence.evaluations[-1])
+        self.assertEqual(float(min(fitness, benchmark.fitness(handle))), benchmark.convergence.fitness[-1])
+
+    def test_early_abort(self):
+        benchmark = IncrementalBenchmarkC(dataset=self.dataset, early_abort=True)
+        parent = self.rng.random(self.dataset.total_packages)
+        handle = benchmark.register(parent)
+
+        for _ in range(50):
+            changed = self.rng.choice(self.dataset.total_packages, size=5, replace=False)
+            values = self.rng.random(len(changed))
+            child = parent.copy()
+            child[changed] = values
+
+            fitness = benchmark.evaluate_delta(handle, changed, values)
+            expected = self.reference(self.dataset.total_packages, child)
+
+            if isinstance(fitness, AbortedFitness):
+                self.assertLessEqual(fitness, expected)
+            else:
+                self.assertEqual(expected, fitness)
+
+        self.assertGreater(benchmark.aborted, 0)
@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+
+from src.core.benchmark.evaluator_registry import evaluator_names, create_evaluator
+from src.core.benchmark.instrumentation import Instrumentation
+from src.dataset.reader.csv_reader import CSVDatasetReader
+
+
+class InstrumentationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset = CSVDatasetReader().read('../../resource/testSet.csv')
+        self.solutions = np.random.default_rng(5).random((10, self.dataset.total_packages))
+
+    def test_disabled_by_default(self):
+        benchmark = create_evaluator('reference', self.dataset)
+        benchmark.function()(self.dataset.total_packages, self.solutions[0])
+
+        self.assertIsNone(benchmark.profile)
+
+    def test_counts_evaluations_and_movements(self):
+        movements = {}
+
+        for name in evaluator_names():
+            benchmark = create_evaluator(name, self.dataset)
+            benchmark.enable_instrumentation()
+            evaluate = benchmark.function()
+
+            for sol in self.solutions:
+                evaluate(self.dataset.total_packages, sol)
+
+            profile = benchmark.profile
+            movements[name] = profile.movements
+            self.assertEqual(len(self.solutions), profile.evaluations, name)
+            self.assertGreater(profile.evaluations_per_second, 0, name)
+            self.assertEqual(set(Instrumentation.Stages), set(profile.stage_times.keys()), name)
+
+        # Movements do not depend on evaluator, except prefix one that does not simulate stations restored from cache.
+        movements.pop('prefix', None)
+        self.assertEqual(1, len(set(movements.values())))
+
+    def test_stage_times(self):
+        benchmark = create_evaluator('reference', self.dataset)
+        benchmark.enable_instrumentation()
+        benchmark.function()(self.dataset.total_packages, self.solutions[0])
+        profile = benchmark.profile
+
+        self.assertTrue(all(seconds > 0 for seconds in profile.stage_times.values()))
+        self.assertLessEqual(sum(profile.stage_times.values()), profile.evaluation_time)
+        self.assertGreater(profile.reloads, 0)
@@ -0,0 +1,47 @@
+import unittest
+
+import numpy as np
+
+from src.core.benchmark.array_benchmark import ArrayBenchmarkC
+from src.core.benchmark.prefix_benchmark import PrefixBenchmarkC
+from src.dataset.reader.csv_reader import CSVDatasetReader
+
+
+class PrefixBenchmarkTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset = CSVDatasetReader().read('../../resource/testSet.csv')
+        self.reference = ArrayBenchmarkC(dataset=self.dataset).function()
+
+        # Mutations of one package at a time, parents change now and then.
+        rng = np.random.default_rng(2)
+        parent, self.solutions = rng.random(self.dataset.total_packages), []
+
+        for _ in range(100):
+            sol = parent.copy()
+            sol[rng.integers(self.dataset.total_packages)] = rng.random()
+            self.solutions.append(sol)
+            parent = sol if rng.random() < 0.2 else parent
+
+    def test_same_fitness_and_skips_stations(self):
+        benchmark = PrefixBenchmarkC(dataset=self.dataset)
+        evaluate = benchmark.function()
+
+        for sol in self.solutions:
+            self.assertEqual(self.reference(self.dataset.total_packages, sol),
+                             evaluate(self.dataset.total_packages, sol))
+
+        self.assertEqual(len(self.solutions), benchmark.prefix_stats.evaluations)
+        self.assertGreater(benchmark.prefix_stats.avg_stations_skipped, 0)
+
+    def test_memory_budget(self):
+        for max_bytes in [0, 5000, 20000]:
+            benchmark = PrefixBenchmarkC(dataset=self.dataset, max_bytes=max_bytes)
+            evaluate = benchmark.function()
+
+            for sol in self.solutions:
+                self.assertEqual(self.reference(self.dataset.total_packages, sol),
+                                 evaluate(self.dataset.total_packages, sol))
+
+            self.assertLessEqual(benchmark.prefix_stats.used_bytes, max_bytes)
+            self.assertGreater(benchmark.prefix_stats.evictions, 0)
@@ -0,0 +1,241 @@
+import socket
+import threading
+import time
+import unittest
+from multiprocessing import Process
+from unittest import mock
+
+from src.core.distributed import protocol
+from src.core.distributed.coordinator import Coordinator
+from src.core.distributed.distributed_errors import ConnectionClosed, NoActiveWorkers
+from src.core.distributed.worker import Worker
+from src.core.runner.runner import Runner
+from src.dataset.reader.csv_reader import CSVDatasetReader
+from src.model.algorithm_spec import AlgorithmSpec
+from src.model.simulation_run_info import SimulationRunInfo
+
+DATASET_PATH = '../../resource/testSet.csv'
+
+
+def run_worker(host: str, port: int, heartbeat_interval: float = 5.0):
+    Worker(host, port, connect_timeout=10.0, heartbeat_interval=heartbeat_interval).run()
+
+
+class ProtocolTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        left, right = socket.socketpair()
+
+        with left, right:
+            protocol.send_message(left, protocol.Job, job_id=3, spec={'name': 'GeneticAlgorithm'})
+            message = protocol.recv_message(right)
+
+        self.assertEqual(protocol.Job, message['type'])
+        self.assertEqual(3, message['job_id'])
+        self.assertEqual({'name': 'GeneticAlgorithm'}, message['spec'])
+
+    def test_closed_connection(self):
+        left, right = socket.socketpair()
+        left.close()
+
+        with right:
+            self.assertRaises(ConnectionClosed, protocol.recv_message, right)
+
+
+class CoordinatorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset = CSVDatasetReader().read(DATASET_PATH)
+        self.specs = [AlgorithmSpec(name=name, seed=seed, np=5, n_fes=40, evaluator='numpy', evaluator_kwargs={},
+                                    repeat=seed)
+                      for seed, name in enumerate(['GeneticAlgorithm', 'ParticleSwarmAlgorithm'] * 2)]
+
+    def _start(self, coordinator: Coordinator) -> tuple:
+        results = []
+        thread = threading.Thread(target=lambda: results.extend(coordinator.run(self.specs, self.dataset)))
+        thread.start()
+
+        return thread, results
+
+    def _drop_after_job(self, coordinator: Coordinator) -> dict:
+        with socket.create_connection(coordinator.address) as connection:
+            protocol.send_message(connection, protocol.Request)
+            return protocol.recv_message(connection)
+
+    def _hang_after_job(self, coordinator: Coordinator, heartbeat_interval: float = None) -> threading.Thread:
+        # Worker that takes a job and never returns its result, with or without heartbeats.
+        def hang():
+            with socket.create_connection(coordinator.address) as connection:
+                protocol.send_message(connection, protocol.Request)
+                job = protocol.recv_message(connection)
+
+                try:
+                    # Both end once coordinator closes the connection.
+                    while heartbeat_interval is not None:
+                        time.sleep(heartbeat_interval)
+                        protocol.send_message(connection, protocol.Heartbeat, job_id=job['job_id'])
+
+                    connection.recv(1)
+                except OSError:
+                    pass
+
+        thread = threading.Thread(target=hang, daemon=True)
+        thread.start()
+        time.sleep(0.2)
+
+        return thread
+
+    def _start_workers(self, coordinator: Coordinator, count: int) -> list:
+        workers = [Process(target=run_worker, args=coordinator.address) for _ in range(count)]
+
+        for worker in workers:
+            worker.start()
+
+        return workers
+
+    def test_workers_run_all_jobs(self):
+        coordinator = Coordinator('127.0.0.1', 0)
+        thread, results = self._start(coordinator)
+        workers = self._start_workers(coordinator, 2)
+
+        thread.join(timeout=60)
+        for worker in workers:
+            worker.join(timeout=10)
+
+        self.assertFalse(thread.is_alive())
+        self.assertTrue(all(worker.exitcode == 0 for worker in workers))
+        self.assertEqual(4, len(results))
+        self.assertFalse(any(res_info.has_error for res_info in results))
+        self.assertEqual([0, 1, 2, 3], sorted(res_info.repeat for res_info in results))
+        self.assertTrue(all(res_info.evaluations >= 40 for res_info in results))
+
+    def test_workers_run_all_jobs_without_heartbeat_timeout(self):
+        coordinator = Coordinator('127.0.0.1', 0, heartbeat_timeout=None, job_timeout=30.0)
+        thread, results = self._start(coordinator)
+        workers = self._start_workers(coordinator, 2)
+
+        thread.join(timeout=60)
+        for worker in workers:
+            worker.join(timeout=10)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(4, len(results))
+        self.assertFalse(any(res_info.has_error for res_info in results))
+
+    def test_job_of_dropped_worker_is_retried(self):
+        coordinator = Coordinator('127.0.0.1', 0)
+        thread, results = self._start(coordinator)
+
+        job = self._drop_after_job(coordinator)
+        workers = self._start_workers(coordinator, 2)
+
+        thread.join(timeout=60)
+        for worker in workers:
+            worker.join(timeout=10)
+
+        self.assertEqual(protocol.Job, job['type'])
+        self.assertEqual(4, len(results))
+        self.assertFalse(any(res_info.has_error for res_info in results))
+
+    def test_job_fails_after_max_attempts(self):
+        coordinator = Coordinator('127.0.0.1', 0, max_attempts=1)
+        thread, results = self._start(coordinator)
+
+        self._drop_after_job(coordinator)
+        workers = self._start_workers(coordinator, 1)
+
+        thread.join(timeout=60)
+        for worker in workers:
+            worker.join(timeout=10)
+
+        self.assertEqual(4, len(results))
+        self.assertEqual(1, sum(res_info.has_error for res_info in results))
+
+    def test_job_is_retried_after_unexpected_error(self):
+        from_dict, calls = SimulationRunInfo.from_dict, []
+
+        def malformed_first(data):
+            calls.append(data)
+            if len(calls) == 1:
+                raise AttributeError('malformed result')
+            return from_dict(data)
+
+        with mock.patch.object(SimulationRunInfo, 'from_dict', side_effect=malformed_first):
+            coordinator = Coordinator('127.0.0.1', 0)
+            thread, results = self._start(coordinator)
+            workers = self._start_workers(coordinator, 2)
+
+            thread.join(timeout=60)
+            for worker in workers:
+                worker.join(timeout=10)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(5, len(calls))
+        self.assertEqual(4, len(results))
+        self.assertFalse(any(res_info.has_error for res_info in results))
+
+    def test_run_fails_without_workers(self):
+        coordinator = Coordinator('127.0.0.1', 0, idle_timeout=0.5)
+
+        self.assertRaises(NoActiveWorkers, coordinator.run, self.specs, self.dataset)
+
+    def test_job_of_hung_worker_is_retried(self):
+        for kwargs, heartbeat_interval in [(dict(job_timeout=1.0), 0.1), (dict(heartbeat_timeout=0.5), None)]:
+            coordinator = Coordinator('127.0.0.1', 0, **kwargs)
+            thread, results = self._start(coordinator)
+
+            self._hang_after_job(coordinator, heartbeat_interval)
+            workers = self._start_workers(coordinator, 1)
+
+            thread.join(timeout=60)
+            for worker in workers:
+                worker.join(timeout=10)
+
+            self.assertFalse(thread.is_alive())
+            self.assertEqual(4, len(results))
+            self.assertFalse(any(res_info.has_error for res_info in results))
+
+    def test_heartbeats_keep_long_job(self):
+        coordinator = Coordinator('127.0.0.1', 0, max_attempts=1, heartbeat_timeout=0.3)
+        specs = [AlgorithmSpec(name='GeneticAlgorithm', seed=1, np=10, n_fes=10 ** 9, evaluator='numpy',
+                               evaluator_kwargs={}, time_budget=1.0)]
+        results = []
+        thread = threading.Thread(target=lambda: results.extend(coordinator.run(specs, self.dataset)))
+        thread.start()
+
+        worker = Process(target=run_worker, args=coordinator.address + (0.05,))
+        worker.start()
+
+        thread.join(timeout=60)
+        worker.join(timeout=10)
+
+        self.assertEqual(1, len(results))
+        self.assertFalse(results[0].has_error, results[0].error_msg)
+        self.assertGreaterEqual(results[0].execution_time, 1.0)
+
+    def test_hung_job_fails_after_max_attempts(self):
+        coordinator = Coordinator('127.0.0.1', 0, max_attempts=1, job_timeout=1.0)
+        thread, results = self._start(coordinator)
+
+        self._hang_after_job(coordinator, heartbeat_interval=0.1)
+        workers = self._start_workers(coordinator, 1)
+
+        thread.join(timeout=60)
+        for worker in workers:
+            worker.join(timeout=10)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(4, len(results))
+        self.assertEqual(1, sum(res_info.has_error for res_info in results))
+
+    def test_same_result_as_local_run(self):
+        coordinator = Coordinator('127.0.0.1', 0)
+        thread, results = self._start(coordinator)
+        workers = self._start_workers(coordinator, 1)
+
+        thread.join(timeout=60)
+        for worker in workers:
+            worker.join(timeout=10)
+
+        local = {spec.repeat: Runner.run_spec(spec, self.dataset).result.best_fitness for spec in self.specs}
+        self.assertEqual(local, {res_info.repeat: res_info.result.best_fitness for res_info in results})
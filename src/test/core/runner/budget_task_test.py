@@ -0,0 +1,104 @@
+import json
+import math
+import unittest
+
+import numpy as np
+from NiaPy.util import TimeException
+
+from src.core.benchmark.array_benchmark import ArrayBenchmarkC
+from src.core.runner.budget_task import BudgetTask, StagnationException
+from src.core.runner.runner import Runner
+from src.dataset.reader.csv_reader import CSVDatasetReader
+from src.model.algorithm_spec import AlgorithmSpec
+from src.model.simulation_run_info import SimulationRunInfo
+
+
+class BudgetTaskTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset = CSVDatasetReader().read('../../resource/testSet.csv')
+
+    def test_exhausted_budget_stops_task(self):
+        task = BudgetTask(time_budget=0.0, D=self.dataset.total_packages, nFES=100,
+                          benchmark=ArrayBenchmarkC(self.dataset))
+
+        self.assertTrue(task.stopCond())
+        with self.assertRaises(TimeException):
+            task.stopCondE()
+
+    def test_no_budget(self):
+        task = BudgetTask(D=self.dataset.total_packages, nFES=100, benchmark=ArrayBenchmarkC(self.dataset))
+
+        self.assertFalse(task.stopCond())
+        task.stopCondE()
+
+    def test_run_stops_when_budget_runs_out(self):
+        for name in ['ParticleSwarmAlgorithm', 'GeneticAlgorithm']:
+            run_info = Runner.run_spec(AlgorithmSpec(name=name, seed=3, np=10, n_fes=10 ** 9, evaluator='numpy',
+                                                     evaluator_kwargs={}, time_budget=0.3), self.dataset)
+
+            self.assertFalse(run_info.has_error, run_info.error_msg)
+            self.assertLess(run_info.execution_time, 5)
+            self.assertTrue(0 < run_info.evaluations < 10 ** 9)
+            self.assertTrue(math.isfinite(run_info.result.best_fitness))
+
+    def test_run_without_evaluations_serializes(self):
+        run_info = Runner.run_spec(AlgorithmSpec(name='GeneticAlgorithm', seed=3, np=10, n_fes=100, evaluator='numpy',
+                                                 evaluator_kwargs={}, time_budget=0.0), self.dataset)
+
+        self.assertFalse(run_info.has_error, run_info.error_msg)
+        self.assertEqual(0, run_info.evaluations)
+        self.assertIsNone(run_info.result.best_solution)
+
+        restored = SimulationRunInfo.from_dict(json.loads(json.dumps(run_info.to_dict())))
+        self.assertIsNone(restored.result.best_solution)
+        self.assertEqual(0, restored.evaluations)
+
+    def test_stagnation_stops_task(self):
+        task = BudgetTask(stagnation_evals=3, stagnation_epsilon=1.0, D=1, nFES=100,
+                          benchmark=_SequenceBenchmark([10, 9.5, 9.2, 8, 7.9, 7.8, 7.7, 7.6]))
+
+        for _ in range(6):
+            self.assertFalse(task.stopCond())
+            task.eval(np.zeros(1))
+
+        # Last improvement by more than epsilon was 8 at evaluation 4, 7.9 - 7.7 do not count.
+        task.eval(np.zeros(1))
+        self.assertTrue(task.stopCond())
+        self.assertEqual(BudgetTask.StopStagnation, task.stop_reason)
+
+        with self.assertRaises(StagnationException):
+            task.stopCondE()
+
+    def test_run_stops_on_stagnation(self):
+        run_info = Runner.run_spec(AlgorithmSpec(name='ParticleSwarmAlgorithm', seed=3, np=10, n_fes=10 ** 6,
+                                                 evaluator='numpy', evaluator_kwargs={}, stagnation_evals=200),
+                                   self.dataset)
+
+        self.assertFalse(run_info.has_error, run_info.error_msg)
+        self.assertEqual(BudgetTask.StopStagnation, run_info.stop_reason)
+        self.assertLess(run_info.evaluations, 10 ** 6)
+
+        convergence = run_info.convergence
+        self.assertGreaterEqual(run_info.evaluations - convergence.evaluations[-2], 200)
+
+    def test_stop_reason_n_fes(self):
+        run_info = Runner.run_spec(AlgorithmSpec(name='ParticleSwarmAlgorithm', seed=3, np=10, n_fes=50,
+                                                 evaluator='numpy', evaluator_kwargs={}), self.dataset)
+
+        self.assertEqual(BudgetTask.StopEvaluations, run_info.stop_reason)
+        self.assertEqual(50, run_info.evaluations)
+
+
+class _SequenceBenchmark:
+    """ Returns given fitness values in order.
+    """
+
+    def __init__(self, values: list):
+        self.Lower, self.Upper = 0, 1
+        self._values = list(values)
+
+    def function(self):
+        def evaluate(d: int, sol: list) -> float:
+            return self._values.pop(0)
+        return evaluate
@@ -0,0 +1,132 @@
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.core.runner.checkpoint_task import ResumeRandomState, load_checkpoint, save_checkpoint
+from src.core.runner.runner import Runner
+from src.core.simulation.algorithm_factory import build_algorithm
+from src.dataset.generator.base_generator import BaseDatasetGenerator
+from src.dataset.reader.csv_reader import CSVDatasetReader
+from src.model.algorithm_spec import AlgorithmSpec
+from src.model.checkpoint import Checkpoint
+from src.model.checkpoint_options import CheckpointOptions
+
+
+class CheckpointTaskTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, 'run.npz')
+        self.dataset = CSVDatasetReader().read('../../resource/testSet.csv')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def _spec(self, n_fes: int, resume_path: str = None) -> AlgorithmSpec:
+        return AlgorithmSpec(name='ParticleSwarmAlgorithm', seed=3, np=10, n_fes=n_fes, evaluator='numpy',
+                             evaluator_kwargs={}, instrumentation=True,
+                             checkpoint=CheckpointOptions(path=self.path, every_evals=15, resume_path=resume_path))
+
+    def test_save_load_round_trip(self):
+        random_state = np.random.RandomState(5)
+        checkpoint = Checkpoint(evaluations=12, iterations=2, best_solution=np.array([0.1, 0.2]), best_fitness=7.0,
+                                population=np.array([[0.3, 0.4]]), population_fitness=np.array([9.0]),
+                                random_state=random_state.get_state())
+
+        save_checkpoint(self.path, checkpoint)
+        loaded = load_checkpoint(self.path)
+
+        self.assertEqual((12, 2, 7.0), (loaded.evaluations, loaded.iterations, loaded.best_fitness))
+        self.assertTrue(np.array_equal(checkpoint.population, loaded.population))
+        self.assertFalse(os.path.exists(self.path + '.tmp'))
+
+        restored = np.random.RandomState()
+        restored.set_state(loaded.random_state)
+        self.assertEqual(random_state.rand(), restored.rand())
+
+    def test_resume_random_state_hands_out_population(self):
+        checkpoint = Checkpoint(evaluations=3, iterations=1, best_solution=np.array([0.5, 0.5]), best_fitness=1.0,
+                                population=np.array([[0.1, 0.1], [0.2, 0.2], [0.3, 0.3]]),
+                                population_fitness=np.array([4.0, 2.0, 3.0]),
+                                random_state=np.random.RandomState(1).get_state())
+
+        # Best solution replaces the worst row, rows past the population are random.
+        draws = ResumeRandomState(checkpoint, 4).rand(4, 2)
+        self.assertEqual([[0.5, 0.5], [0.2, 0.2], [0.3, 0.3]], draws[:3].tolist())
+        self.assertEqual(np.random.RandomState(1).rand(8)[6:].tolist(), draws[3].tolist())
+
+        draws = ResumeRandomState(checkpoint, 4).uniform(0, 1, [4, 2])
+        self.assertEqual([[0.5, 0.5], [0.2, 0.2], [0.3, 0.3]], draws[:3].tolist())
+
+        random_state = ResumeRandomState(checkpoint, 4, skip_draws=1)
+        self.assertEqual(np.random.RandomState(1).rand(2).tolist(), random_state.rand(2).tolist())
+        self.assertEqual([0.5, 0.5], random_state.rand(2).tolist())
+        self.assertEqual(0, len(random_state.uniform([], [])))
+        self.assertEqual([0.2, 0.2], random_state.rand(2).tolist())
+
+    def test_resume_random_state_drops_population_after_initialization(self):
+        checkpoint = Checkpoint(evaluations=3, iterations=1, best_solution=None, best_fitness=1.0,
+                                population=np.array([[0.1, 0.1], [0.2, 0.2], [0.3, 0.3]]),
+                                population_fitness=np.array([1.0, 2.0, 3.0]),
+                                random_state=np.random.RandomState(1).get_state())
+
+        # Draws of other shape than population or solution end the initialization.
+        for draw in [lambda state: state.rand(), lambda state: state.rand(2, 2), lambda state: state.uniform(0, 1, 3)]:
+            random_state = ResumeRandomState(checkpoint, 3)
+            self.assertEqual([0.1, 0.1], random_state.rand(2).tolist())
+            draw(random_state)
+
+            self.assertNotIn(random_state.rand(2).tolist(), [[0.2, 0.2], [0.3, 0.3]])
+            self.assertNotIn(random_state.rand(3, 2)[0].tolist(), [[0.2, 0.2], [0.3, 0.3]])
+
+    def test_every_algorithm_resumes_population(self):
+        random.seed(3)
+        dataset = BaseDatasetGenerator().make('test123', 54, 5, 5)
+        algorithms = ['GeneticAlgorithm', 'GreyWolfOptimizer', 'FlowerPollinationAlgorithm',
+                      'ArtificialBeeColonyAlgorithm', 'ParticleSwarmAlgorithm', 'BatAlgorithm']
+
+        for name in algorithms:
+            spec = dict(name=name, seed=3, np=10, evaluator='numpy', evaluator_kwargs={})
+            first = Runner.run_spec(AlgorithmSpec(n_fes=40, checkpoint=CheckpointOptions(path=self.path), **spec),
+                                    dataset)
+            self.assertFalse(first.has_error, first.error_msg)
+
+            checkpoint = load_checkpoint(self.path)
+            expected = np.vstack([checkpoint.best_solution,
+                                  checkpoint.population[np.argsort(checkpoint.population_fitness, kind='stable')]])
+
+            algorithm = build_algorithm(AlgorithmSpec(n_fes=60, checkpoint=CheckpointOptions(
+                path=self.path, resume_path=self.path), **spec), dataset)
+            evaluated, evaluate = [], algorithm.task.eval
+            algorithm.task.eval = lambda solution: evaluated.append(np.array(solution)) or evaluate(solution)
+            algorithm.run()
+
+            # ABC evaluates half of population size food sources.
+            rows = 5 if name == 'ArtificialBeeColonyAlgorithm' else 10
+            self.assertEqual(expected[:rows].tolist(), np.array(evaluated[:rows]).tolist(), name)
+            self.assertEqual(60, algorithm.task.Evals, name)
+
+    def test_run_resumes_from_checkpoint(self):
+        first = Runner.run_spec(self._spec(n_fes=40), self.dataset)
+        self.assertFalse(first.has_error)
+        self.assertEqual(40, load_checkpoint(self.path).evaluations)
+
+        resumed = Runner.run_spec(self._spec(n_fes=100, resume_path=self.path), self.dataset)
+
+        self.assertFalse(resumed.has_error)
+        self.assertEqual(60, resumed.profile.evaluations)
+        self.assertLessEqual(resumed.result.best_fitness, first.result.best_fitness)
+        self.assertEqual(100, load_checkpoint(self.path).evaluations)
+
+    def test_resumed_run_continues_convergence_trace(self):
+        first = Runner.run_spec(self._spec(n_fes=40), self.dataset)
+        resumed = Runner.run_spec(self._spec(n_fes=100, resume_path=self.path), self.dataset)
+
+        self.assertFalse(resumed.has_error)
+        self.assertEqual(40, resumed.convergence.evaluations[0])
+        self.assertEqual(100, resumed.convergence.evaluations[-1])
+        self.assertEqual(first.result.best_fitness, resumed.convergence.fitness[0])
+        self.assertEqual(resumed.result.best_fitness, resumed.convergence.fitness[-1])
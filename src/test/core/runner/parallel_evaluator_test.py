@@ -0,0 +1,119 @@
+import unittest
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+from NiaPy.util import FesException
+
+from src.core.benchmark.array_benchmark import ArrayBenchmarkC
+from src.core.runner.budget_task import BudgetTask
+from src.core.runner.parallel_evaluator import ParallelEvaluator
+from src.core.runner.runner import Runner
+from src.core.simulation.algorithm_factory import POPULATION_ALGORITHMS, build_algorithm
+from src.dataset.reader.csv_reader import CSVDatasetReader
+from src.model.algorithm_spec import AlgorithmSpec
+
+
+class ParallelEvaluatorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset = CSVDatasetReader().read('../../resource/testSet.csv')
+        self.population = np.random.RandomState(1).rand(7, self.dataset.total_packages)
+
+    def _task(self, n_fes: int, population_evaluator: ParallelEvaluator = None) -> BudgetTask:
+        task = BudgetTask(D=self.dataset.total_packages, nFES=n_fes, benchmark=ArrayBenchmarkC(self.dataset),
+                          population_evaluator=population_evaluator)
+        task.start()
+
+        return task
+
+    def test_same_fitness_as_serial(self):
+        evaluator = ParallelEvaluator(self.dataset, 'numpy', {}, 3)
+        serial, parallel = self._task(100), self._task(100, evaluator)
+
+        try:
+            expected = np.apply_along_axis(serial.eval, 1, self.population)
+            fitness = np.apply_along_axis(parallel.eval, 1, self.population)
+        finally:
+            parallel.close()
+
+        self.assertEqual(expected.tolist(), fitness.tolist())
+        self.assertEqual(serial.Evals, parallel.Evals)
+        self.assertEqual(serial.x_f, parallel.x_f)
+        self.assertEqual(serial.benchmark.convergence.fitness, parallel.benchmark.convergence.fitness)
+
+    def test_stops_at_evaluation_limit(self):
+        evaluator = ParallelEvaluator(self.dataset, 'numpy', {}, 2)
+        task = self._task(4, evaluator)
+
+        try:
+            self.assertRaises(FesException, np.apply_along_axis, task.eval, 1, self.population)
+        finally:
+            task.close()
+
+        self.assertEqual(4, task.Evals)
+
+    def test_rows_changed_after_first_row_evaluated_serially(self):
+        evaluator = ParallelEvaluator(self.dataset, 'numpy', {}, 2)
+        serial, parallel = self._task(100), self._task(100, evaluator)
+        population, changed = self.population.copy(), self.population[::-1].copy()
+
+        # Rows are replaced while the population is evaluated, like GreyWolfOptimizer repairs them.
+        try:
+            for task, rows in [(serial, self.population.copy()), (parallel, population)]:
+                for i in range(len(rows)):
+                    rows[i] = changed[i] if i % 2 else rows[i]
+                    task.eval(rows[i])
+        finally:
+            parallel.close()
+
+        self.assertEqual(serial.x_f, parallel.x_f)
+        self.assertEqual(serial.benchmark.convergence.fitness, parallel.benchmark.convergence.fitness)
+
+    def test_run_same_as_serial(self):
+        for name in ['ParticleSwarmAlgorithm', 'GravitationalSearchAlgorithm', 'SineCosineAlgorithm',
+                     'GreyWolfOptimizer', 'GeneticAlgorithm']:
+            spec = dict(name=name, seed=5, np=8, n_fes=60, evaluator='numpy', evaluator_kwargs={})
+            serial = Runner.run_spec(AlgorithmSpec(**spec), self.dataset)
+            parallel = Runner.run_spec(AlgorithmSpec(eval_workers=2, **spec), self.dataset)
+
+            self.assertFalse(parallel.has_error, parallel.error_msg)
+            self.assertEqual(serial.result.best_fitness, parallel.result.best_fitness)
+            self.assertEqual(serial.evaluations, parallel.evaluations)
+
+    def test_run_in_threads_same_as_serial(self):
+        spec = dict(name='ParticleSwarmAlgorithm', np=8, n_fes=60, evaluator='numpy', evaluator_kwargs={})
+        serial = [Runner.run_spec(AlgorithmSpec(seed=seed, **spec), self.dataset) for seed in range(3)]
+
+        with ThreadPool(3) as pool:
+            parallel = pool.map(lambda seed: Runner.run_spec(AlgorithmSpec(seed=seed, eval_workers=2, **spec),
+                                                             self.dataset), range(3))
+
+        self.assertFalse(any(info.has_error for info in parallel), [info.error_msg for info in parallel])
+        self.assertEqual([info.result.best_fitness for info in serial], [info.result.best_fitness for info in parallel])
+
+    def test_population_algorithms_use_workers_for_every_evaluation(self):
+        for name in POPULATION_ALGORITHMS:
+            alg_obj = build_algorithm(AlgorithmSpec(name=name, seed=5, np=8, n_fes=80, evaluator='numpy',
+                                                    evaluator_kwargs={}, eval_workers=2), self.dataset)
+            info = Runner.run(alg_obj, 5, 0)
+
+            self.assertFalse(info.has_error, info.error_msg)
+            self.assertEqual(80, alg_obj.task.parallel_evaluations)
+
+    def test_other_algorithms_evaluate_serially(self):
+        for name in ['GreyWolfOptimizer', 'FlowerPollinationAlgorithm', 'BatAlgorithm']:
+            alg_obj = build_algorithm(AlgorithmSpec(name=name, seed=5, np=8, n_fes=80, evaluator='numpy',
+                                                    evaluator_kwargs={}, eval_workers=2), self.dataset)
+
+            self.assertIsNone(alg_obj.task.population_evaluator)
+
+    def test_run_with_early_abort_same_as_serial(self):
+        for name in ['ParticleSwarmAlgorithm', 'BatAlgorithm']:
+            spec = dict(name=name, seed=5, np=8, n_fes=200, evaluator='numpy', evaluator_kwargs={'early_abort': True})
+            serial = Runner.run_spec(AlgorithmSpec(**spec), self.dataset)
+            parallel = Runner.run_spec(AlgorithmSpec(eval_workers=2, **spec), self.dataset)
+
+            self.assertFalse(parallel.has_error, parallel.error_msg)
+            self.assertEqual(serial.result.best_fitness, parallel.result.best_fitness)
+            self.assertEqual(list(serial.result.best_solution), list(parallel.result.best_solution))
+            self.assertEqual(serial.evaluations, parallel.evaluations)
@@ -0,0 +1,36 @@
+import pickle
+import unittest
+
+from src.core.simulation.algorithm_factory import algorithm_type, build_algorithm
+from src.core.simulation.simulation_errors import InvalidAlgorithmName
+from src.domain.package import Package
+from src.model.algorithm_spec import AlgorithmSpec
+from src.model.dataset import Dataset
+
+
+class AlgorithmFactoryTest(unittest.TestCase):
+
+    def test_algorithm_type_invalid(self):
+        for name in ['invalidName', 'Task', 'Algorithm_']:
+            with self.assertRaises(InvalidAlgorithmName):
+                algorithm_type(name)
+
+    def test_build_algorithm_from_unpickled_spec(self):
+        dataset = Dataset('name', 5, 3, 3, 3,
+                          [Package(id_num=1, station_in=1, station_out=2, weight=30),
+                           Package(id_num=2, station_in=2, station_out=3, weight=30),
+                           Package(id_num=3, station_in=1, station_out=3, weight=30),
+                           Package(id_num=4, station_in=2, station_out=3, weight=30),
+                           Package(id_num=5, station_in=1, station_out=2, weight=30)
+                           ])
+        spec = AlgorithmSpec(name='GreyWolfOptimizer', seed=7, np=5, n_fes=30, evaluator='numpy',
+                             evaluator_kwargs={'cache_size': 10}, instrumentation=True)
+
+        alg_obj = build_algorithm(pickle.loads(pickle.dumps(spec)), dataset)
+
+        self.assertEqual('GreyWolfOptimizer', type(alg_obj).__name__)
+        self.assertEqual(5, alg_obj.NP)
+        self.assertEqual(30, alg_obj.task.nFES)
+        self.assertEqual('numpy', alg_obj.task.benchmark.Name)
+        self.assertIsNotNone(alg_obj.task.benchmark.cache_stats)
+        self.assertIsNotNone(alg_obj.task.benchmark.profile)
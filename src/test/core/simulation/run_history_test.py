@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+
+from src.core.simulation.run_history import RunHistory, makespan
+from src.model.algorithm_spec import AlgorithmSpec
+
+
+def _spec(name: str, n_fes: int = 1000) -> AlgorithmSpec:
+    return AlgorithmSpec(name=name, seed=1, np=10, n_fes=n_fes, evaluator='numpy', evaluator_kwargs={})
+
+
+class RunHistoryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, 'history.json')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_makespan(self):
+        self.assertEqual(11, makespan([1, 1, 1, 10], 2))
+        self.assertEqual(10, makespan([10, 1, 1, 1], 2))
+        self.assertEqual(12, makespan([1, 1, 10], 1))
+        self.assertEqual(0, makespan([], 4))
+
+    def test_order_longest_first(self):
+        history = RunHistory(self.path)
+        history.update('GeneticAlgorithm', 100, seconds=2.0, evaluations=1000)
+        history.update('ArtificialBeeColonyAlgorithm', 100, seconds=8.0, evaluations=1000)
+        history.update('ParticleSwarmAlgorithm', 100, seconds=1.0, evaluations=1000)
+        history.save()
+
+        history = RunHistory(self.path)
+        specs = [_spec('GeneticAlgorithm'), _spec('BatAlgorithm'), _spec('ParticleSwarmAlgorithm'),
+                 _spec('ArtificialBeeColonyAlgorithm')]
+        ordered = history.order(specs, 200)
+
+        # Algorithm without history is expected to take the average of the others.
+        self.assertEqual(['ArtificialBeeColonyAlgorithm', 'BatAlgorithm', 'GeneticAlgorithm', 'ParticleSwarmAlgorithm'],
+                         [spec.name for spec, _ in ordered])
+        self.assertAlmostEqual(16.0, ordered[0][1])
+
+    def test_update_moving_average(self):
+        history = RunHistory(self.path)
+        history.update('GeneticAlgorithm', 100, seconds=2.0, evaluations=1000)
+        history.update('GeneticAlgorithm', 100, seconds=4.0, evaluations=1000)
+
+        self.assertAlmostEqual(3.0, history.expected_time(_spec('GeneticAlgorithm'), 100))
+        self.assertIsNone(history.expected_time(_spec('BatAlgorithm'), 100))
+
+    def test_invalid_file_is_ignored(self):
+        with open(self.path, 'w') as file:
+            file.write('not json')
+
+        self.assertIsNone(RunHistory(self.path).expected_time(_spec('GeneticAlgorithm'), 100))
@@ -0,0 +1,44 @@
+import unittest
+
+from src.core.simulation.run_statistics import aggregate_results, has_repeats
+from src.model.simulation_result import OptimizationResult
+from src.model.simulation_run_info import SimulationRunInfo
+
+
+def _run_info(title: str, fitness: int, time: float, seed: int, has_error: bool = False) -> SimulationRunInfo:
+    return SimulationRunInfo(completed=not has_error, has_error=has_error, error_msg='', execution_time=time,
+                             result=OptimizationResult(algorithm_title=title, best_fitness=fitness, best_solution=[],
+                                                       np=5, n_fes=30), seed=seed)
+
+
+class RunStatisticsTest(unittest.TestCase):
+
+    def test_aggregate_results(self):
+        results = [_run_info('GA', 10, 1.0, 1), _run_info('PSO', 12, 3.0, 2), _run_info('GA', 14, 2.0, 3),
+                   _run_info('GA', 0, -1, 4, has_error=True), _run_info('GA', 30, 6.0, 5)]
+
+        ga, pso = aggregate_results(results)
+
+        self.assertEqual('GA', ga.algorithm_title)
+        self.assertEqual(4, ga.runs)
+        self.assertEqual(1, ga.failed)
+        self.assertAlmostEqual(18.0, ga.fitness_mean)
+        self.assertAlmostEqual(14.0, ga.fitness_median)
+        self.assertAlmostEqual(10.583005, ga.fitness_std, places=5)
+        self.assertAlmostEqual(3.0, ga.time_mean)
+        self.assertEqual(1, ga.best_run.seed)
+
+        self.assertEqual(1, pso.runs)
+        self.assertAlmostEqual(12.0, pso.fitness_mean)
+        self.assertEqual(0.0, pso.fitness_std)
+
+    def test_aggregate_results_all_failed(self):
+        stats, = aggregate_results([_run_info('GA', 0, -1, 1, has_error=True)])
+
+        self.assertEqual(1, stats.failed)
+        self.assertIsNone(stats.best_run)
+        self.assertEqual(0.0, stats.fitness_mean)
+
+    def test_has_repeats(self):
+        self.assertFalse(has_repeats([_run_info('GA', 10, 1.0, 1), _run_info('PSO', 12, 3.0, 2)]))
+        self.assertTrue(has_repeats([_run_info('GA', 10, 1.0, 1), _run_info('GA', 12, 3.0, 2)]))
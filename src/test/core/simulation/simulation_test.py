@@ -1,10 +1,15 @@
+import os
+import tempfile
 import unittest
+from unittest import mock
 
+from src.core.benchmark.benchmark_errors import InvalidEvaluatorOptions
 from src.core.simulation.simulation_errors import InvalidAlgorithmName, InvalidSaveOptionName, \
     InvalidSimulationInitialState
 from src.domain.package import Package
 from src.model.dataset import Dataset
 from src.core.simulation.simulation import Simulation
+from src.dataset.shared.shared_dataset import SharedDataset, attach
 from src.model.output_opt_config import OutputOptionConfig
 from src.model.sort_attribute import SortAttribute
 
@@ -247,3 +252,174 @@ class SimulationTest(unittest.TestCase):
             self.fail("Simulation started with no algorithms")
         except InvalidSimulationInitialState:
             pass
+
+    def test_simulation_should_not_start_with_invalid_executor(self):
+        try:
+            dataset = Dataset('name', 5, 3, 3, 3,
+                              [Package(id_num=1, station_in=1, station_out=2, weight=30),
+                               Package(id_num=2, station_in=2, station_out=3, weight=30),
+                               Package(id_num=3, station_in=1, station_out=3, weight=30),
+                               Package(id_num=4, station_in=2, station_out=3, weight=30),
+                               Package(id_num=5, station_in=1, station_out=2, weight=30)
+                               ])
+
+            simulation = Simulation(dataset=dataset, n_fes=30, np=5, save_to_dir=tempfile.gettempdir(),
+                                    executor='cluster')
+            simulation.add_algorithm('GreyWolfOptimizer')
+            simulation.add_save_option(OutputOptionConfig(class_name='ConsoleOutputOption', included_kwargs=[]))
+            simulation.run(sort_by_best=SortAttribute.fitness)
+            self.fail("Simulation started with invalid executor")
+        except InvalidSimulationInitialState:
+            pass
+
+    def test_simulation_run_in_worker_processes(self):
+        dataset = Dataset('name', 5, 3, 3, 3,
+                          [Package(id_num=1, station_in=1, station_out=2, weight=30),
+                           Package(id_num=2, station_in=2, station_out=3, weight=30),
+                           Package(id_num=3, station_in=1, station_out=3, weight=30),
+                           Package(id_num=4, station_in=2, station_out=3, weight=30),
+                           Package(id_num=5, station_in=1, station_out=2, weight=30)
+                           ])
+
+        saved = []
+        simulation = Simulation(dataset=dataset, n_fes=30, np=5, save_to_dir=tempfile.gettempdir(),
+                                executor='process', workers=2)
+        simulation.add_algorithm('ParticleSwarmAlgorithm')
+        simulation.add_algorithm('GeneticAlgorithm')
+        simulation.add_save_option(OutputOptionConfig(class_name='ConsoleOutputOption', included_kwargs=[]))
+        simulation._save_options[0].save = saved.extend
+        simulation.run(sort_by_best=SortAttribute.fitness)
+
+        self.assertEqual(2, len(saved))
+        self.assertTrue(all(info.is_completed and not info.has_error for info in saved))
+        self.assertEqual({'ParticleSwarmAlgorithm', 'GeneticAlgorithm'},
+                         {info.result.algorithm_title for info in saved})
+
+    def test_simulation_run_with_eval_workers_removes_shared_dataset(self):
+        dataset = Dataset('name', 5, 3, 3, 3,
+                          [Package(id_num=1, station_in=1, station_out=2, weight=30),
+                           Package(id_num=2, station_in=2, station_out=3, weight=30),
+                           Package(id_num=3, station_in=1, station_out=3, weight=30),
+                           Package(id_num=4, station_in=2, station_out=3, weight=30),
+                           Package(id_num=5, station_in=1, station_out=2, weight=30)
+                           ])
+
+        saved = []
+        simulation = Simulation(dataset=dataset, n_fes=30, np=5, save_to_dir=tempfile.gettempdir(), eval_workers=2)
+        simulation.add_algorithm('ParticleSwarmAlgorithm')
+        simulation.add_save_option(OutputOptionConfig(class_name='ConsoleOutputOption', included_kwargs=[]))
+        simulation._save_options[0].save = saved.extend
+
+        with mock.patch.object(SharedDataset, 'close', autospec=True, side_effect=SharedDataset.close) as close:
+            simulation.run(sort_by_best=SortAttribute.fitness)
+
+        self.assertEqual(1, len(saved))
+        self.assertFalse(saved[0].has_error, saved[0].error_msg)
+        self.assertEqual(1, close.call_count)
+        self.assertRaises(FileNotFoundError, attach, close.call_args[0][0].descriptor)
+
+    def test_simulation_eval_workers_not_with_process_executor_or_early_abort(self):
+        dataset = Dataset('name', 2, 3, 3, 3, [Package(id_num=1, station_in=1, station_out=2, weight=30),
+                                               Package(id_num=2, station_in=2, station_out=3, weight=30)])
+
+        for kwargs in [dict(executor='process'), dict(executor='thread', early_abort=True)]:
+            simulation = Simulation(dataset=dataset, n_fes=30, np=5, save_to_dir=tempfile.gettempdir(),
+                                    eval_workers=2, **kwargs)
+            simulation.add_algorithm('ParticleSwarmAlgorithm')
+            simulation.add_save_option(OutputOptionConfig(class_name='ConsoleOutputOption', included_kwargs=[]))
+
+            self.assertRaises(InvalidSimulationInitialState, simulation.run, SortAttribute.fitness)
+
+    def test_simulation_should_not_start_with_invalid_job_timeout(self):
+        dataset = Dataset('name', 2, 3, 3, 3, [Package(id_num=1, station_in=1, station_out=2, weight=30),
+                                               Package(id_num=2, station_in=2, station_out=3, weight=30)])
+
+        for kwargs in [dict(job_timeout=0), dict(heartbeat_timeout=-1.0), dict(idle_timeout=0)]:
+            simulation = Simulation(dataset=dataset, n_fes=30, np=5, save_to_dir=tempfile.gettempdir(),
+                                    executor='distributed', **kwargs)
+            simulation.add_algorithm('ParticleSwarmAlgorithm')
+            simulation.add_save_option(OutputOptionConfig(class_name='ConsoleOutputOption', included_kwargs=[]))
+
+            self.assertRaises(InvalidSimulationInitialState, simulation.run, SortAttribute.fitness)
+
+    def test_simulation_rejects_options_of_other_evaluator(self):
+        dataset = Dataset('name', 2, 3, 3, 3, [Package(id_num=1, station_in=1, station_out=2, weight=30),
+                                               Package(id_num=2, station_in=2, station_out=3, weight=30)])
+
+        for options in [{'max_bytes': 1024}, {'cache_size': 10}, {'early_abort': True}]:
+            self.assertRaises(InvalidEvaluatorOptions, Simulation, dataset=dataset, n_fes=30, np=5,
+                              save_to_dir=tempfile.gettempdir(), evaluator='numpy', evaluator_options=options)
+
+    def test_simulation_saves_results_when_history_can_not_be_written(self):
+        dataset = Dataset('name', 2, 3, 3, 3, [Package(id_num=1, station_in=1, station_out=2, weight=30),
+                                               Package(id_num=2, station_in=2, station_out=3, weight=30)])
+
+        saved = []
+        with tempfile.TemporaryDirectory() as dir_path:
+            simulation = Simulation(dataset=dataset, n_fes=30, np=5, save_to_dir=dir_path,
+                                    history_path=os.path.join(dir_path, 'missing', 'history.json'))
+            simulation.add_algorithm('ParticleSwarmAlgorithm')
+            simulation.add_save_option(OutputOptionConfig(class_name='ConsoleOutputOption', included_kwargs=[]))
+            simulation._save_options[0].save = saved.extend
+            simulation.run(sort_by_best=SortAttribute.fitness)
+
+        self.assertEqual(1, len(saved))
+        self.assertFalse(saved[0].has_error, saved[0].error_msg)
+
+    def test_simulation_streams_results(self):
+        dataset = Dataset('name', 5, 3, 3, 3,
+                          [Package(id_num=1, station_in=1, station_out=2, weight=30),
+                           Package(id_num=2, station_in=2, station_out=3, weight=30),
+                           Package(id_num=3, station_in=1, station_out=3, weight=30),
+                           Package(id_num=4, station_in=2, station_out=3, weight=30),
+                           Package(id_num=5, station_in=1, station_out=2, weight=30)
+                           ])
+
+        streamed, saved = [], []
+        simulation = Simulation(dataset=dataset, n_fes=30, np=5, save_to_dir=tempfile.gettempdir(), repeats=2)
+        simulation.add_algorithm('ParticleSwarmAlgorithm')
+        simulation.add_algorithm('GeneticAlgorithm')
+        simulation.add_save_option(OutputOptionConfig(class_name='ConsoleOutputOption', included_kwargs=[]))
+        simulation.add_save_option(OutputOptionConfig(class_name='ConsoleOutputOption', included_kwargs=[]))
+        simulation._save_options[0].on_result = streamed.append
+        simulation._save_options[1].on_result = mock.Mock(side_effect=ValueError('failed'))
+        simulation._save_options[1].save = saved.extend
+        simulation.run(sort_by_best=SortAttribute.fitness)
+
+        self.assertEqual(4, len(streamed))
+        self.assertEqual(4, simulation._save_options[1].on_result.call_count)
+        self.assertEqual(sorted(id(info) for info in streamed), sorted(id(info) for info in saved))
+
+    def test_simulation_repeats_seeded(self):
+        dataset = Dataset('name', 30, 5, 5, 5, [])
+        seeds = []
+
+        for i in range(2):
+            simulation = Simulation(dataset=dataset, n_fes=30, np=5, save_to_dir='/notNeeded', repeats=3, seed=42)
+            simulation.add_algorithm('GreyWolfOptimizer')
+            simulation.add_algorithm('GeneticAlgorithm')
+            seeds.append([spec.seed for spec in simulation._algorithms])
+
+            self.assertEqual(['GreyWolfOptimizer', 'GeneticAlgorithm'], simulation.algorithms())
+            self.assertEqual([0, 1, 2, 0, 1, 2], [spec.repeat for spec in simulation._algorithms])
+
+        self.assertEqual(seeds[0], seeds[1])
+        self.assertEqual(6, len(set(seeds[0])))
+
+    def test_simulation_should_not_start_with_invalid_repeats(self):
+        try:
+            dataset = Dataset('name', 5, 3, 3, 3,
+                              [Package(id_num=1, station_in=1, station_out=2, weight=30),
+                               Package(id_num=2, station_in=2, station_out=3, weight=30),
+                               Package(id_num=3, station_in=1, station_out=3, weight=30),
+                               Package(id_num=4, station_in=2, station_out=3, weight=30),
+                               Package(id_num=5, station_in=1, station_out=2, weight=30)
+                               ])
+
+            simulation = Simulation(dataset=dataset, n_fes=30, np=5, save_to_dir=tempfile.gettempdir(), repeats=0)
+            simulation.add_algorithm('GreyWolfOptimizer')
+            simulation.add_save_option(OutputOptionConfig(class_name='ConsoleOutputOption', included_kwargs=[]))
+            simulation.run(sort_by_best=SortAttribute.fitness)
+            self.fail("Simulation started with invalid repeats")
+        except InvalidSimulationInitialState:
+            pass
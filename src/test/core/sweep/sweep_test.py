@@ -0,0 +1,114 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.core.benchmark.benchmark_errors import InvalidEvaluatorOptions
+from src.core.simulation.simulation_errors import InvalidAlgorithmName
+from src.core.sweep.sweep import Sweep
+from src.core.sweep.sweep_errors import InvalidSweepConfig
+from src.core.sweep.sweep_journal import SweepJournal
+from src.model.simulation_result import OptimizationResult
+from src.model.simulation_run_info import SimulationRunInfo
+from src.model.sweep_job import SweepJob
+
+DATASET_PATH = '../../resource/testSet.csv'
+
+
+class SweepTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.journal_path = os.path.join(self.dir.name, 'sweep.jsonl')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def _sweep(self, algorithms: list = None, seed: int = 5, dataset_path: str = DATASET_PATH,
+               evaluator: str = 'numpy') -> Sweep:
+        return Sweep(datasets=[dataset_path], algorithms=algorithms or ['GeneticAlgorithm', 'ParticleSwarmAlgorithm'],
+                     n_fes_values=[20], np_values=[5], journal_path=self.journal_path, repeats=2, seed=seed,
+                     evaluator=evaluator, workers=2)
+
+    def test_job_seeds_do_not_depend_on_grid(self):
+        seeds = {job.key: job.seed for job in self._sweep().jobs()}
+        other = {job.key: job.seed for job in self._sweep(algorithms=['ParticleSwarmAlgorithm']).jobs()}
+
+        self.assertEqual(4, len(set(seeds.values())))
+        self.assertTrue(all(seeds[key] == seed for key, seed in other.items()))
+
+    def test_run_resumes_from_journal(self):
+        results = self._sweep().run()
+
+        self.assertEqual(4, len(results))
+        self.assertTrue(all(not run_info.has_error for _, run_info in results))
+
+        with open(self.journal_path) as file:
+            lines = file.readlines()
+
+        # Drop one record and cut another one short, as a crash would.
+        with open(self.journal_path, 'w') as file:
+            file.writelines(lines[:2])
+            file.write(lines[3][:25])
+
+        resumed = self._sweep(seed=None).run()
+
+        # Two records were kept, only the two missing jobs ran again.
+        self.assertEqual(4, len(SweepJournal(self.journal_path).records()))
+        self.assertEqual([(job.key, run_info.result.best_fitness) for job, run_info in results],
+                         [(job.key, run_info.result.best_fitness) for job, run_info in resumed])
+
+        summary_path = os.path.join(self.dir.name, 'summary.csv')
+        Sweep.write_summary(summary_path, resumed)
+
+        with open(summary_path) as file:
+            self.assertEqual(3, len(file.readlines()))
+
+    def test_journal_seed_mismatch(self):
+        journal = SweepJournal(self.journal_path)
+        journal.append(1, SweepJob(DATASET_PATH, 'GeneticAlgorithm', 20, 5, 0, 7), SimulationRunInfo(
+            completed=True, has_error=False, error_msg='', execution_time=1.0,
+            result=OptimizationResult(algorithm_title='GeneticAlgorithm', best_fitness=10, best_solution=[0.5],
+                                      np=5, n_fes=20)))
+
+        with self.assertRaises(InvalidSweepConfig):
+            self._sweep(seed=2)
+
+    def test_journal_settings_mismatch(self):
+        self._sweep(algorithms=['GeneticAlgorithm']).run()
+
+        with self.assertRaises(InvalidSweepConfig):
+            self._sweep(algorithms=['GeneticAlgorithm'], seed=None, evaluator='reference')
+
+    def test_changed_dataset_is_not_resumed(self):
+        dataset_path = os.path.join(self.dir.name, 'dataset.csv')
+        shutil.copyfile(DATASET_PATH, dataset_path)
+        self._sweep(algorithms=['GeneticAlgorithm'], dataset_path=dataset_path).run()
+
+        with open(dataset_path) as file:
+            lines = file.readlines()
+
+        lines[2] = '1,1,3,84\n'
+
+        with open(dataset_path, 'w') as file:
+            file.writelines(lines)
+
+        with self.assertRaises(InvalidSweepConfig):
+            self._sweep(algorithms=['GeneticAlgorithm'], seed=None, dataset_path=dataset_path).run()
+
+    def test_invalid_config(self):
+        with self.assertRaises(InvalidSweepConfig):
+            Sweep(datasets=[], algorithms=['GeneticAlgorithm'], n_fes_values=[20], np_values=[5],
+                  journal_path=self.journal_path)
+
+        with self.assertRaises(InvalidAlgorithmName):
+            self._sweep(algorithms=['invalidName'])
+
+        with self.assertRaises(InvalidEvaluatorOptions):
+            Sweep(datasets=[DATASET_PATH], algorithms=['GeneticAlgorithm'], n_fes_values=[20], np_values=[5],
+                  journal_path=self.journal_path, evaluator='numpy', evaluator_kwargs={'max_bytes': 1024})
+
+        # Arguments shared by all evaluators come from their own config entries and are accepted.
+        Sweep(datasets=[DATASET_PATH], algorithms=['GeneticAlgorithm'], n_fes_values=[20], np_values=[5],
+              journal_path=self.journal_path, evaluator='numpy',
+              evaluator_kwargs={'cache_size': 4, 'early_abort': True})
@@ -0,0 +1,48 @@
+import pickle
+import unittest
+from multiprocessing import Pool
+
+from src.dataset.reader.csv_reader import CSVDatasetReader
+from src.dataset.shared.shared_dataset import SharedDataset, attach
+
+
+def total_weight(dataset) -> int:
+    return int(dataset.weight.sum())
+
+
+class SharedDatasetTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset = CSVDatasetReader().read('../../resource/testSet.csv')
+
+    def test_attach(self):
+        with SharedDataset(self.dataset) as shared:
+            attached = attach(shared.descriptor)
+
+            self.assertEqual(self.dataset.content_hash(), attached.content_hash())
+            self.assertEqual(self.dataset.packages[3].weight, attached.packages[3].weight)
+            self.assertFalse(attached.weight.flags.writeable)
+            self.assertFalse(attached.weight.flags.owndata)
+
+    def test_published_dataset_is_pickled_as_descriptor(self):
+        with SharedDataset(self.dataset) as shared:
+            data = pickle.dumps(shared.dataset)
+            copy = pickle.loads(data)
+
+            self.assertLess(len(data), len(pickle.dumps(self.dataset)))
+            self.assertEqual(self.dataset.content_hash(), copy.content_hash())
+            self.assertEqual(self.dataset.content_hash(), shared.dataset.content_hash())
+
+    def test_worker_processes_attach(self):
+        with SharedDataset(self.dataset) as shared:
+            with Pool(processes=2) as pool:
+                weights = pool.map(total_weight, [shared.dataset] * 4)
+
+        self.assertEqual([total_weight(self.dataset)] * 4, weights)
+
+    def test_close_removes_block(self):
+        shared = SharedDataset(self.dataset)
+        shared.close()
+        shared.close()
+
+        self.assertRaises(FileNotFoundError, attach, shared.descriptor)
@@ -0,0 +1,34 @@
+import unittest
+
+import numpy as np
+
+from src.domain.cargo_space import CargoSpace
+from src.domain.package import Package
+
+
+class CargoSpaceTest(unittest.TestCase):
+
+    def test_unload_visits_only_columns_with_departures(self):
+        cargo_space = CargoSpace(width=4, height=3)
+        packages = [Package(1, 1, 2, 10, 0), Package(2, 1, 3, 10, 1), Package(3, 1, 2, 10, 2),
+                    Package(4, 1, 3, 10, 3)]
+        col_assignment = np.array([0, 0, 2, 3])
+
+        cargo_space.simulate_stop_at_station(1, packages, col_assignment)
+        visited = []
+        for column in cargo_space.columns:
+            column.unload_at_station = wrap(column.unload_at_station, visited, column)
+
+        summary = cargo_space.simulate_stop_at_station(2, [], col_assignment)
+
+        self.assertEqual([cargo_space.columns[0], cargo_space.columns[2]], visited)
+        self.assertEqual(4, summary.movements_sum)
+        self.assertEqual([1, 0, 0, 1], summary.lay_dist)
+        self.assertEqual([10, 0, 0, 10], summary.weight_dist)
+
+
+def wrap(unload_at_station, visited: list, column):
+    def unload(station_index: int) -> tuple:
+        visited.append(column)
+        return unload_at_station(station_index)
+    return unload
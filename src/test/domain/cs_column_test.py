@@ -0,0 +1,60 @@
+import unittest
+from collections import defaultdict
+
+from src.domain.cs_column import Column
+from src.domain.package import Package
+
+
+class ColumnTest(unittest.TestCase):
+
+    def test_departures_tracked_on_add_and_pop(self):
+        column = make_column([3, 5, 3])
+
+        self.assertEqual(3, column.earliest_out)
+        self.assertTrue(column.has_departures(5))
+        self.assertFalse(column.has_departures(4))
+
+        column.pop()
+        self.assertEqual(3, column.earliest_out)
+        column.pop()
+        self.assertFalse(column.has_departures(5))
+        column.pop()
+        self.assertIsNone(column.earliest_out)
+
+    def test_unload_without_departures(self):
+        column = make_column([4, 5])
+
+        self.assertEqual(([], 0), column.unload_at_station(3))
+        self.assertEqual(2, column.count())
+        self.assertEqual(20, column.sum_weight)
+
+    def test_unload_moves_packages_above_first_departure(self):
+        column = make_column([5, 3, 4, 3, 6])
+        wait_que, movements = column.unload_at_station(3)
+
+        self.assertEqual(4, movements)
+        self.assertEqual([3, 5], [package.id for package in wait_que])
+        self.assertEqual(1, column.count())
+        self.assertEqual(10, column.sum_weight)
+        self.assertEqual(5, column.earliest_out)
+        self.assertFalse(column.has_departures(3))
+        self.assertFalse(column.has_departures(4))
+
+    def test_add_fills_shared_departures(self):
+        departures = defaultdict(set)
+        first, second = Column(3, departures, 0), Column(3, departures, 1)
+
+        first.add(Package(1, 1, 3, 10))
+        second.add(Package(2, 1, 3, 10))
+        second.add(Package(3, 1, 4, 10))
+
+        self.assertEqual({3: {0, 1}, 4: {1}}, dict(departures))
+
+
+def make_column(stations_out: list) -> Column:
+    column = Column(len(stations_out))
+
+    for index, station_out in enumerate(stations_out):
+        column.add(Package(index + 1, 1, station_out, 10))
+
+    return column
@@ -0,0 +1,61 @@
+import unittest
+
+import numpy as np
+
+from src.domain.package import Package
+from src.model.dataset import Dataset
+
+
+class DatasetTest(unittest.TestCase):
+
+    def setUp(self):
+        self.packages = [Package(id_num=1, station_in=1, station_out=3, weight=10),
+                         Package(id_num=2, station_in=2, station_out=3, weight=20),
+                         Package(id_num=3, station_in=1, station_out=2, weight=30)]
+
+    def test_columns(self):
+        dataset = Dataset('name', 3, 3, 2, 2, self.packages)
+
+        self.assertEqual([1, 2, 3], dataset.ids.tolist())
+        self.assertEqual([1, 2, 1], dataset.station_in.tolist())
+        self.assertEqual([3, 3, 2], dataset.station_out.tolist())
+        self.assertEqual([10, 20, 30], dataset.weight.tolist())
+
+    def test_columns_read_only(self):
+        dataset = Dataset('name', 3, 3, 2, 2, self.packages)
+
+        self.assertRaises(ValueError, lambda: dataset.weight.__setitem__(0, 1))
+
+    def test_package_sequence(self):
+        dataset = Dataset('name', 3, 3, 2, 2, self.packages)
+
+        self.assertEqual(3, len(dataset.packages))
+        self.assertEqual(2, dataset.packages[1].id)
+        self.assertEqual(30, dataset.packages[-1].weight)
+        self.assertEqual([1, 2], [package.id for package in dataset.packages[:2]])
+        self.assertEqual([3, 3, 2], [package.station_out for package in dataset.packages])
+
+    def test_from_columns(self):
+        dataset = Dataset.from_columns('name', 2, 3, 2, 2, ids=np.array([5, 6]), station_in=np.array([1, 2]),
+                                       station_out=np.array([2, 3]), weight=np.array([7, 8]))
+
+        self.assertEqual([(5, 1, 2, 7), (6, 2, 3, 8)],
+                         [(package.id, package.station_in, package.station_out, package.weight)
+                          for package in dataset.packages])
+        self.assertEqual(0, len(Dataset('name', 0, 3, 2, 2, []).packages))
+
+    def test_dict_round_trip(self):
+        dataset = Dataset('name', 3, 3, 2, 2, self.packages)
+        copy = Dataset.from_dict(dataset.to_dict())
+
+        self.assertEqual(dataset.content_hash(), copy.content_hash())
+        self.assertEqual([10, 20, 30], copy.weight.tolist())
+        self.assertEqual('name', copy.title)
+
+    def test_content_hash_depends_on_content(self):
+        dataset = Dataset('name', 3, 3, 2, 2, self.packages)
+        changed = Dataset('name', 3, 3, 2, 2, self.packages[:2] + [Package(id_num=3, station_in=1, station_out=2,
+                                                                            weight=31)])
+
+        self.assertEqual(dataset.content_hash(), Dataset('name', 3, 3, 2, 2, self.packages).content_hash())
+        self.assertNotEqual(dataset.content_hash(), changed.content_hash())
@@ -0,0 +1,32 @@
+import json
+import unittest
+
+import numpy as np
+
+from src.model.cache_stats import CacheStats
+from src.model.evaluation_profile import EvaluationProfile
+from src.model.simulation_result import OptimizationResult
+from src.model.simulation_run_info import SimulationRunInfo
+
+
+class SimulationRunInfoTest(unittest.TestCase):
+
+    def test_dict_round_trip(self):
+        run_info = SimulationRunInfo(
+            completed=True, has_error=False, error_msg='', execution_time=1.5,
+            result=OptimizationResult(algorithm_title='GA', best_fitness=np.float64(10), best_solution=np.array([0.5]),
+                                      np=5, n_fes=30),
+            cache_stats=CacheStats(size=10, hits=1, misses=2, evictions=0, canonical=True), evaluator='numpy',
+            profile=EvaluationProfile(evaluations=3, evaluation_time=0.1, stage_times={'decode': 0.01}, movements=7,
+                                      reloads=1),
+            seed=42, repeat=2)
+
+        restored = SimulationRunInfo.from_dict(json.loads(json.dumps(run_info.to_dict())))
+
+        self.assertEqual('GA', restored.result.algorithm_title)
+        self.assertEqual(10, restored.result.best_fitness)
+        self.assertEqual([0.5], restored.result.best_solution)
+        self.assertEqual(1, restored.cache_stats.hits)
+        self.assertIsNone(restored.prefix_stats)
+        self.assertEqual({'decode': 0.01}, restored.profile.stage_times)
+        self.assertEqual((42, 2), (restored.seed, restored.repeat))
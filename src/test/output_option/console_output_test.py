@@ -0,0 +1,32 @@
+import contextlib
+import io
+import unittest
+
+from src.model.simulation_result import OptimizationResult
+from src.model.simulation_run_info import SimulationRunInfo
+from src.output_option.console_output import ConsoleOutputOption
+
+
+def run_info(title: str, fitness: int) -> SimulationRunInfo:
+    return SimulationRunInfo(completed=True, has_error=False, error_msg='', execution_time=0.5,
+                             result=OptimizationResult(algorithm_title=title, best_fitness=fitness, best_solution=[],
+                                                       np=5, n_fes=30))
+
+
+class ConsoleOutputOptionTest(unittest.TestCase):
+
+    def test_each_run_printed_in_full_once(self):
+        output, results = ConsoleOutputOption(), [run_info('BatAlgorithm', 10), run_info('GeneticAlgorithm', 20)]
+        printed = io.StringIO()
+
+        with contextlib.redirect_stdout(printed):
+            for result in reversed(results):
+                output.on_result(result)
+            output.save(results)
+
+        lines = printed.getvalue().splitlines()
+
+        self.assertEqual(['finished GeneticAlgorithm: fitness 20, 0.5 ms', 'finished BatAlgorithm: fitness 10, 0.5 ms'],
+                         lines[:2])
+        self.assertEqual(1, lines.count('Title: BatAlgorithm'))
+        self.assertEqual(1, lines.count('Fitness: 10'))
@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+
+from src.domain.package import Package
+from src.model.dataset import Dataset
+from src.model.simulation_result import OptimizationResult
+from src.model.simulation_run_info import SimulationRunInfo
+from src.output_option.txt_output import TextOutputOption
+
+
+def run_info(title: str, fitness: int) -> SimulationRunInfo:
+    return SimulationRunInfo(completed=True, has_error=False, error_msg='', execution_time=0.5,
+                             result=OptimizationResult(algorithm_title=title, best_fitness=fitness, best_solution=[],
+                                                       np=5, n_fes=30))
+
+
+class TextOutputOptionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.dataset = Dataset('name', 1, 2, 1, 1, [Package(id_num=1, station_in=1, station_out=2, weight=30)])
+        self.output = TextOutputOption(dir_path=self.dir.name, dataset=self.dataset)
+        self.partial_path = os.path.join(self.dir.name, 'results_partial.txt')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_results_appended_as_they_finish(self):
+        self.output.on_result(run_info('GeneticAlgorithm', 20))
+        self.output.on_result(run_info('BatAlgorithm', 10))
+
+        with open(self.partial_path) as file:
+            content = file.read()
+
+        self.assertEqual(1, content.count('----Dataset info----'))
+        self.assertLess(content.index('GeneticAlgorithm'), content.index('BatAlgorithm'))
+
+    def test_save_replaces_partial_results(self):
+        results = [run_info('BatAlgorithm', 10), run_info('GeneticAlgorithm', 20)]
+
+        for result in reversed(results):
+            self.output.on_result(result)
+        self.output.save(results)
+
+        with open(os.path.join(self.dir.name, 'results.txt')) as file:
+            content = file.read()
+
+        self.assertFalse(os.path.isfile(self.partial_path))
+        self.assertIn('Algorithms: 2', content)
+        self.assertLess(content.index('BatAlgorithm'), content.index('GeneticAlgorithm'))
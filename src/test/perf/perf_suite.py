@@ -0,0 +1,217 @@
+"""Micro-benchmarks of fitness evaluation hot path.
+
+Run from project root:
+    python -m src.test.perf.perf_suite --output perf.json --baseline src/test/perf/baseline.json
+
+Results are written as JSON and compared against baseline, exit code is 1 if any metric regressed by more than
+tolerance. Use --save-baseline to store results as new baseline.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+
+from src.core.benchmark.dataset_index import DatasetIndex
+from src.core.benchmark.evaluator_registry import evaluator_names, create_evaluator
+from src.dataset.generator.base_generator import BaseDatasetGenerator
+from src.dataset.reader.csv_reader import CSVDatasetReader
+from src.dataset.writer.csv_writer import CSVDatasetWriter
+from src.domain.cargo_space import CargoSpace
+from src.model.dataset import Dataset
+
+# Generated dataset sizes: name, packages, stations, cargo space dimension.
+SIZES = [
+    ('small', 225, 5, 10),
+    ('medium', 900, 20, 12),
+    ('large', 1800, 20, 18),
+    ('xlarge', 3000, 40, 18)
+]
+
+DEFAULT_TOLERANCE = 0.2
+
+
+def make_dataset(name: str, pack_c: int, stat_n: int, cargo_dim: int) -> Dataset:
+    """Generates dataset, same size always gives same dataset.
+
+    Args:
+        name: Dataset title.
+        pack_c: Total number of packages.
+        stat_n: Total number of stations.
+        cargo_dim: Cargo stowage space width and height.
+
+    Returns: Generated dataset.
+    """
+
+    random.seed(pack_c * 1000 + stat_n * 10 + cargo_dim)
+    return BaseDatasetGenerator().make(name, pack_c, stat_n, cargo_dim)
+
+
+def time_evaluator(dataset: Dataset, name: str, repeat: int) -> float:
+    """Measures fitness evaluations per second.
+
+    Args:
+        dataset: Dataset to evaluate solutions on.
+        name: Evaluator name.
+        repeat: Number of timed rounds, best one is used.
+
+    Returns: Evaluations per second.
+    """
+
+    evaluate = create_evaluator(name, dataset).function()
+    rng = np.random.default_rng(0)
+
+    # First evaluation may compile kernels, every round gets new solutions so evaluator caches do not help.
+    evaluate(dataset.total_packages, rng.random(dataset.total_packages))
+    rounds = [rng.random((20, dataset.total_packages)) for _ in range(repeat)]
+    seconds = min(timeit.timeit(lambda: [evaluate(dataset.total_packages, sol) for sol in solutions], number=1)
+                  for solutions in rounds)
+
+    return len(rounds[0]) / seconds
+
+
+def time_stop_at_station(dataset: Dataset, repeat: int) -> float:
+    """Measures average time of CargoSpace.simulate_stop_at_station over whole route.
+
+    Args:
+        dataset: Dataset to simulate.
+        repeat: Number of timed rounds, best one is used.
+
+    Returns: Microseconds per call.
+    """
+
+    index = DatasetIndex(dataset)
+    col_assignment = index.decode(np.random.default_rng(0).random(len(index.ids)))
+    packages_by_station = [[dataset.packages[i] for i in index.packages_at_station(station)]
+                           for station in range(1, dataset.total_stations + 1)]
+
+    def simulate_route():
+        cargo_space = CargoSpace(width=dataset.width, height=dataset.height)
+        for station in range(1, dataset.total_stations + 1):
+            cargo_space.simulate_stop_at_station(station, packages_by_station[station - 1], col_assignment)
+
+    seconds = min(timeit.repeat(simulate_route, number=1, repeat=repeat))
+
+    return seconds / dataset.total_stations * 1e6
+
+
+def time_csv_read(dataset: Dataset, repeat: int) -> float:
+    """Measures CSVDatasetReader.read of dataset written to temporary file.
+
+    Args:
+        dataset: Dataset to write and read.
+        repeat: Number of timed rounds, best one is used.
+
+    Returns: Milliseconds per read.
+    """
+
+    with tempfile.TemporaryDirectory() as dir_path:
+        CSVDatasetWriter().write(dir_path=dir_path, file_name=dataset.title, dataset=dataset)
+        path = os.path.join(dir_path, dataset.title + '.csv')
+        reader = CSVDatasetReader()
+        seconds = min(timeit.repeat(lambda: reader.read(path), number=1, repeat=repeat))
+
+    return seconds * 1e3
+
+
+def run_suite(sizes: list, repeat: int = 5, evaluators: list = None) -> dict:
+    """Runs all micro-benchmarks.
+
+    Args:
+        sizes: Dataset sizes, see SIZES.
+        repeat: Number of timed rounds per benchmark.
+        evaluators: Names of timed evaluators, all registered if None.
+
+    Returns: Metrics by name, each with value, unit and whether higher value is better.
+    """
+
+    results = {}
+
+    for name, pack_c, stat_n, cargo_dim in sizes:
+        dataset = make_dataset(name, pack_c, stat_n, cargo_dim)
+
+        for evaluator in evaluators or evaluator_names():
+            results['evaluate.{0}.{1}'.format(evaluator, name)] = {
+                'value': time_evaluator(dataset, evaluator, repeat), 'unit': 'eval/s', 'higher_is_better': True}
+
+        results['stop_at_station.{0}'.format(name)] = {
+            'value': time_stop_at_station(dataset, repeat), 'unit': 'us', 'higher_is_better': False}
+        results['csv_read.{0}'.format(name)] = {
+            'value': time_csv_read(dataset, repeat), 'unit': 'ms', 'higher_is_better': False}
+
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Compares results with baseline. Metrics missing in either of them are skipped.
+
+    Args:
+        results: Current metrics, see run_suite.
+        baseline: Baseline metrics, see run_suite.
+        tolerance: Allowed relative slowdown, 0.2 allows metric to be 20% worse than baseline.
+
+    Returns: Regressions as tuples of metric name, baseline value, current value and relative change.
+    """
+
+    regressions = []
+
+    for name in sorted(set(results) & set(baseline)):
+        current, expected = results[name]['value'], baseline[name]['value']
+
+        if expected == 0:
+            continue
+
+        # Relative change, positive when metric got worse.
+        change = (expected - current) / expected if results[name]['higher_is_better'] else \
+            (current - expected) / expected
+
+        if change > tolerance:
+            regressions.append((name, expected, current, change))
+
+    return regressions
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description='Fitness evaluation micro-benchmarks.')
+    parser.add_argument('--output', help='Path of JSON file to write results to.')
+    parser.add_argument('--baseline', help='Path of baseline JSON file to compare results with.')
+    parser.add_argument('--save-baseline', action='store_true', help='Write results to baseline file.')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='Allowed relative slowdown (default {0}).'.format(DEFAULT_TOLERANCE))
+    parser.add_argument('--sizes', nargs='+', choices=[size[0] for size in SIZES],
+                        default=[size[0] for size in SIZES], help='Dataset sizes to run.')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed rounds per benchmark.')
+    args = parser.parse_args(argv)
+
+    results = run_suite([size for size in SIZES if size[0] in args.sizes], args.repeat)
+
+    for name, metric in sorted(results.items()):
+        print('{0:<40} {1:>12.2f} {2}'.format(name, metric['value'], metric['unit']))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.baseline and args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    elif args.baseline and os.path.isfile(args.baseline):
+        with open(args.baseline, 'r') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+
+        for name, expected, current, change in regressions:
+            print('REGRESSION {0}: {1:.2f} -> {2:.2f} ({3:+.0%})'.format(name, expected, current, change))
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,34 @@
+import unittest
+
+from src.test.perf.perf_suite import compare, run_suite
+
+
+class PerfSuiteTest(unittest.TestCase):
+
+    def test_compare_within_tolerance(self):
+        baseline = {'evaluate': metric(100, True), 'read': metric(10, False)}
+        results = {'evaluate': metric(85, True), 'read': metric(11.5, False)}
+
+        self.assertEqual([], compare(results, baseline, 0.2))
+
+    def test_compare_regressions(self):
+        baseline = {'evaluate': metric(100, True), 'read': metric(10, False), 'faster': metric(10, False)}
+        results = {'evaluate': metric(50, True), 'read': metric(13, False), 'faster': metric(5, False)}
+        regressions = compare(results, baseline, 0.2)
+
+        self.assertEqual(['evaluate', 'read'], [regression[0] for regression in regressions])
+        self.assertAlmostEqual(0.5, regressions[0][3])
+        self.assertAlmostEqual(0.3, regressions[1][3])
+
+    def test_compare_skips_missing_metrics(self):
+        self.assertEqual([], compare({'new': metric(1, True)}, {'old': metric(100, True)}, 0.2))
+
+    def test_run_suite_metrics(self):
+        results = run_suite([('tiny', 225, 5, 10)], repeat=1, evaluators=['reference'])
+
+        self.assertEqual({'evaluate.reference.tiny', 'stop_at_station.tiny', 'csv_read.tiny'}, set(results))
+        self.assertTrue(all(result['value'] > 0 for result in results.values()))
+
+
+def metric(value: float, higher_is_better: bool) -> dict:
+    return {'value': value, 'unit': '', 'higher_is_better': higher_is_better}